@@ -4,11 +4,15 @@ Serves gaming recommendations, sentiment analysis, and DeFi predictions
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
+import gc
 import os
 import sys
+import time
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,6 +20,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lumeris_ml_backend.gaming_recommender import GamingRecommender
 from lumeris_ml_backend.sentiment_analyzer import SentimentAnalyzer
 from lumeris_ml_backend.defi_predictor import DeFiPredictor
+from lumeris_ml_backend.trending import TrendingTopicsEngine
+from lumeris_ml_backend.sentiment_aggregates import SentimentAggregateStore
+from lumeris_ml_backend.data_fetcher import get_async_data_fetcher
+from lumeris_ml_backend.bootstrap import bootstrap_models
+from lumeris_ml_backend.delta_sync import DeltaSync
+from lumeris_ml_backend.model_snapshots import ModelSnapshotter
+from lumeris_ml_backend.prediction_stream import PredictionBroadcaster
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -35,14 +46,49 @@ app.add_middleware(
 
 # Initialize ML models
 gaming_recommender = GamingRecommender()
-sentiment_analyzer = SentimentAnalyzer()
+sentiment_analyzer = SentimentAnalyzer(lexical_backend=os.getenv("SENTIMENT_LEXICAL_BACKEND", "textblob"))
 defi_predictor = DeFiPredictor()
+trending_engine = TrendingTopicsEngine(
+    phrase_extractor=sentiment_analyzer.extract_phrases,
+    categories=sentiment_analyzer.categories
+)
+sentiment_aggregates = SentimentAggregateStore(categories=sentiment_analyzer.categories)
+data_fetcher = get_async_data_fetcher()
+
+# Largest number of users or games accepted by one gaming batch request
+GAMING_MAX_BATCH_SIZE = int(os.getenv("GAMING_MAX_BATCH_SIZE", "1000"))
+startup_report: Dict[str, Any] = {}
+
+# Incremental refresh from the backend change log
+delta_sync = DeltaSync(data_fetcher, state_path="models/delta_sync_state.json")
+delta_sync.register("games", gaming_recommender.apply_game_changes)
+delta_sync.register("pools", defi_predictor.apply_pool_changes)
+delta_sync.register("comments", sentiment_analyzer.apply_comment_changes)
+background_tasks: List[asyncio.Task] = []
+
+# Predictions are pushed to stream subscribers once per data change or retrain
+prediction_broadcaster = PredictionBroadcaster(defi_predictor)
+
+# Model saves run as background jobs against a consistent view of each model
+model_snapshots = ModelSnapshotter({
+    "gaming_recommender": gaming_recommender,
+    "sentiment_analyzer": sentiment_analyzer,
+    "defi_predictor": defi_predictor
+}, directory="models")
 
 # Pydantic models for request/response
 class RecommendationRequest(BaseModel):
     user_id: str
     n_recommendations: int = 3
 
+class BatchRecommendationRequest(BaseModel):
+    user_ids: List[str]
+    n_recommendations: int = 3
+
+class BatchSimilarGamesRequest(BaseModel):
+    game_ids: List[str]
+    n: int = 3
+
 class SentimentRequest(BaseModel):
     text: str
     category: Optional[str] = "general"
@@ -50,6 +96,9 @@ class SentimentRequest(BaseModel):
 class BatchSentimentRequest(BaseModel):
     comments: List[Dict[str, str]]
 
+class TrendingIngestRequest(BaseModel):
+    comments: List[Dict[str, Any]]
+
 class DeFiPredictionRequest(BaseModel):
     pool_id: str
     days_ahead: Optional[int] = 7
@@ -60,16 +109,67 @@ async def startup_event():
     """Initialize models on startup"""
     print("Starting Lumeris ML Backend...")
 
-    # Initialize models with data from backend API
-    gaming_recommender.initialize_with_mock_data()
-    sentiment_analyzer.initialize_with_mock_data()
-    defi_predictor.initialize_with_mock_data()
+    # Reading the watermark and the full fetch share one deadline, so an
+    # unreachable backend cannot hold up startup for longer than that
+    fetch_timeout = float(os.getenv("BACKEND_FETCH_TIMEOUT", "5.0"))
+    deadline = time.monotonic() + fetch_timeout
+
+    # The full fetch below contains every change up to now
+    await delta_sync.skip_to_latest(timeout=fetch_timeout)
+
+    # Initialize models in parallel from one bounded fetch of backend data
+    startup_report.update(await bootstrap_models(
+        data_fetcher,
+        gaming_recommender,
+        sentiment_analyzer,
+        defi_predictor,
+        fetch_timeout=max(deadline - time.monotonic(), 0.0)
+    ))
+    print(f"Backend fetch took {startup_report['fetch_seconds']:.2f}s "
+          f"(backend {'available' if startup_report['backend_available'] else 'unavailable'}), "
+          f"startup {startup_report['total_seconds']:.2f}s")
+
+    prediction_broadcaster.start()
 
     # Note: We don't load pickled models as we're using fresh data from backend API
 
+    # Optionally shard large sentiment batches across worker processes
+    sentiment_workers = int(os.getenv("SENTIMENT_WORKERS", "0"))
+    if sentiment_workers > 0:
+        sentiment_analyzer.enable_parallel(workers=sentiment_workers)
+        print(f"Sentiment analysis running on {sentiment_workers} worker processes")
+
+    # Optionally poll the backend change log for incremental refreshes
+    sync_interval = float(os.getenv("DELTA_SYNC_INTERVAL", "0"))
+    if sync_interval > 0 and delta_sync.available:
+        background_tasks.append(asyncio.create_task(delta_sync.run(sync_interval)))
+        print(f"Delta sync polling the backend every {sync_interval:g}s")
+
+    # Optionally snapshot the models periodically
+    snapshot_interval = float(os.getenv("MODEL_SNAPSHOT_INTERVAL", "0"))
+    if snapshot_interval > 0:
+        background_tasks.append(asyncio.create_task(model_snapshots.run_periodic(snapshot_interval)))
+        print(f"Model snapshots every {snapshot_interval:g}s")
+
+    # Models and libraries loaded at startup live for the whole process; keep
+    # them out of full garbage collections, which otherwise stall the event
+    # loop for tens of milliseconds whenever background work allocates
+    gc.freeze()
+
     print("All ML models initialized successfully!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release worker processes and backend connections"""
+    for task in background_tasks:
+        task.cancel()
+    await prediction_broadcaster.stop()
+    await asyncio.to_thread(model_snapshots.shutdown)
+    sentiment_analyzer.disable_parallel()
+    await data_fetcher.aclose()
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -88,7 +188,13 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "models_loaded": True}
+    return {
+        "status": "healthy",
+        "models_loaded": bool(startup_report),
+        "startup": startup_report,
+        "backend_circuit": data_fetcher.circuit_breaker.stats(),
+        "backend_snapshots": data_fetcher.snapshots.stats() if data_fetcher.snapshots else None
+    }
 
 
 # ==================== GAMING RECOMMENDATIONS ====================
@@ -111,6 +217,48 @@ async def get_game_recommendations(request: RecommendationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _check_gaming_batch(ids: List[str], field: str):
+    """Reject batches above GAMING_MAX_BATCH_SIZE"""
+    if len(ids) > GAMING_MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many {field}: {len(ids)} (max {GAMING_MAX_BATCH_SIZE} per request)"
+        )
+
+
+@app.post("/api/gaming/recommendations/batch")
+async def get_batch_game_recommendations(request: BatchRecommendationRequest):
+    """Get game recommendations for many users, keyed by user ID"""
+    _check_gaming_batch(request.user_ids, "user_ids")
+    try:
+        recommendations = gaming_recommender.recommend_for_users(
+            request.user_ids,
+            request.n_recommendations
+        )
+        return {
+            "success": True,
+            "recommendations": recommendations,
+            "count": len(recommendations)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/gaming/similar/batch")
+async def get_batch_similar_games(request: BatchSimilarGamesRequest):
+    """Get similar games for many games, keyed by game ID"""
+    _check_gaming_batch(request.game_ids, "game_ids")
+    try:
+        similar = gaming_recommender.get_similar_games_batch(request.game_ids, request.n)
+        return {
+            "success": True,
+            "similar_games": similar,
+            "count": len(similar)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/gaming/similar/{game_id}")
 async def get_similar_games(game_id: str, n: int = 3):
     """Get similar games to a given game"""
@@ -146,6 +294,7 @@ async def analyze_sentiment(request: SentimentRequest):
     """Analyze sentiment of a single comment"""
     try:
         result = sentiment_analyzer.analyze_comment(request.text, request.category)
+        sentiment_aggregates.ingest([result])
         return {
             "success": True,
             "result": result
@@ -159,6 +308,7 @@ async def analyze_batch_sentiment(request: BatchSentimentRequest):
     """Analyze sentiment of multiple comments"""
     try:
         result = sentiment_analyzer.analyze_batch(request.comments)
+        sentiment_aggregates.ingest(result['individual_results'])
         return {
             "success": True,
             "result": result
@@ -181,6 +331,85 @@ async def get_trending_topics(comments: List[str]):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/sentiment/aggregates")
+async def get_sentiment_aggregates(
+    resolution: str = "1m",
+    buckets: int = 60,
+    category: Optional[str] = None,
+    series: bool = False
+):
+    """Get rolling sentiment aggregates of everything analyzed so far"""
+    if resolution not in sentiment_aggregates.rollups:
+        raise HTTPException(status_code=400, detail=f"Unknown resolution '{resolution}'")
+    try:
+        return {
+            "success": True,
+            "aggregates": sentiment_aggregates.query(resolution, buckets, category, include_series=series)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/sentiment/trending/ingest")
+async def ingest_trending_comments(request: TrendingIngestRequest):
+    """Feed comments into the live trending-topics sketches"""
+    try:
+        counted = trending_engine.ingest(request.comments)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        return {
+            "success": True,
+            "ingested": counted,
+            "dropped": len(request.comments) - counted
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/sentiment/trending/live")
+async def get_live_trending_topics(window: str = "1h", category: str = "all", limit: int = 10):
+    """Get trending topics over a sliding time window"""
+    try:
+        trending = trending_engine.top(window=window, category=category, k=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        return {
+            "success": True,
+            "window": window,
+            "category": category,
+            "trending_topics": trending,
+            "count": len(trending)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/sentiment/trending/stats")
+async def get_trending_stats():
+    """Get ingestion counters of the live trending-topics engine"""
+    try:
+        return {
+            "success": True,
+            "stats": trending_engine.stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/sentiment/cache/stats")
+async def get_sentiment_cache_stats():
+    """Get hit rates of the sentiment result caches"""
+    try:
+        return {
+            "success": True,
+            "cache": sentiment_analyzer.get_cache_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ==================== DEFI PREDICTIONS ====================
 
 @app.post("/api/defi/predict")
@@ -213,6 +442,46 @@ async def predict_all_pools():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/defi/predictions/stream")
+async def stream_predictions(pool_ids: Optional[str] = None):
+    """
+    Server-Sent Events with prediction updates, pushed when data or models change
+
+    The first event holds the current predictions; later events only the
+    pools that changed. ``pool_ids`` is an optional comma-separated filter.
+    """
+    pool_filter = {pool_id.strip() for pool_id in pool_ids.split(",") if pool_id.strip()} if pool_ids else None
+    return StreamingResponse(
+        prediction_broadcaster.events(pool_filter),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/api/defi/predictions/stream/stats")
+async def get_prediction_stream_stats():
+    """Get subscriber and computation counters of the prediction stream"""
+    try:
+        return {
+            "success": True,
+            "stream": prediction_broadcaster.stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/defi/cache/stats")
+async def get_prediction_cache_stats():
+    """Get prediction cache hit ratio and latency savings"""
+    try:
+        return {
+            "success": True,
+            "cache": defi_predictor.get_cache_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/defi/pools")
 async def get_all_pools():
     """Get all available pools"""
@@ -228,25 +497,50 @@ async def get_all_pools():
 
 # ==================== MODEL MANAGEMENT ====================
 
-@app.post("/api/models/save")
-async def save_models():
-    """Save all models to disk"""
+@app.post("/api/sync/delta")
+async def run_delta_sync():
+    """Apply backend changes since the last sync to the models"""
     try:
-        models_dir = "models"
-        os.makedirs(models_dir, exist_ok=True)
+        report = await delta_sync.sync()
+        return {"success": True, **report}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/sync/status")
+async def get_sync_status():
+    """Watermark and report of the last delta sync"""
+    return {
+        "success": True,
+        "available": delta_sync.available,
+        "watermark": delta_sync.watermark,
+        "last_sync": delta_sync.last_report
+    }
 
-        gaming_recommender.save_model(f"{models_dir}/gaming_recommender.pkl")
-        sentiment_analyzer.save_model(f"{models_dir}/sentiment_analyzer.pkl")
-        defi_predictor.save_model(f"{models_dir}/defi_predictor.pkl")
 
+@app.post("/api/models/save")
+async def save_models():
+    """Start a background snapshot of all models; poll its status with the returned job id"""
+    try:
+        job = model_snapshots.submit()
         return {
             "success": True,
-            "message": "All models saved successfully"
+            "message": "Model snapshot queued",
+            "job": job
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/models/save/{job_id}")
+async def get_save_status(job_id: str):
+    """Status of a model snapshot job"""
+    job = model_snapshots.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown snapshot job '{job_id}'")
+    return {"success": True, "job": job}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,161 @@
+"""
+DeFi Training Backend Comparison
+Measures training time, inference latency and accuracy of the DeFi
+predictor's training backends as the amount of history grows
+"""
+
+import json
+import time
+import numpy as np
+from typing import Dict, List, Any, Optional, Sequence
+from datetime import datetime
+from sklearn.preprocessing import StandardScaler
+
+from ..defi_predictor import (
+    DeFiPredictor,
+    FEATURE_COLUMNS,
+    fit_models,
+    prepare_training_frame,
+)
+
+# Backend configurations compared by default
+BACKENDS = {
+    "forest_serial+gradient_boosting": {"trend_backend": "gradient_boosting", "n_jobs": 1},
+    "forest_parallel+gradient_boosting": {"trend_backend": "gradient_boosting", "n_jobs": -1},
+    "forest_parallel+hist_gradient_boosting": {"trend_backend": "hist_gradient_boosting", "n_jobs": -1},
+}
+
+
+def _latency_ms(predict, X: np.ndarray, repeats: int) -> float:
+    """Median latency of a predict call in milliseconds"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predict(X)
+        samples.append((time.perf_counter() - start) * 1000)
+    return float(np.median(samples))
+
+
+def compare_training_backends(
+    history_days: Sequence[int] = (30, 90, 365, 730, 1095),
+    backends: Optional[Dict[str, Dict[str, Any]]] = None,
+    test_fraction: float = 0.2,
+    latency_repeats: int = 20,
+    time_budget: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Train every backend on growing histories and compare them
+
+    The last ``test_fraction`` of each pool's days is held out, so accuracy
+    is measured on data that comes after everything the models saw.
+
+    Args:
+        history_days: History lengths (in days) to evaluate
+        backends: Name -> ``fit_models`` keyword arguments (defaults to ``BACKENDS``)
+        test_fraction: Share of the most recent days used for evaluation
+        latency_repeats: Calls used to measure inference latency
+        time_budget: Optional training time budget passed to every backend
+
+    Returns:
+        Report with one entry per (history length, backend)
+    """
+
+    backends = backends or BACKENDS
+    predictor = DeFiPredictor()
+    predictor.initialize_with_mock_data()
+
+    results: List[Dict[str, Any]] = []
+    for days in history_days:
+        history = predictor._generate_historical_data(days=days)
+        frame = prepare_training_frame(history).dropna(subset=['next_price'])
+
+        # Time-based split: the most recent days of every pool are held out
+        cutoff = frame['date'].quantile(1 - test_fraction)
+        train_df = frame[frame['date'] <= cutoff]
+        test_df = frame[frame['date'] > cutoff]
+
+        scaler = StandardScaler()
+        X_train = scaler.fit_transform(train_df[FEATURE_COLUMNS].values)
+        X_test = scaler.transform(test_df[FEATURE_COLUMNS].values)
+
+        for name, config in backends.items():
+            price_model, trend_classifier, report = fit_models(
+                X_train,
+                train_df['next_price'].values,
+                train_df['trend'].values,
+                time_budget=time_budget,
+                **config
+            )
+
+            predicted_prices = price_model.predict(X_test)
+            predicted_trends = trend_classifier.predict(X_test)
+            actual_prices = test_df['next_price'].values
+
+            # Latency of a single-pool request and of a batch over all test rows
+            single_row = X_test[:1]
+            single_ms = (
+                _latency_ms(price_model.predict, single_row, latency_repeats)
+                + _latency_ms(trend_classifier.predict_proba, single_row, latency_repeats)
+            )
+            batch_ms = (
+                _latency_ms(price_model.predict, X_test, latency_repeats)
+                + _latency_ms(trend_classifier.predict_proba, X_test, latency_repeats)
+            )
+
+            results.append({
+                "history_days": days,
+                "backend": name,
+                "train_samples": int(len(X_train)),
+                "test_samples": int(len(X_test)),
+                "train_seconds": report['total_seconds'],
+                "price_train_seconds": report['price_seconds'],
+                "trend_train_seconds": report['trend_seconds'],
+                "trend_iterations": report['trend_iterations'],
+                "budget_exhausted": report['budget_exhausted'],
+                "single_inference_ms": single_ms,
+                "batch_inference_ms": batch_ms,
+                "price_mape_pct": float(
+                    np.mean(np.abs(predicted_prices - actual_prices) / actual_prices) * 100
+                ),
+                "trend_accuracy": float(np.mean(predicted_trends == test_df['trend'].values)),
+            })
+
+    return {
+        "history_days": list(history_days),
+        "backends": backends,
+        "results": results,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a comparison report as a plain-text table"""
+    header = f"{'days':>6} {'backend':<40} {'train s':>8} {'1-row ms':>9} {'batch ms':>9} {'MAPE %':>7} {'trend acc':>9}"
+    lines = [header, "-" * len(header)]
+    for row in report['results']:
+        lines.append(
+            f"{row['history_days']:>6} {row['backend']:<40} {row['train_seconds']:>8.2f} "
+            f"{row['single_inference_ms']:>9.2f} {row['batch_inference_ms']:>9.2f} "
+            f"{row['price_mape_pct']:>7.2f} {row['trend_accuracy']:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+# Run the comparison and save it next to the models
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Compare DeFi training backends")
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 90, 365, 730, 1095])
+    parser.add_argument("--time-budget", type=float, default=None)
+    parser.add_argument("--output", default="models/defi_training_report.json")
+    args = parser.parse_args()
+
+    comparison = compare_training_backends(args.days, time_budget=args.time_budget)
+    print(format_report(comparison))
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(comparison, f, indent=2)
+    print(f"\nReport saved to {args.output}")
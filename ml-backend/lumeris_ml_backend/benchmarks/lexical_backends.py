@@ -0,0 +1,140 @@
+"""
+Lexical Backend Benchmark
+Compares throughput of the TextBlob and fast lexical backends, and how far
+the fast backend's polarity and noun phrases drift from TextBlob's
+"""
+
+import json
+import time
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+from textblob.exceptions import MissingCorpusError
+
+from ..lexical_backends import LEXICAL_BACKENDS, get_lexical_backend
+from ..sentiment_analyzer import SentimentAnalyzer
+from .sentiment_parallel import generate_comments
+
+
+def _label(polarity: float) -> str:
+    if polarity > 0.1:
+        return "positive"
+    if polarity < -0.1:
+        return "negative"
+    return "neutral"
+
+
+def _measure(func, texts: List[str]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    outputs = [func(text) for text in texts]
+    seconds = time.perf_counter() - start
+    return {"outputs": outputs, "comments_per_sec": len(texts) / seconds}
+
+
+def compare_lexical_backends(
+    n_comments: int = 5000,
+    backends: Optional[List[str]] = None,
+    reference: str = "textblob",
+) -> Dict[str, Any]:
+    """
+    Measure each backend and its agreement with the reference backend
+
+    Noun phrases need NLTK corpora for TextBlob; without them the phrase
+    figures are reported as unavailable.
+
+    Args:
+        n_comments: Synthetic comments scored per backend
+        backends: Backend names (defaults to all)
+        reference: Backend the others are compared against
+
+    Returns:
+        Throughput and accuracy figures per backend
+    """
+
+    backends = backends or list(LEXICAL_BACKENDS)
+    comments = generate_comments(n_comments)
+    texts = [comment['text'] for comment in comments]
+
+    polarities = {}
+    phrases = {}
+    runs = []
+    for name in backends:
+        backend = get_lexical_backend(name)
+        run = {"backend": name}
+
+        polarity_run = _measure(backend.polarity, texts)
+        polarities[name] = [output[0] for output in polarity_run['outputs']]
+        run["polarity_comments_per_sec"] = polarity_run['comments_per_sec']
+
+        try:
+            analyze_run = _measure(backend.analyze, texts)
+            phrase_run = _measure(backend.noun_phrases, texts)
+            phrases[name] = phrase_run['outputs']
+            run["analyze_comments_per_sec"] = analyze_run['comments_per_sec']
+            run["phrases_comments_per_sec"] = phrase_run['comments_per_sec']
+        except MissingCorpusError as e:
+            # TextBlob's noun-phrase chunker is missing its NLTK corpora
+            run["phrases_error"] = str(e).strip().splitlines()[0]
+
+        runs.append(run)
+
+    # Whole analyzer throughput per backend (ML model + lexical + emotions)
+    for run in runs:
+        if "phrases_error" in run:
+            continue
+        analyzer = SentimentAnalyzer(cache_size=0, lexical_backend=run["backend"])
+        analyzer.initialize_with_mock_data()
+        start = time.perf_counter()
+        analyzer.analyze_batch(comments)
+        run["analyze_batch_comments_per_sec"] = n_comments / (time.perf_counter() - start)
+
+    for run in runs:
+        name = run["backend"]
+        if name == reference or reference not in polarities:
+            continue
+
+        errors = [abs(a - b) for a, b in zip(polarities[name], polarities[reference])]
+        run["polarity_mae"] = sum(errors) / len(errors)
+        run["polarity_max_error"] = max(errors)
+        run["polarity_label_agreement"] = sum(
+            _label(a) == _label(b) for a, b in zip(polarities[name], polarities[reference])
+        ) / len(errors)
+
+        if name in phrases and reference in phrases:
+            found = sum(len(set(a) & set(b)) for a, b in zip(phrases[name], phrases[reference]))
+            run["phrase_precision"] = found / max(sum(len(set(a)) for a in phrases[name]), 1)
+            run["phrase_recall"] = found / max(sum(len(set(b)) for b in phrases[reference]), 1)
+
+        if reference in [r["backend"] for r in runs]:
+            baseline = next(r for r in runs if r["backend"] == reference)
+            for key in ("polarity_comments_per_sec", "analyze_comments_per_sec",
+                        "analyze_batch_comments_per_sec"):
+                if key in run and key in baseline:
+                    run[key.replace("comments_per_sec", "speedup")] = run[key] / baseline[key]
+
+    return {
+        "n_comments": n_comments,
+        "reference": reference,
+        "runs": runs,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+# Run the backend comparison
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Lexical backend benchmark")
+    parser.add_argument("--comments", type=int, default=5000)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    report = compare_lexical_backends(args.comments)
+    for run in report['runs']:
+        print(f"\n{run['backend']}:")
+        for key, value in run.items():
+            if key != "backend":
+                print(f"  {key}: {value:.4f}" if isinstance(value, float) else f"  {key}: {value}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
@@ -0,0 +1,125 @@
+"""
+Sentiment Parallel Scaling Benchmark
+Measures analyze_batch and get_trending_topics throughput from one to N
+worker processes
+"""
+
+import json
+import os
+import random
+import time
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+
+from ..sentiment_analyzer import SentimentAnalyzer
+
+# Fragments combined into synthetic comments of varied length
+_OPENERS = [
+    "This game is", "The DeFi pool is", "Honestly the NFT drop was", "Governance voting feels",
+    "The platform is", "Staking rewards are", "Matchmaking is", "The new update is",
+]
+_ADJECTIVES = [
+    "amazing", "terrible", "okay", "confusing", "fantastic", "slow", "fair", "risky",
+    "incredible", "disappointing", "average", "transparent",
+]
+_TAILS = [
+    "and the community is great", "but fees are too high", "compared to other platforms",
+    "after the latest patch", "for new players", "with high APY", "and support never answers",
+    "so I will keep playing", "", "",
+]
+_CATEGORIES = ['gaming', 'defi', 'nft', 'governance', 'general']
+
+
+def generate_comments(n: int, seed: int = 7) -> List[Dict[str, str]]:
+    """Deterministic synthetic comments with mixed lengths and categories"""
+    rng = random.Random(seed)
+    comments = []
+    for _ in range(n):
+        sentences = [
+            f"{rng.choice(_OPENERS)} {rng.choice(_ADJECTIVES)} {rng.choice(_TAILS)}".strip()
+            for _ in range(rng.randint(1, 4))
+        ]
+        comments.append({"text": ". ".join(sentences) + "!", "category": rng.choice(_CATEGORIES)})
+    return comments
+
+
+def benchmark_parallel_scaling(
+    n_comments: int = 20000,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 256,
+) -> Dict[str, Any]:
+    """
+    Measure throughput with the in-process path and with 1..N workers
+
+    Args:
+        n_comments: Comments analyzed per run
+        max_workers: Largest pool size tried (defaults to CPU count)
+        chunk_size: Comments per worker task
+
+    Returns:
+        Throughput and speedup over the in-process baseline per worker count
+    """
+
+    max_workers = max_workers or os.cpu_count() or 1
+    comments = generate_comments(n_comments)
+    texts = [comment['text'] for comment in comments]
+
+    analyzer = SentimentAnalyzer(cache_size=0)
+    analyzer.initialize_with_mock_data()
+
+    def measure(label: str, workers: int) -> Dict[str, Any]:
+        start = time.perf_counter()
+        analyzer.analyze_batch(comments)
+        batch_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        analyzer.get_trending_topics(texts)
+        trending_seconds = time.perf_counter() - start
+
+        return {
+            "mode": label,
+            "workers": workers,
+            "batch_comments_per_sec": n_comments / batch_seconds,
+            "trending_comments_per_sec": n_comments / trending_seconds,
+        }
+
+    runs = [measure("in_process", 0)]
+    for workers in range(1, max_workers + 1):
+        analyzer.enable_parallel(workers=workers, chunk_size=chunk_size, min_batch_size=1)
+        runs.append(measure("process_pool", workers))
+    analyzer.disable_parallel()
+
+    baseline = runs[0]
+    for run in runs:
+        run["batch_speedup"] = run["batch_comments_per_sec"] / baseline["batch_comments_per_sec"]
+        run["trending_speedup"] = run["trending_comments_per_sec"] / baseline["trending_comments_per_sec"]
+
+    return {
+        "n_comments": n_comments,
+        "chunk_size": chunk_size,
+        "cpu_count": os.cpu_count(),
+        "runs": runs,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+# Run the scaling benchmark
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sentiment parallel scaling benchmark")
+    parser.add_argument("--comments", type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    report = benchmark_parallel_scaling(args.comments, args.max_workers, args.chunk_size)
+    print(f"\n{'mode':<14} {'workers':>7} {'batch/s':>10} {'x':>6} {'trending/s':>11} {'x':>6}")
+    for run in report['runs']:
+        print(f"{run['mode']:<14} {run['workers']:>7} {run['batch_comments_per_sec']:>10.0f} "
+              f"{run['batch_speedup']:>6.2f} {run['trending_comments_per_sec']:>11.0f} {run['trending_speedup']:>6.2f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
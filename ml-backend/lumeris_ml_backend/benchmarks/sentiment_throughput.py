@@ -0,0 +1,280 @@
+"""
+Sentiment Throughput Benchmark
+Measures SentimentAnalyzer throughput and latency percentiles on generated
+corpora from 10 to 1M comments, broken down by pipeline stage, and compares
+the JSON reports of two runs to flag regressions
+"""
+
+import json
+import os
+import platform
+import random
+import time
+import numpy as np
+import sklearn
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from datetime import datetime
+
+from ..sentiment_analyzer import SentimentAnalyzer
+from .sentiment_parallel import _ADJECTIVES, _CATEGORIES, _OPENERS, _TAILS
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+# Share of comments per length class: (weight, min sentences, max sentences)
+_LENGTH_MIX = [(0.6, 1, 2), (0.3, 3, 6), (0.1, 10, 30)]
+
+_EXTRA_WORDS = [
+    "wen", "moon", "gas", "whale", "airdrop", "bridge", "slippage", "validator",
+    "quest", "guild", "loot", "mint", "floor", "royalties", "proposal", "quorum",
+]
+
+
+def generate_corpus(n: int, seed: int = 11) -> List[Dict[str, str]]:
+    """
+    Deterministic comments with a realistic length mix
+
+    Most comments are one or two sentences, some are paragraphs and a few
+    are long posts; a random extra word keeps most texts distinct.
+    """
+    rng = random.Random(seed)
+    weights = [weight for weight, _, _ in _LENGTH_MIX]
+
+    comments = []
+    for _ in range(n):
+        _, low, high = rng.choices(_LENGTH_MIX, weights=weights)[0]
+        sentences = [
+            f"{rng.choice(_OPENERS)} {rng.choice(_ADJECTIVES)} {rng.choice(_TAILS)}".strip()
+            for _ in range(rng.randint(low, high))
+        ]
+        sentences[-1] += f" {rng.choice(_EXTRA_WORDS)} {rng.randint(0, 999)}"
+        comments.append({"text": ". ".join(sentences) + "!", "category": rng.choice(_CATEGORIES)})
+    return comments
+
+
+def _latency_summary(samples_ms: List[float]) -> Dict[str, float]:
+    samples = np.asarray(samples_ms)
+    return {
+        "p50_ms": round(float(np.percentile(samples, 50)), 4),
+        "p95_ms": round(float(np.percentile(samples, 95)), 4),
+        "p99_ms": round(float(np.percentile(samples, 99)), 4),
+        "max_ms": round(float(samples.max()), 4),
+    }
+
+
+def _timed_calls(func: Callable[[Any], Any], items: Sequence[Any]) -> Dict[str, Any]:
+    """Throughput and per-call latency of ``func`` over ``items``"""
+    samples = []
+    start = time.perf_counter()
+    for item in items:
+        call_start = time.perf_counter()
+        func(item)
+        samples.append((time.perf_counter() - call_start) * 1000)
+    seconds = time.perf_counter() - start
+    return {"calls": len(items), "seconds": round(seconds, 4), **_latency_summary(samples)}
+
+
+def _stage_breakdown(analyzer: SentimentAnalyzer, texts: List[str]) -> Dict[str, Dict[str, float]]:
+    """Time each stage of _analyze_texts separately on the same texts"""
+
+    stages: Dict[str, Callable[[], Any]] = {}
+    if analyzer.model is not None:
+        vectorizer = analyzer.model.steps[0][1]
+        classifier = analyzer.model.steps[-1][1]
+        features = vectorizer.transform(texts)
+        stages["vectorize"] = lambda: vectorizer.transform(texts)
+        stages["classify"] = lambda: classifier.predict_proba(features)
+    if analyzer.fast_scorer is not None:
+        stages["fast_scorer"] = lambda: analyzer.fast_scorer.predict_proba(texts)
+
+    backend = analyzer.lexical_backend
+    stages[f"polarity_{backend.name}"] = lambda: [backend.polarity(text) for text in texts]
+    stages["noun_phrases"] = lambda: [backend.noun_phrases(text) for text in texts]
+    stages["emotions"] = lambda: [
+        analyzer._detect_emotions(text, 0.0, 0.0, scores)
+        for text, scores in zip(texts, analyzer.emotion_lexicon.score_batch(texts))
+    ]
+
+    breakdown = {}
+    for name, run in stages.items():
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+        breakdown[name] = {
+            "seconds": round(seconds, 4),
+            "comments_per_sec": round(len(texts) / seconds, 1) if seconds > 0 else None,
+        }
+    return breakdown
+
+
+def benchmark_throughput(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    batch_size: int = 1000,
+    max_single_calls: int = 2000,
+    max_stage_comments: int = 20000,
+    lexical_backend: str = "textblob",
+    cache_size: int = 0,
+    seed: int = 11,
+) -> Dict[str, Any]:
+    """
+    Measure analyze_comment, analyze_batch and get_trending_topics per corpus size
+
+    Args:
+        sizes: Corpus sizes (10 to 1,000,000 comments)
+        batch_size: Comments per analyze_batch / get_trending_topics call;
+            batch latency percentiles are taken over these calls
+        max_single_calls: analyze_comment is timed on at most this many
+            comments of each corpus
+        max_stage_comments: Comments used for the per-stage breakdown
+        lexical_backend: Lexical backend of the analyzer ("textblob", "fast")
+        cache_size: Result cache size (0 measures raw compute)
+        seed: Corpus seed
+
+    Returns:
+        Report with environment metadata and one result per corpus size
+    """
+
+    analyzer = SentimentAnalyzer(cache_size=cache_size, lexical_backend=lexical_backend)
+    analyzer.initialize_with_mock_data()
+
+    results = {}
+    for size in sizes:
+        comments = generate_corpus(size, seed)
+        texts = [comment['text'] for comment in comments]
+        batches = [comments[i:i + batch_size] for i in range(0, size, batch_size)]
+        text_batches = [texts[i:i + batch_size] for i in range(0, size, batch_size)]
+
+        single = _timed_calls(
+            lambda comment: analyzer.analyze_comment(comment['text'], comment['category']),
+            comments[:max_single_calls]
+        )
+        batch = _timed_calls(analyzer.analyze_batch, batches)
+        trending = _timed_calls(analyzer.get_trending_topics, text_batches)
+
+        single["comments_per_sec"] = round(single["calls"] / single["seconds"], 1)
+        batch["comments_per_sec"] = round(size / batch["seconds"], 1)
+        trending["comments_per_sec"] = round(size / trending["seconds"], 1)
+
+        results[str(size)] = {
+            "comments": size,
+            "avg_chars": round(sum(len(text) for text in texts) / size, 1),
+            "analyze_comment": single,
+            "analyze_batch": batch,
+            "get_trending_topics": trending,
+            "stages": _stage_breakdown(analyzer, texts[:max_stage_comments]),
+        }
+        print(f"{size:>9} comments: batch {batch['comments_per_sec']:>9.0f}/s, "
+              f"single p95 {single['p95_ms']:.3f} ms, trending {trending['comments_per_sec']:>9.0f}/s")
+
+    return {
+        "version": REPORT_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scikit_learn": sklearn.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "batch_size": batch_size,
+            "max_single_calls": max_single_calls,
+            "max_stage_comments": max_stage_comments,
+            "lexical_backend": lexical_backend,
+            "cache_size": cache_size,
+            "seed": seed,
+        },
+        "results": results,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float = 0.15
+) -> List[Dict[str, Any]]:
+    """
+    Regressions of ``current`` against ``baseline``
+
+    Throughput is compared for every operation and stage, p95 latency for
+    every operation, on corpus sizes present in both reports.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        tolerance: Allowed relative slowdown (0.15 = 15%)
+
+    Returns:
+        One entry per metric that got worse by more than ``tolerance``
+    """
+
+    regressions = []
+
+    def check(size: str, metric: str, before: Optional[float], after: Optional[float], higher_is_better: bool):
+        if not before or not after:
+            return
+        change = (after - before) / before
+        if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+            regressions.append({
+                "size": size,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change_pct": round(change * 100, 1)
+            })
+
+    for size, result in current["results"].items():
+        previous = baseline["results"].get(size)
+        if previous is None:
+            continue
+
+        for operation in ("analyze_comment", "analyze_batch", "get_trending_topics"):
+            check(size, f"{operation}.comments_per_sec", previous[operation]["comments_per_sec"],
+                  result[operation]["comments_per_sec"], True)
+            check(size, f"{operation}.p95_ms", previous[operation]["p95_ms"],
+                  result[operation]["p95_ms"], False)
+
+        for stage, timing in result["stages"].items():
+            if stage in previous["stages"]:
+                check(size, f"stages.{stage}.comments_per_sec", previous["stages"][stage]["comments_per_sec"],
+                      timing["comments_per_sec"], True)
+
+    return regressions
+
+
+# Run the throughput benchmark
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Sentiment throughput benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Corpus sizes, e.g. 10 1000 100000 1000000")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--lexical-backend", default="textblob")
+    parser.add_argument("--cache-size", type=int, default=0)
+    parser.add_argument("--output", default="sentiment_throughput.json")
+    parser.add_argument("--compare", default=None, help="Baseline report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    report = benchmark_throughput(
+        args.sizes,
+        batch_size=args.batch_size,
+        lexical_backend=args.lexical_backend,
+        cache_size=args.cache_size
+    )
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression['size']:>9} {regression['metric']}: "
+                  f"{regression['baseline']} -> {regression['current']} ({regression['change_pct']:+.1f}%)")
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
@@ -0,0 +1,73 @@
+"""
+Model Bootstrap
+Fetches backend data once, under a deadline, and initializes all models from
+that shared snapshot in parallel, reporting where startup time went
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from .data_fetcher import AsyncBackendDataFetcher
+from .defi_predictor import DeFiPredictor
+from .gaming_recommender import GamingRecommender
+from .sentiment_analyzer import SentimentAnalyzer
+
+
+async def bootstrap_models(
+    fetcher: AsyncBackendDataFetcher,
+    gaming_recommender: GamingRecommender,
+    sentiment_analyzer: SentimentAnalyzer,
+    defi_predictor: DeFiPredictor,
+    fetch_timeout: float = 5.0
+) -> Dict[str, Any]:
+    """
+    Initialize the models from one concurrent backend fetch
+
+    Games and pools are fetched together; if the backend is down the
+    fetcher's circuit breaker fails fast and the models fall back to mock
+    data, so the fetch phase never takes longer than ``fetch_timeout``.
+    Model initialization then runs on worker threads concurrently.
+
+    Args:
+        fetcher: Async backend fetcher
+        gaming_recommender: Recommender to initialize with the games
+        sentiment_analyzer: Analyzer to initialize (no backend data)
+        defi_predictor: Predictor to initialize with the pools
+        fetch_timeout: Deadline for the backend fetch in seconds
+
+    Returns:
+        Startup report: fetch and per-model timings, what the backend
+        returned and the circuit breaker state
+    """
+
+    start = time.perf_counter()
+    backend_data = await fetcher.fetch_startup_data(timeout=fetch_timeout)
+    fetch_seconds = time.perf_counter() - start
+
+    model_seconds: Dict[str, float] = {}
+
+    async def timed(name: str, initialize: Callable[..., None], *args):
+        model_start = time.perf_counter()
+        await asyncio.to_thread(initialize, *args)
+        model_seconds[name] = round(time.perf_counter() - model_start, 3)
+
+    # An empty list (backend down) makes a model use its mock data instead of fetching again
+    await asyncio.gather(
+        timed("gaming", gaming_recommender.initialize_with_mock_data, backend_data['games']),
+        timed("sentiment", sentiment_analyzer.initialize_with_mock_data),
+        timed("defi", defi_predictor.initialize_with_mock_data, backend_data['pools'])
+    )
+
+    return {
+        "backend_available": bool(backend_data['games'] or backend_data['pools']),
+        "backend_records": {"games": len(backend_data['games']), "pools": len(backend_data['pools'])},
+        "timed_out": backend_data['timed_out'],
+        "fetch_seconds": round(fetch_seconds, 3),
+        "fetch_timeout": fetch_timeout,
+        "model_seconds": model_seconds,
+        "total_seconds": round(time.perf_counter() - start, 3),
+        "circuit": fetcher.circuit_breaker.stats(),
+        "timestamp": datetime.now().isoformat()
+    }
@@ -0,0 +1,131 @@
+"""
+Result Cache
+Bounded LRU cache with hit-ratio and latency-savings statistics, shared by
+the ML models to avoid recomputing identical results
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """Thread-safe LRU cache that tracks how much compute time hits saved"""
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Args:
+            max_size: Maximum number of entries before the least recently
+                used one is evicted (0 disables caching)
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stores = 0
+        self.saved_seconds = 0.0
+        self.compute_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a cached value (None on a miss) and update statistics"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.saved_seconds += entry[1]
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, cost_seconds: float = 0.0):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            cost_seconds: Time it took to compute the value; every later hit
+                counts it as saved latency
+        """
+        if self.max_size <= 0:
+            return
+
+        with self._lock:
+            self.stores += 1
+            self.compute_seconds += cost_seconds
+            self._entries[key] = (value, cost_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        start = time.perf_counter()
+        value = compute()
+        self.put(key, value, time.perf_counter() - start)
+        return value
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        Drop entries
+
+        Args:
+            predicate: Called with each key; matching entries are dropped.
+                None drops everything.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if predicate is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                keys = [key for key in self._entries if predicate(key)]
+                for key in keys:
+                    del self._entries[key]
+                removed = len(keys)
+
+            self.invalidations += removed
+            return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio, size and estimated latency saved by cache hits"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "saved_seconds": round(self.saved_seconds, 6),
+                "avg_compute_ms": round(self.compute_seconds / self.stores * 1000, 3) if self.stores else 0.0,
+            }
+
+    def reset_stats(self):
+        """Zero the counters without touching cached entries"""
+        with self._lock:
+            self._reset_counters()
@@ -0,0 +1,416 @@
+"""
+Offline Bulk Scoring
+Command-line entry point for nightly jobs: streams users, comments or pools
+from JSONL/Parquet files through the batch paths of the models on a process
+pool and writes one JSON line per input row, reporting progress and throughput
+
+    lumeris-ml-batch recommend --model models/gaming_recommender --output recs.jsonl
+    lumeris-ml-batch sentiment --input comments.jsonl --output sentiment.jsonl
+    lumeris-ml-batch predict --model models/defi_predictor --output predictions.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .model_artifacts import json_default
+from .sentiment_aggregates import SENTIMENTS, summarize_sentiments
+
+# Model living inside each worker process, set up by _init_worker
+_worker_model = None
+
+
+# ---- input -------------------------------------------------------------------
+
+def input_format(path: str) -> str:
+    """'jsonl' or 'parquet' from the file extension; raises ValueError if unsupported"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if extension == '.parquet':
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise ValueError("Reading Parquet needs pyarrow: pip install 'lumeris-ml-backend[parquet]'")
+        return 'parquet'
+    raise ValueError(f"Unsupported input file type: {path} (expected .jsonl, .ndjson or .parquet)")
+
+
+def count_rows(path: str) -> Optional[int]:
+    """Row count when it is cheap to know up front (Parquet metadata), else None"""
+    if input_format(path) == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    return None
+
+
+def iter_records(path: str, chunk_size: int, columns: Optional[List[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream an input file in chunks of records
+
+    Args:
+        path: .jsonl/.ndjson file (one object per line) or .parquet file
+        chunk_size: Records per yielded chunk
+        columns: Columns to read from Parquet (None reads all)
+
+    Returns:
+        Iterator of record lists
+    """
+
+    if input_format(path) == 'parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pylist()
+
+    else:
+        chunk = []
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    chunk.append(json.loads(line))
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = []
+        if chunk:
+            yield chunk
+
+
+def _iter_ids(ids: List[str], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    for i in range(0, len(ids), chunk_size):
+        yield [{"id": record_id} for record_id in ids[i:i + chunk_size]]
+
+
+# ---- models ------------------------------------------------------------------
+
+def _load_model(kind: str, model_path: str, lexical_backend: str):
+    """Load a saved model (artifact arrays are memory-mapped, so workers share their pages)"""
+    if kind == 'gaming':
+        from .gaming_recommender import GamingRecommender
+        model = GamingRecommender()
+    elif kind == 'sentiment':
+        from .sentiment_analyzer import SentimentAnalyzer
+        model = SentimentAnalyzer(cache_size=0, lexical_backend=lexical_backend)
+    else:
+        from .defi_predictor import DeFiPredictor
+        model = DeFiPredictor(n_jobs=1)
+    model.load_model(model_path)
+    return model
+
+
+def _initialize_model(kind: str, lexical_backend: str):
+    """Build a model from backend data (or mock data) when no saved model is given"""
+    if kind == 'gaming':
+        from .gaming_recommender import GamingRecommender
+        model = GamingRecommender()
+    elif kind == 'sentiment':
+        from .sentiment_analyzer import SentimentAnalyzer
+        model = SentimentAnalyzer(cache_size=0, lexical_backend=lexical_backend)
+    else:
+        from .defi_predictor import DeFiPredictor
+        model = DeFiPredictor()
+    model.initialize_with_mock_data()
+    return model
+
+
+def _init_worker(kind: str, model_path: str, lexical_backend: str):
+    global _worker_model
+    _worker_model = _load_model(kind, model_path, lexical_backend)
+
+
+# ---- scoring (one chunk) -----------------------------------------------------
+
+def _score_recommendations(model, records: List[Dict[str, Any]], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    user_ids = [str(record[options['id_field']]) for record in records]
+    recommendations = model.recommend_for_users(user_ids, options['n'])
+    return [{"user_id": user_id, "recommendations": recommendations[user_id]} for user_id in user_ids]
+
+
+def _score_sentiment(model, records: List[Dict[str, Any]], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    texts = [str(record.get(options['text_field']) or '') for record in records]
+    categories = [record.get(options['category_field']) or 'general' for record in records]
+    analyses = model.analyze_comments(texts, categories)
+
+    id_field = options['id_field']
+    return [
+        {id_field: record[id_field], **analysis} if id_field in record else analysis
+        for record, analysis in zip(records, analyses)
+    ]
+
+
+def _score_predictions(model, records: List[Dict[str, Any]], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    pool_ids = [str(record[options['id_field']]) for record in records]
+    predictions = model.predict_pools(set(pool_ids), options['days_ahead'])
+    return [
+        predictions.get(pool_id) or {"pool_id": pool_id, "error": "Pool not found"}
+        for pool_id in pool_ids
+    ]
+
+
+SCORERS: Dict[str, Callable[[Any, List[Dict[str, Any]], Dict[str, Any]], List[Dict[str, Any]]]] = {
+    'gaming': _score_recommendations,
+    'sentiment': _score_sentiment,
+    'defi': _score_predictions,
+}
+
+
+def _score_chunk(kind: str, records: List[Dict[str, Any]], options: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return SCORERS[kind](_worker_model, records, options)
+
+
+# ---- job ---------------------------------------------------------------------
+
+class ProgressReporter:
+    """Prints rows done, throughput and (when the total is known) ETA at most every ``interval`` seconds"""
+
+    def __init__(self, label: str, total: Optional[int] = None, interval: float = 2.0, stream=sys.stderr):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.stream = stream
+        self.rows = 0
+        self.start = time.perf_counter()
+        self._last = 0.0
+
+    def update(self, rows: int, final: bool = False):
+        self.rows += rows
+        elapsed = time.perf_counter() - self.start
+        if not final and elapsed - self._last < self.interval:
+            return
+        self._last = elapsed
+
+        rate = self.rows / elapsed if elapsed > 0 else 0.0
+        line = f"[{self.label}] {self.rows:,} rows  {rate:,.0f} rows/s  {elapsed:.1f}s"
+        if self.total:
+            line += f"  {100 * self.rows / self.total:.1f}%"
+            if rate > 0 and not final:
+                line += f"  ETA {(self.total - self.rows) / rate:.0f}s"
+        print(line, file=self.stream, flush=True)
+
+
+def run_job(
+    kind: str,
+    chunks: Iterator[List[Dict[str, Any]]],
+    output: str,
+    options: Dict[str, Any],
+    model=None,
+    model_path: Optional[str] = None,
+    workers: int = 1,
+    lexical_backend: str = "textblob",
+    total: Optional[int] = None,
+    progress_interval: float = 2.0,
+    on_results: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Score input chunks and stream the results to a JSONL file in input order
+
+    Args:
+        kind: 'gaming', 'sentiment' or 'defi'
+        chunks: Record chunks to score
+        output: JSONL file to write
+        options: Scorer options (fields, n, days_ahead)
+        model: Model scored in-process when ``workers`` <= 1
+        model_path: Saved model each worker process loads when ``workers`` > 1
+        workers: Worker processes (<= 1 scores in this process)
+        lexical_backend: Sentiment polarity/noun-phrase backend
+        total: Expected row count, for the progress percentage
+        progress_interval: Seconds between progress lines
+        on_results: Called with every scored chunk (e.g. to aggregate)
+
+    Returns:
+        Rows, chunks, timing and throughput
+    """
+
+    progress = ProgressReporter(kind, total=total, interval=progress_interval)
+    n_chunks = 0
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    tmp_output = f"{output}.tmp"
+
+    with open(tmp_output, "w") as out:
+        def write(results: List[Dict[str, Any]]):
+            out.writelines(json.dumps(result, default=json_default) + "\n" for result in results)
+            if on_results is not None:
+                on_results(results)
+            progress.update(len(results))
+
+        if workers <= 1:
+            for records in chunks:
+                write(SCORERS[kind](model, records, options))
+                n_chunks += 1
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(kind, model_path, lexical_backend)
+            ) as executor:
+                # A bounded window of chunks in flight keeps memory flat and output ordered
+                pending = deque()
+                for records in chunks:
+                    pending.append(executor.submit(_score_chunk, kind, records, options))
+                    n_chunks += 1
+                    if len(pending) >= 2 * workers:
+                        write(pending.popleft().result())
+                while pending:
+                    write(pending.popleft().result())
+
+    # Only complete outputs appear under the final name
+    os.replace(tmp_output, output)
+
+    seconds = time.perf_counter() - progress.start
+    progress.update(0, final=True)
+    return {
+        "command": kind,
+        "output": output,
+        "rows": progress.rows,
+        "chunks": n_chunks,
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(progress.rows / seconds, 1) if seconds > 0 else None,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+class _SentimentSummary:
+    """Accumulates the (category x sentiment) counts of streamed results"""
+
+    def __init__(self, categories: List[str]):
+        self.category_index = {category: i for i, category in enumerate(categories)}
+        self.counts: Dict[int, np.ndarray] = {}
+        self.polarity_sums: Dict[int, float] = {}
+
+    def __call__(self, results: List[Dict[str, Any]]):
+        for analysis in results:
+            row = self.category_index.setdefault(analysis['category'], len(self.category_index))
+            counts = self.counts.setdefault(row, np.zeros(len(SENTIMENTS), dtype=np.int64))
+            counts[SENTIMENTS.index(analysis['sentiment'])] += 1
+            self.polarity_sums[row] = self.polarity_sums.get(row, 0.0) + analysis['polarity']
+
+    def summary(self) -> Dict[str, Any]:
+        n = len(self.category_index)
+        counts = np.zeros((n, len(SENTIMENTS)), dtype=np.int64)
+        polarity_sums = np.zeros(n, dtype=np.float64)
+        for row, values in self.counts.items():
+            counts[row] = values
+            polarity_sums[row] = self.polarity_sums[row]
+        return summarize_sentiments(counts, polarity_sums, list(self.category_index))
+
+
+# ---- command line ------------------------------------------------------------
+
+COMMANDS = {'recommend': 'gaming', 'sentiment': 'sentiment', 'predict': 'defi'}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lumeris-ml-batch",
+        description="Offline bulk scoring: recommendations, sentiment and DeFi predictions"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(sub: argparse.ArgumentParser, input_required: bool):
+        sub.add_argument("--input", required=input_required,
+                         help="JSONL or Parquet input" + ("" if input_required else " (default: every known ID)"))
+        sub.add_argument("--output", required=True, help="JSONL file the results are written to")
+        sub.add_argument("--model", default=None,
+                         help="Saved model directory (default: initialize from the backend / mock data)")
+        sub.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                         help="Worker processes (1 scores in this process)")
+        sub.add_argument("--chunk-size", type=int, default=1000, help="Rows per chunk sent to a worker")
+        sub.add_argument("--report", default=None, help="Also write the run report as JSON")
+        sub.add_argument("--progress-interval", type=float, default=2.0)
+
+    recommend = subparsers.add_parser("recommend", help="Game recommendations per user")
+    add_common(recommend, input_required=False)
+    recommend.add_argument("--id-field", default="user_id")
+    recommend.add_argument("--n", type=int, default=3, help="Recommendations per user")
+
+    sentiment = subparsers.add_parser("sentiment", help="Sentiment of every comment, plus a summary")
+    add_common(sentiment, input_required=True)
+    sentiment.add_argument("--text-field", default="text")
+    sentiment.add_argument("--category-field", default="category")
+    sentiment.add_argument("--id-field", default="id", help="Copied to the output when present")
+    sentiment.add_argument("--lexical-backend", default="textblob")
+
+    predict = subparsers.add_parser("predict", help="Trend predictions per pool")
+    add_common(predict, input_required=False)
+    predict.add_argument("--id-field", default="pool_id")
+    predict.add_argument("--days-ahead", type=int, default=7)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.input:
+        try:
+            input_format(args.input)
+        except ValueError as e:
+            parser.error(str(e))
+        if not os.path.isfile(args.input):
+            parser.error(f"Input file not found: {args.input}")
+    kind = COMMANDS[args.command]
+    lexical_backend = getattr(args, "lexical_backend", "textblob")
+    options = {key: value for key, value in vars(args).items()
+               if key in ('id_field', 'text_field', 'category_field', 'n', 'days_ahead')}
+
+    load_start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="lumeris-batch-") as tmp_dir:
+        model_path = args.model
+        if model_path is not None:
+            model = _load_model(kind, model_path, lexical_backend)
+        else:
+            model = _initialize_model(kind, lexical_backend)
+            if args.workers > 1:
+                # Workers memory-map the model from a temporary artifact
+                model_path = os.path.join(tmp_dir, kind)
+                model.save_model(model_path)
+        load_seconds = time.perf_counter() - load_start
+
+        if args.input:
+            chunks = iter_records(args.input, args.chunk_size)
+            total = count_rows(args.input)
+        else:
+            ids = list(model.user_play_history) if kind == 'gaming' else [pool['id'] for pool in model.pools]
+            chunks = _iter_ids(ids, args.chunk_size)
+            options['id_field'] = 'id'
+            total = len(ids)
+
+        summary = _SentimentSummary(model.categories) if kind == 'sentiment' else None
+        report = run_job(
+            kind,
+            chunks,
+            args.output,
+            options,
+            model=model,
+            model_path=model_path,
+            workers=args.workers,
+            lexical_backend=lexical_backend,
+            total=total,
+            progress_interval=args.progress_interval,
+            on_results=summary
+        )
+
+    report["input"] = args.input
+    report["model_seconds"] = round(load_seconds, 3)
+    if summary is not None:
+        report["summary"] = summary.summary()
+
+    print(json.dumps({key: value for key, value in report.items() if key != "summary"}, indent=2))
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2, default=json_default)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,52 +1,612 @@
 """
 Data Fetcher - Connects to Lumeris Backend API
-Fetches real data from the backend instead of using mock data
+Fetches real data from the backend instead of using mock data, over a pooled
+keep-alive HTTP client that can fan requests out concurrently, retries with
+jittered backoff and fails fast while the backend is down. Collections can be
+kept as on-disk snapshots that are revalidated with conditional requests
 """
 
-import requests
-from typing import Dict, List, Any, Optional
+import asyncio
+import random
+import threading
+import time
+import httpx
+import pandas as pd
+from datetime import datetime
+from typing import Dict, List, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
 import logging
 
+from .json_stream import StreamingArrayParser
+from .snapshot_cache import SnapshotCache
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+DEFAULT_BACKEND_URL = "http://localhost:3001"
+DEFAULT_SNAPSHOT_DIR = "models/backend_snapshots"
+CHANGE_FEED_ENDPOINT = "/api/sync/changes"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    Closed: requests pass. After ``failure_threshold`` failures in a row it
+    opens and requests are rejected without touching the network. After
+    ``reset_timeout`` seconds one probe request is let through (half-open);
+    its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now"""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Backend circuit opened after {self.consecutive_failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "rejected": self.rejected,
+                "open_for_seconds": round(time.monotonic() - self.opened_at, 3) if self.opened_at else None
+            }
 
-class BackendDataFetcher:
-    """Fetches data from the Lumeris backend API"""
 
-    def __init__(self, backend_url: str = "http://localhost:3001"):
+async def _cancel_and_wait(task: asyncio.Task):
+    """Cancel a task of the running loop and wait until it has finished"""
+    task.cancel()
+    await asyncio.wait([task])
+
+
+class AsyncBackendDataFetcher:
+    """Fetches data from the Lumeris backend API without blocking the event loop"""
+
+    def __init__(
+        self,
+        backend_url: str = DEFAULT_BACKEND_URL,
+        timeout: float = 5.0,
+        connect_timeout: float = 2.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        max_concurrency: int = 16,
+        retries: int = 2,
+        backoff_base: float = 0.1,
+        backoff_max: float = 1.0,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        snapshot_dir: Optional[str] = None,
+        snapshot_ttl: float = 300.0
+    ):
+        """
+        Args:
+            backend_url: Base URL of the backend API
+            timeout: Per-request timeout in seconds
+            connect_timeout: Timeout for opening a connection
+            max_connections: Upper bound on open connections
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept
+            max_concurrency: Requests in flight during fan-out calls
+            retries: Extra attempts after a connection error or 5xx response
+            backoff_base: First retry waits up to this many seconds (doubling per retry)
+            backoff_max: Cap on the wait before a retry
+            circuit_breaker: Breaker shared by all requests (a default one if None)
+            snapshot_dir: Directory for snapshots of the games, pools and
+                users collections (None disables snapshots)
+            snapshot_ttl: Seconds a snapshot is served without revalidation
+        """
         self.backend_url = backend_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.snapshots = SnapshotCache(snapshot_dir, snapshot_ttl) if snapshot_dir else None
 
-    def _make_request(self, endpoint: str) -> Optional[Dict[str, Any]]:
-        """Make a GET request to the backend API"""
+        # httpx clients belong to one event loop, so there is one client per loop,
+        # created lazily, each with a task that closes it (see _close_with_loop)
+        self._clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._closers: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Client bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                base_url=self.backend_url,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json"
+                },
+                timeout=self.timeout,
+                limits=self.limits
+            )
+            self._clients[loop] = client
+            self._closers[loop] = loop.create_task(self._close_with_loop(loop, client))
+        return client
+
+    async def _close_with_loop(self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient):
+        """Close ``client`` once this task is cancelled, by aclose() or by asyncio.run() on exit
+
+        A client can no longer close its connections after its loop is closed,
+        and asyncio.run() cancels leftover tasks just before closing the loop.
+        """
         try:
-            url = f"{self.backend_url}{endpoint}"
-            response = self.session.get(url, timeout=5)
-            response.raise_for_status()
-            data = response.json()
+            await loop.create_future()
+        finally:
+            if self._clients.get(loop) is client:
+                del self._clients[loop]
+                del self._closers[loop]
+            await client.aclose()
 
-            if data.get("success"):
-                return data.get("data")
-            else:
-                logger.error(f"API returned error for {endpoint}: {data}")
+    async def aclose(self):
+        """Close pooled connections, on every event loop the fetcher has used"""
+        loop = asyncio.get_running_loop()
+        for client_loop, closer in list(self._closers.items()):
+            if client_loop is loop:
+                await _cancel_and_wait(closer)
+            elif client_loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_cancel_and_wait(closer), client_loop))
+            elif not client_loop.is_closed():
+                client_loop.call_soon_threadsafe(closer.cancel)
+
+    async def __aenter__(self) -> "AsyncBackendDataFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry ``attempt`` (0-based)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def _with_retries(self, endpoint: str, send: Callable[[], Awaitable[T]]) -> Optional[T]:
+        """Run one request attempt after another under the circuit breaker; its result, or None"""
+        error: Optional[Exception] = None
+        for attempt in range(self.retries + 1):
+            if not self.circuit_breaker.allow():
+                logger.warning(f"Backend circuit open, skipping {endpoint}")
                 return None
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to fetch {endpoint}: {e}")
+            try:
+                result = await send()
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code < 500:
+                    # The backend is up; the request itself is wrong, so don't retry
+                    self.circuit_breaker.record_success()
+                    logger.error(f"Failed to fetch {endpoint}: {e}")
+                    return None
+                error = e
+            except httpx.HTTPError as e:
+                error = e
+            except ValueError as e:
+                self.circuit_breaker.record_success()
+                logger.error(f"Unexpected error fetching {endpoint}: {e}")
+                return None
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+            self.circuit_breaker.record_failure()
+            if attempt < self.retries:
+                await asyncio.sleep(self._backoff(attempt))
+
+        logger.error(f"Failed to fetch {endpoint} after {self.retries + 1} attempts: {error}")
+        return None
+
+    async def _request(self, endpoint: str, headers: Optional[Dict[str, str]] = None) -> Optional[httpx.Response]:
+        """GET with retries and the circuit breaker; a 2xx or 304 response, or None"""
+
+        async def send() -> httpx.Response:
+            response = await self._get_client().get(endpoint, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+
+        return await self._with_retries(endpoint, send)
+
+    async def _fetch_page(self, endpoint: str, params: Dict[str, Any]) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any]]]:
+        """One page of a collection, parsed while it streams in; (rows, other response fields) or None"""
+
+        async def send() -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+            parser = StreamingArrayParser("data")
+            rows: List[Dict[str, Any]] = []
+            async with self._get_client().stream("GET", endpoint, params=params) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    rows.extend(parser.feed(chunk))
+            rows.extend(parser.close())
+            return rows, parser.meta
+
+        page = await self._with_retries(endpoint, send)
+        if page is not None and not page[1].get("success"):
+            logger.error(f"API returned error for {endpoint}: {page[1]}")
             return None
+        return page
+
+    def _payload(self, endpoint: str, response: httpx.Response) -> Optional[Any]:
+        """'data' of a successful backend response"""
+        try:
+            data = response.json()
         except Exception as e:
             logger.error(f"Unexpected error fetching {endpoint}: {e}")
             return None
 
-    def get_games(self) -> List[Dict[str, Any]]:
+        if data.get("success"):
+            return data.get("data")
+        else:
+            logger.error(f"API returned error for {endpoint}: {data}")
+            return None
+
+    async def _make_request(self, endpoint: str) -> Optional[Any]:
+        """Make a GET request to the backend API"""
+        response = await self._request(endpoint)
+        return self._payload(endpoint, response) if response is not None else None
+
+    async def _fetch_snapshot(self, endpoint: str) -> Optional[Any]:
+        """
+        Fetch through the snapshot cache
+
+        A fresh snapshot is returned without a request. A stale one is
+        revalidated with If-None-Match / If-Modified-Since, so an unchanged
+        collection costs a 304 instead of a transfer and a JSON decode. If
+        the backend fails, the last good snapshot is returned.
+        """
+        if self.snapshots is None:
+            return await self._make_request(endpoint)
+
+        snapshot = self.snapshots.get(endpoint)
+        if snapshot is not None and self.snapshots.is_fresh(snapshot):
+            self.snapshots.record("fresh_hits")
+            return snapshot["data"]
+
+        headers = {}
+        if snapshot is not None:
+            if snapshot["etag"]:
+                headers["If-None-Match"] = snapshot["etag"]
+            if snapshot["last_modified"]:
+                headers["If-Modified-Since"] = snapshot["last_modified"]
+
+        response = await self._request(endpoint, headers)
+        if response is not None and response.status_code == 304 and snapshot is not None:
+            self.snapshots.touch(endpoint)
+            self.snapshots.record("revalidated")
+            return snapshot["data"]
+
+        data = self._payload(endpoint, response) if response is not None and response.status_code != 304 else None
+        if data is not None:
+            self.snapshots.put(endpoint, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            self.snapshots.record("refreshed")
+            return data
+
+        if snapshot is not None:
+            logger.warning(f"Backend unavailable for {endpoint}, using snapshot from "
+                           f"{datetime.fromtimestamp(snapshot['fetched_at']).isoformat()}")
+            self.snapshots.record("stale_fallbacks")
+            return snapshot["data"]
+        return None
+
+    async def gather_limited(self, coroutines: Iterable[Awaitable[T]]) -> List[T]:
+        """Run coroutines concurrently, at most ``max_concurrency`` at a time, in input order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def limited(coroutine: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(limited(coroutine) for coroutine in coroutines))
+
+    async def get_games(self) -> List[Dict[str, Any]]:
         """Fetch all games from backend"""
-        data = self._make_request("/api/gaming/games")
+        data = await self._fetch_snapshot("/api/gaming/games")
         return data if data else []
 
+    async def get_game_by_id(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a specific game by ID"""
+        return await self._make_request(f"/api/gaming/games/{game_id}")
+
+    async def get_gaming_leaderboard(self) -> List[Dict[str, Any]]:
+        """Fetch gaming leaderboard"""
+        data = await self._make_request("/api/gaming/leaderboard")
+        return data if data else []
+
+    async def get_user_stats(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch user gaming statistics"""
+        return await self._make_request(f"/api/gaming/user/{user_id}/stats")
+
+    async def get_defi_pools(self) -> List[Dict[str, Any]]:
+        """Fetch all DeFi pools from backend"""
+        data = await self._fetch_snapshot("/api/defi/pools")
+        return data if data else []
+
+    async def get_defi_pool_by_id(self, pool_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a specific DeFi pool by ID"""
+        return await self._make_request(f"/api/defi/pools/{pool_id}")
+
+    async def get_pool_analytics(self, pool_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch pool analytics data"""
+        return await self._make_request(f"/api/defi/pools/{pool_id}/analytics")
+
+    async def get_transactions(self) -> List[Dict[str, Any]]:
+        """Fetch recent transactions"""
+        data = await self._make_request("/api/user/transactions")
+        return data if data else []
+
+    async def get_users(self) -> List[Dict[str, Any]]:
+        """Fetch all users"""
+        data = await self._fetch_snapshot("/api/user/users")
+        return data if data else []
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        page_size: int = 500,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: int = 1
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Pages of a limit/offset paginated collection
+
+        Each page is parsed incrementally as it streams in, and up to
+        ``prefetch`` further pages are fetched while the caller works on the
+        current one, so memory stays bounded by a few pages. Iteration ends
+        after the last page (``pagination.hasMore`` false) or, with an error
+        logged, when a page cannot be fetched.
+
+        Args:
+            endpoint: Collection endpoint (e.g. "/api/user")
+            page_size: Rows requested per page (``limit``)
+            params: Extra query parameters (filters)
+            prefetch: Pages fetched ahead of the consumer
+
+        Yields:
+            Lists of rows, in backend order
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(prefetch, 1))
+
+        async def produce():
+            offset = 0
+            try:
+                while True:
+                    page = await self._fetch_page(endpoint, {**(params or {}), "limit": page_size, "offset": offset})
+                    if page is None:
+                        logger.error(f"Stopped paging {endpoint} at offset {offset}")
+                        break
+
+                    rows, meta = page
+                    if rows:
+                        await queue.put(rows)
+                    has_more = (meta.get("pagination") or {}).get("hasMore", len(rows) == page_size)
+                    if not rows or not has_more:
+                        break
+                    offset += len(rows)
+            except Exception as e:
+                logger.error(f"Unexpected error paging {endpoint}: {e}")
+            await queue.put(None)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                rows = await queue.get()
+                if rows is None:
+                    break
+                yield rows
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def iter_rows(self, endpoint: str, page_size: int = 500, params: Optional[Dict[str, Any]] = None,
+                        prefetch: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        """Rows of a paginated collection one by one (see iter_pages)"""
+        async for rows in self.iter_pages(endpoint, page_size, params, prefetch):
+            for row in rows:
+                yield row
+
+    async def iter_frames(self, endpoint: str, page_size: int = 5000, params: Optional[Dict[str, Any]] = None,
+                          prefetch: int = 1, columns: Optional[List[str]] = None) -> AsyncIterator[pd.DataFrame]:
+        """Pages of a paginated collection as DataFrames, optionally restricted to ``columns``"""
+        async for rows in self.iter_pages(endpoint, page_size, params, prefetch):
+            yield pd.DataFrame.from_records(rows, columns=columns)
+
+    def _transactions_endpoint(self, user_id: Optional[str], tx_type: Optional[str]):
+        endpoint = f"/api/user/{user_id}/transactions" if user_id else "/api/user/transactions"
+        return endpoint, {"type": tx_type} if tx_type else None
+
+    async def iter_users(self, page_size: int = 500, prefetch: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all users, page by page"""
+        async for user in self.iter_rows("/api/user", page_size, prefetch=prefetch):
+            yield user
+
+    async def iter_transactions(self, user_id: Optional[str] = None, tx_type: Optional[str] = None,
+                                page_size: int = 500, prefetch: int = 1) -> AsyncIterator[Dict[str, Any]]:
+        """Stream transactions (of one user if ``user_id`` is given), newest first"""
+        endpoint, params = self._transactions_endpoint(user_id, tx_type)
+        async for transaction in self.iter_rows(endpoint, page_size, params, prefetch):
+            yield transaction
+
+    async def iter_transaction_frames(self, user_id: Optional[str] = None, tx_type: Optional[str] = None,
+                                      page_size: int = 5000, prefetch: int = 1,
+                                      columns: Optional[List[str]] = None) -> AsyncIterator[pd.DataFrame]:
+        """Stream transactions as columnar chunks (one DataFrame per page)"""
+        endpoint, params = self._transactions_endpoint(user_id, tx_type)
+        async for frame in self.iter_frames(endpoint, page_size, params, prefetch, columns):
+            yield frame
+
+    async def fetch_changes(self, since: int, limit: int = 1000) -> Optional[Dict[str, Any]]:
+        """
+        One page of the backend change log
+
+        Args:
+            since: Sequence number already applied (changes after it are returned)
+            limit: Maximum changes returned
+
+        Returns:
+            'changes' ({seq, collection, op, id, record}, oldest first),
+            'latest_seq' and 'has_more'; None if the feed is unavailable
+        """
+        page = await self._fetch_page(CHANGE_FEED_ENDPOINT, {"since": since, "limit": limit})
+        if page is None:
+            return None
+
+        changes, meta = page
+        return {
+            "changes": changes,
+            "latest_seq": meta.get("latestSeq", changes[-1]["seq"] if changes else since),
+            "has_more": (meta.get("pagination") or {}).get("hasMore", False)
+        }
+
+    async def get_pools_analytics(self, pool_ids: Optional[List[str]] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch analytics for many pools in parallel
+
+        Args:
+            pool_ids: Pools to fetch (defaults to every pool the backend lists)
+
+        Returns:
+            Pool ID -> analytics (None where the request failed)
+        """
+        if pool_ids is None:
+            pool_ids = [pool.get("id") for pool in await self.get_defi_pools() if pool.get("id")]
+
+        analytics = await self.gather_limited(self.get_pool_analytics(pool_id) for pool_id in pool_ids)
+        return dict(zip(pool_ids, analytics))
+
+    async def fetch_startup_data(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fetch games and pools concurrently for model initialization
+
+        Args:
+            timeout: Overall deadline in seconds; fetches still running then
+                are cancelled and return empty lists
+
+        Returns:
+            'games' and 'pools' lists, and 'timed_out' naming the fetches
+            that missed the deadline
+        """
+        tasks = {
+            "games": asyncio.ensure_future(self.get_games()),
+            "pools": asyncio.ensure_future(self.get_defi_pools())
+        }
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        data: Dict[str, Any] = {name: [] if task in pending else task.result() for name, task in tasks.items()}
+        data["timed_out"] = [name for name, task in tasks.items() if task in pending]
+        return data
+
+    async def health_check(self) -> bool:
+        """Check if backend is reachable"""
+        try:
+            response = await self._get_client().get("/health", timeout=3)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+
+class _BackgroundLoop:
+    """Event loop on a daemon thread that runs coroutines for synchronous callers"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="data-fetcher-loop", daemon=True)
+                thread.start()
+                self._loop = loop
+        return self._loop
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine to completion and return its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._start()).result()
+
+
+# Shared by all synchronous fetchers, so their pooled connections stay alive between calls
+_background_loop = _BackgroundLoop()
+
+
+class BackendDataFetcher:
+    """Fetches data from the Lumeris backend API (blocking wrapper around AsyncBackendDataFetcher)"""
+
+    def __init__(self, backend_url: str = DEFAULT_BACKEND_URL, **client_options):
+        """
+        Args:
+            backend_url: Base URL of the backend API
+            client_options: Connection pool settings passed to AsyncBackendDataFetcher
+        """
+        self.backend_url = backend_url
+        self.async_fetcher = AsyncBackendDataFetcher(backend_url, **client_options)
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        return _background_loop.run(coroutine)
+
+    def _make_request(self, endpoint: str) -> Optional[Any]:
+        """Make a GET request to the backend API"""
+        return self._run(self.async_fetcher._make_request(endpoint))
+
+    def get_games(self) -> List[Dict[str, Any]]:
+        """Fetch all games from backend"""
+        return self._run(self.async_fetcher.get_games())
+
     def get_game_by_id(self, game_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific game by ID"""
         return self._make_request(f"/api/gaming/games/{game_id}")
@@ -62,8 +622,7 @@ class BackendDataFetcher:
 
     def get_defi_pools(self) -> List[Dict[str, Any]]:
         """Fetch all DeFi pools from backend"""
-        data = self._make_request("/api/defi/pools")
-        return data if data else []
+        return self._run(self.async_fetcher.get_defi_pools())
 
     def get_defi_pool_by_id(self, pool_id: str) -> Optional[Dict[str, Any]]:
         """Fetch a specific DeFi pool by ID"""
@@ -80,25 +639,146 @@ class BackendDataFetcher:
 
     def get_users(self) -> List[Dict[str, Any]]:
         """Fetch all users"""
-        data = self._make_request("/api/user/users")
-        return data if data else []
+        return self._run(self.async_fetcher.get_users())
+
+    def _iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Drive an async iterator from synchronous code (prefetching continues in the background loop)"""
+
+        async def step():
+            return await iterator.__anext__()
+
+        async def close():
+            await iterator.aclose()
+
+        try:
+            while True:
+                try:
+                    yield self._run(step())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(close())
+
+    def iter_pages(self, endpoint: str, page_size: int = 500, params: Optional[Dict[str, Any]] = None,
+                   prefetch: int = 1) -> Iterator[List[Dict[str, Any]]]:
+        """Pages of a paginated collection (see AsyncBackendDataFetcher.iter_pages)"""
+        return self._iterate(self.async_fetcher.iter_pages(endpoint, page_size, params, prefetch))
+
+    def iter_users(self, page_size: int = 500, prefetch: int = 1) -> Iterator[Dict[str, Any]]:
+        """Stream all users, page by page"""
+        # Rows are handed over a page at a time; crossing threads per row would dominate
+        for rows in self.iter_pages("/api/user", page_size, prefetch=prefetch):
+            yield from rows
+
+    def iter_transactions(self, user_id: Optional[str] = None, tx_type: Optional[str] = None,
+                          page_size: int = 500, prefetch: int = 1) -> Iterator[Dict[str, Any]]:
+        """Stream transactions (of one user if ``user_id`` is given), newest first"""
+        endpoint, params = self.async_fetcher._transactions_endpoint(user_id, tx_type)
+        for rows in self.iter_pages(endpoint, page_size, params, prefetch):
+            yield from rows
+
+    def iter_transaction_frames(self, user_id: Optional[str] = None, tx_type: Optional[str] = None,
+                                page_size: int = 5000, prefetch: int = 1,
+                                columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Stream transactions as columnar chunks (one DataFrame per page)"""
+        return self._iterate(
+            self.async_fetcher.iter_transaction_frames(user_id, tx_type, page_size, prefetch, columns)
+        )
+
+    def fetch_changes(self, since: int, limit: int = 1000) -> Optional[Dict[str, Any]]:
+        """One page of the backend change log (see AsyncBackendDataFetcher.fetch_changes)"""
+        return self._run(self.async_fetcher.fetch_changes(since, limit))
+
+    def get_pools_analytics(self, pool_ids: Optional[List[str]] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch analytics for many pools in parallel"""
+        return self._run(self.async_fetcher.get_pools_analytics(pool_ids))
+
+    def fetch_startup_data(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Fetch games and pools concurrently, within an optional deadline"""
+        return self._run(self.async_fetcher.fetch_startup_data(timeout))
 
     def health_check(self) -> bool:
         """Check if backend is reachable"""
-        try:
-            response = self.session.get(f"{self.backend_url}/health", timeout=3)
-            return response.status_code == 200
-        except:
-            return False
+        return self._run(self.async_fetcher.health_check())
+
+    def close(self):
+        """Close pooled connections"""
+        self._run(self.async_fetcher.aclose())
 
 
-# Singleton instance
+# Singleton instances
 _fetcher_instance = None
+_async_fetcher_instance = None
 
 
-def get_data_fetcher(backend_url: str = "http://localhost:3001") -> BackendDataFetcher:
+def get_data_fetcher(
+    backend_url: str = DEFAULT_BACKEND_URL,
+    snapshot_dir: Optional[str] = DEFAULT_SNAPSHOT_DIR
+) -> BackendDataFetcher:
     """Get or create the data fetcher singleton"""
     global _fetcher_instance
     if _fetcher_instance is None:
-        _fetcher_instance = BackendDataFetcher(backend_url)
+        _fetcher_instance = BackendDataFetcher(backend_url, snapshot_dir=snapshot_dir)
     return _fetcher_instance
+
+
+def get_async_data_fetcher(
+    backend_url: str = DEFAULT_BACKEND_URL,
+    snapshot_dir: Optional[str] = DEFAULT_SNAPSHOT_DIR
+) -> AsyncBackendDataFetcher:
+    """Get or create the async data fetcher singleton (for use inside the API event loop)"""
+    global _async_fetcher_instance
+    if _async_fetcher_instance is None:
+        _async_fetcher_instance = AsyncBackendDataFetcher(backend_url, snapshot_dir=snapshot_dir)
+    return _async_fetcher_instance
+
+
+# Smoke test against the local stub backend
+if __name__ == "__main__":
+    import shutil
+    import tempfile
+    from lumeris_ml_backend.stub_backend import StubBackend
+
+    with StubBackend(latency=0.05) as stub:
+        fetcher = BackendDataFetcher(stub.url)
+        print(f"Health: {fetcher.health_check()}")
+
+        start = time.perf_counter()
+        data = fetcher.fetch_startup_data()
+        print(f"Fetched {len(data['games'])} games and {len(data['pools'])} pools "
+              f"in {time.perf_counter() - start:.3f}s")
+
+        start = time.perf_counter()
+        analytics = fetcher.get_pools_analytics()
+        print(f"Fetched analytics for {len(analytics)} pools in {time.perf_counter() - start:.3f}s "
+              f"({stub.latency:.2f}s per request)")
+        print(f"Requests: {stub.request_count}, TCP connections: {stub.connection_count}")
+
+        # Paged, incrementally parsed transactions in columnar chunks
+        frames = list(fetcher.iter_transaction_frames(page_size=20, columns=["userId", "type", "amount"]))
+        print(f"Streamed {sum(len(frame) for frame in frames)} transactions in {len(frames)} pages")
+        fetcher.close()
+
+        # Snapshots: the first fetch downloads, stale snapshots are revalidated (304)
+        snapshot_dir = tempfile.mkdtemp()
+        fetcher = BackendDataFetcher(stub.url, snapshot_dir=snapshot_dir, snapshot_ttl=0)
+        fetcher.get_games()
+        sent = stub.bytes_sent
+        fetcher.get_games()
+        print(f"Revalidation: {stub.not_modified_count} x 304, {stub.bytes_sent - sent} bytes transferred")
+        fetcher.close()
+
+    # Backend down: the last good snapshot is served
+    print(f"Backend down: {len(fetcher.get_games())} games from snapshot, "
+          f"cache: { {k: v for k, v in fetcher.async_fetcher.snapshots.stats().items() if k != 'snapshots'} }")
+    shutil.rmtree(snapshot_dir)
+
+    # Without snapshots the circuit opens after a few failed attempts and later calls fail fast
+    fetcher = BackendDataFetcher(stub.url)
+    start = time.perf_counter()
+    data = fetcher.fetch_startup_data(timeout=5.0)
+    print(f"Backend down: startup fetch gave up in {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    fetcher.get_users()
+    print(f"Next request failed fast in {(time.perf_counter() - start) * 1000:.2f}ms, "
+          f"circuit: {fetcher.async_fetcher.circuit_breaker.stats()}")
@@ -5,56 +5,299 @@ Predicts price trends, APY changes, and liquidity movements for DeFi pools
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
+from sklearn.ensemble import (
+    RandomForestRegressor,
+    GradientBoostingClassifier,
+    HistGradientBoostingClassifier,
+)
 from sklearn.preprocessing import StandardScaler
 import joblib
-from typing import Dict, List, Any
+import threading
+import time
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from .data_fetcher import get_data_fetcher
+from .forecast_engine import MonteCarloForecaster
+from .market_store import MarketDataStore
+from .model_artifacts import ModelArtifact, is_artifact, write_artifact
+from .cache import LRUCache
+
+# Model inputs, in the order the scaler and estimators expect them
+FEATURE_COLUMNS = [
+    'price', 'tvl', 'volume_24h', 'apy', 'sma_7', 'momentum',
+    'volume_tvl_ratio', 'volatility', 'price_lag1', 'volume_24h_lag1'
+]
+
+# Default estimator settings for the price and trend models
+PRICE_MODEL_PARAMS = {"n_estimators": 100, "max_depth": 10, "random_state": 42}
+TREND_MODEL_PARAMS = {"n_estimators": 100, "max_depth": 5, "random_state": 42}
+HIST_TREND_MODEL_PARAMS = {
+    "max_iter": 200,
+    "max_depth": 5,
+    "learning_rate": 0.1,
+    "early_stopping": True,
+    "validation_fraction": 0.1,
+    "n_iter_no_change": 10,
+    "random_state": 42
+}
+
+# Available trend classifier implementations
+TREND_BACKENDS = ('gradient_boosting', 'hist_gradient_boosting')
+
+# Trees/iterations added per step when training under a time budget
+BUDGET_STEP = 10
+
+# Bump when FEATURE_COLUMNS or their construction changes, so cached
+# predictions computed from the old features are never served
+FEATURE_VERSION = 1
+
+# Relative next-day price change that separates up/down from stable
+TREND_THRESHOLD = 0.02
+
+
+def prepare_training_frame(history: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add lagged features and next-day targets to historical pool data
+
+    Lags and targets are computed per pool, so rows from different pools
+    never leak into each other. Rows without a lagged value are dropped;
+    the last row of each pool keeps a NaN ``next_price``.
+
+    Args:
+        history: Historical rows as produced by ``_generate_historical_data``
+
+    Returns:
+        Copy of the data with ``price_lag1``, ``volume_24h_lag1``,
+        ``next_price`` and ``trend`` columns
+    """
+
+    df = history.sort_values(['pool_id', 'date'], kind='stable').copy()
+    grouped = df.groupby('pool_id', sort=False)
+
+    df['price_lag1'] = grouped['price'].shift(1)
+    df['volume_24h_lag1'] = grouped['volume_24h'].shift(1)
+    df['next_price'] = grouped['price'].shift(-1)
+
+    # Trend direction (classification: up/down/stable)
+    change = (df['next_price'] - df['price']) / df['price']
+    df['trend'] = np.select(
+        [change > TREND_THRESHOLD, change < -TREND_THRESHOLD],
+        ['up', 'down'],
+        default='stable'
+    )
+
+    return df.dropna(subset=['price_lag1', 'volume_24h_lag1'])
+
+
+def _fit_forest(
+    X: np.ndarray, y: np.ndarray, n_jobs: Optional[int], deadline: Optional[float]
+) -> Tuple[RandomForestRegressor, bool]:
+    """Fit the price forest, growing it in steps until done or out of time"""
+
+    if deadline is None:
+        model = RandomForestRegressor(**PRICE_MODEL_PARAMS, n_jobs=n_jobs)
+        return model.fit(X, y), False
+
+    target = PRICE_MODEL_PARAMS['n_estimators']
+    model = RandomForestRegressor(
+        **{**PRICE_MODEL_PARAMS, 'n_estimators': min(BUDGET_STEP, target)},
+        n_jobs=n_jobs,
+        warm_start=True
+    )
+    model.fit(X, y)
+    while model.n_estimators < target and time.perf_counter() < deadline:
+        model.n_estimators = min(model.n_estimators + BUDGET_STEP, target)
+        model.fit(X, y)
+
+    return model, model.n_estimators < target
+
+
+def _fit_trend_classifier(
+    X: np.ndarray, y: np.ndarray, backend: str, deadline: Optional[float]
+) -> Tuple[Any, bool]:
+    """Fit the trend classifier with the selected backend"""
+
+    if backend == 'gradient_boosting':
+        model = GradientBoostingClassifier(**TREND_MODEL_PARAMS)
+        if deadline is None:
+            return model.fit(X, y), False
+
+        # Stop adding stages once the budget is spent (always keep one)
+        model.fit(X, y, monitor=lambda i, est, env: i > 0 and time.perf_counter() >= deadline)
+        return model, model.n_estimators_ < TREND_MODEL_PARAMS['n_estimators']
+
+    params = dict(HIST_TREND_MODEL_PARAMS)
+
+    # The stratified validation split needs at least two samples per class
+    _, class_counts = np.unique(y, return_counts=True)
+    if class_counts.min() < 2 or len(y) * params['validation_fraction'] < len(class_counts):
+        params['early_stopping'] = False
+
+    if deadline is None:
+        return HistGradientBoostingClassifier(**params).fit(X, y), False
+
+    target = params['max_iter']
+    model = HistGradientBoostingClassifier(
+        **{**params, 'max_iter': min(BUDGET_STEP, target)},
+        warm_start=True
+    )
+    model.fit(X, y)
+    while model.max_iter < target and model.n_iter_ == model.max_iter:
+        # n_iter_ below max_iter means early stopping has already kicked in
+        if time.perf_counter() >= deadline:
+            return model, True
+        model.max_iter = min(model.max_iter + BUDGET_STEP, target)
+        model.fit(X, y)
+
+    return model, False
+
+
+def fit_models(
+    X: np.ndarray,
+    y_price: np.ndarray,
+    y_trend: np.ndarray,
+    trend_backend: str = 'gradient_boosting',
+    n_jobs: Optional[int] = -1,
+    time_budget: Optional[float] = None,
+) -> Tuple[RandomForestRegressor, Any, Dict[str, Any]]:
+    """
+    Fit the price regressor and trend classifier
+
+    Args:
+        X: Scaled feature matrix
+        y_price: Next-day prices
+        y_trend: Next-day trend labels
+        trend_backend: One of ``TREND_BACKENDS``
+        n_jobs: Parallel jobs for the random forest (-1 uses every core)
+        time_budget: Seconds allowed for both fits; half goes to the forest,
+            the classifier gets whatever is left. None trains to completion.
+
+    Returns:
+        Price model, trend classifier and a training report
+    """
+
+    if trend_backend not in TREND_BACKENDS:
+        raise ValueError(f"Unknown trend backend '{trend_backend}', expected one of {TREND_BACKENDS}")
+
+    start = time.perf_counter()
+    deadline = start + time_budget if time_budget is not None else None
+
+    price_deadline = start + time_budget / 2 if time_budget is not None else None
+    price_model, price_cut = _fit_forest(X, y_price, n_jobs, price_deadline)
+    price_seconds = time.perf_counter() - start
+
+    # Serving predicts a handful of rows, where thread fan-out only adds latency
+    price_model.n_jobs = None
+
+    trend_start = time.perf_counter()
+    trend_classifier, trend_cut = _fit_trend_classifier(X, y_trend, trend_backend, deadline)
+    trend_seconds = time.perf_counter() - trend_start
+
+    if trend_backend == 'gradient_boosting':
+        trend_iterations = int(trend_classifier.n_estimators_)
+    else:
+        trend_iterations = int(trend_classifier.n_iter_)
+
+    report = {
+        "trend_backend": trend_backend,
+        "n_jobs": n_jobs,
+        "time_budget": time_budget,
+        "samples": int(len(X)),
+        "price_trees": len(price_model.estimators_),
+        "trend_iterations": trend_iterations,
+        "price_seconds": price_seconds,
+        "trend_seconds": trend_seconds,
+        "total_seconds": time.perf_counter() - start,
+        # True when the budget, not the configured size, ended training
+        "budget_exhausted": price_cut or trend_cut
+    }
+
+    return price_model, trend_classifier, report
 
 
 class DeFiPredictor:
     """Predictive model for DeFi market trends"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        trend_backend: str = 'gradient_boosting',
+        n_jobs: Optional[int] = -1,
+        training_time_budget: Optional[float] = None,
+        market_store: Optional[MarketDataStore] = None,
+        training_window_days: Optional[int] = None,
+        prediction_cache_size: int = 256
+    ):
+        """
+        Args:
+            trend_backend: Trend classifier implementation, one of ``TREND_BACKENDS``
+            n_jobs: Parallel jobs for the price forest (-1 uses every core)
+            training_time_budget: Seconds allowed for training both models
+            market_store: On-disk history store; when set, history is read
+                from it window by window instead of being held in memory
+            training_window_days: Most recent days per pool used for training
+                (None trains on the full history)
+            prediction_cache_size: Predictions kept in the LRU cache (0 disables it)
+        """
+        if trend_backend not in TREND_BACKENDS:
+            raise ValueError(f"Unknown trend backend '{trend_backend}', expected one of {TREND_BACKENDS}")
+
         self.price_model = None
         self.trend_classifier = None
         self.scaler = StandardScaler()
         self.pools_data = {}
+        self.forecaster = MonteCarloForecaster()
+        self.trend_backend = trend_backend
+        self.n_jobs = n_jobs
+        self.training_time_budget = training_time_budget
+        self.training_report = {}
+        self.market_store = market_store
+        self.training_window_days = training_window_days
+        self.historical_data = None
+
+        # Predictions are cached per (pool, horizon, feature/model/data version)
+        self.prediction_cache = LRUCache(prediction_cache_size)
+        self.model_version = 0
+        self.data_versions: Dict[str, int] = {}
+
+        # Held while state is replaced, so snapshots never see a half-updated model
+        self._state_lock = threading.RLock()
+
+        # Called with the changed pool IDs (None for all) after ticks, pool changes or retraining
+        self._listeners: List[Callable[[Optional[Set[str]]], None]] = []
+
+    def add_listener(self, callback: Callable[[Optional[Set[str]]], None]):
+        """
+        Get notified when predictions may have changed
 
-    def initialize_with_mock_data(self):
-        """Initialize with DeFi pool data from the backend API"""
+        Args:
+            callback: Called with the affected pool IDs, or None when every
+                pool is affected (retraining, loading); it may run on any
+                thread and must not block
+        """
+        self._listeners.append(callback)
 
-        fetcher = get_data_fetcher()
+    def _notify(self, pool_ids: Optional[Set[str]]):
+        for callback in self._listeners:
+            try:
+                callback(pool_ids)
+            except Exception as e:
+                print(f"Prediction listener failed: {e}")
+
+    def initialize_with_mock_data(self, backend_pools: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize with DeFi pool data from the backend API
+
+        Args:
+            backend_pools: Pools already fetched from the backend (fetched here if None)
+        """
 
         # Try to fetch real data from backend
-        backend_pools = fetcher.get_defi_pools()
+        if backend_pools is None:
+            backend_pools = get_data_fetcher().get_defi_pools()
 
         if backend_pools:
             # Transform backend data to match our model format
-            self.pools = []
-            for pool in backend_pools:
-                # Extract tokens from pair
-                tokens = pool.get("pair", "/").split("/")
-                token_a = tokens[0] if len(tokens) > 0 else "TOKEN_A"
-                token_b = tokens[1] if len(tokens) > 1 else "TOKEN_B"
-
-                # Estimate current price based on TVL and volume
-                tvl = pool.get("tvl", 0)
-                volume = pool.get("volume24h", 0)
-                price = self._estimate_price(token_a, tvl, volume)
-
-                self.pools.append({
-                    "id": pool.get("id", ""),
-                    "name": pool.get("pair", ""),
-                    "token_a": token_a,
-                    "token_b": token_b,
-                    "current_price": price,
-                    "tvl": tvl,
-                    "volume_24h": volume,
-                    "apy": pool.get("apy", 0),
-                    "fee_tier": pool.get("fees", 0.3)
-                })
+            self.pools = [self._pool_from_backend(pool) for pool in backend_pools]
             print(f"Loaded {len(self.pools)} DeFi pools from backend API")
         else:
             # Fallback to mock data if backend is unavailable
@@ -106,14 +349,97 @@ class DeFiPredictor:
                 }
             ]
 
-        # Generate historical data (simulated)
-        self.historical_data = self._generate_historical_data()
+        # Generate historical data (simulated) for pools without stored history
+        if self.market_store is not None:
+            stored = set(self.market_store.pool_ids())
+            missing = [pool for pool in self.pools if pool['id'] not in stored]
+            if missing:
+                self.market_store.append(self._generate_historical_data(pools=missing))
+        else:
+            self.historical_data = self._generate_historical_data()
 
         # Train models
         self._train_models()
 
         print("DeFi Predictor initialized with data")
 
+    def _pool_from_backend(self, pool: Dict[str, Any]) -> Dict[str, Any]:
+        """Transform a backend pool to our model format"""
+
+        # Extract tokens from pair
+        tokens = pool.get("pair", "/").split("/")
+        token_a = tokens[0] if len(tokens) > 0 else "TOKEN_A"
+        token_b = tokens[1] if len(tokens) > 1 else "TOKEN_B"
+
+        # Estimate current price based on TVL and volume
+        tvl = pool.get("tvl", 0)
+        volume = pool.get("volume24h", 0)
+        price = self._estimate_price(token_a, tvl, volume)
+
+        return {
+            "id": pool.get("id", ""),
+            "name": pool.get("pair", ""),
+            "token_a": token_a,
+            "token_b": token_b,
+            "current_price": price,
+            "tvl": tvl,
+            "volume_24h": volume,
+            "apy": pool.get("apy", 0),
+            "fee_tier": pool.get("fees", 0.3)
+        }
+
+    def apply_pool_changes(self, upserts: List[Dict[str, Any]], deleted_ids: List[str]) -> Dict[str, int]:
+        """
+        Apply created, updated and deleted backend pools without retraining
+
+        New pools get simulated history so they can be predicted right away;
+        only the predictions cached for changed pools are invalidated.
+
+        Args:
+            upserts: Created or updated pools in backend format
+            deleted_ids: IDs of deleted pools
+
+        Returns:
+            Number of pools added, updated and removed
+        """
+
+        with self._state_lock:
+            pools = {pool['id']: pool for pool in self.pools}
+            removed = {pool_id for pool_id in deleted_ids if pool_id in pools}
+            for pool_id in removed:
+                del pools[pool_id]
+
+            added = []
+            n_updated = 0
+            changed = set(removed)
+            for backend_pool in upserts:
+                pool = self._pool_from_backend(backend_pool)
+                changed.add(pool['id'])
+                if pool['id'] in pools:
+                    n_updated += 1
+                else:
+                    added.append(pool)
+                pools[pool['id']] = pool
+
+            if added:
+                new_history = self._generate_historical_data(pools=added)
+                if self.market_store is not None:
+                    self.market_store.append(new_history)
+                else:
+                    self.historical_data = pd.concat([self.historical_data, new_history], ignore_index=True)
+            if removed and self.market_store is None:
+                self.historical_data = self.historical_data[~self.historical_data['pool_id'].isin(removed)]
+
+            self.pools = list(pools.values())
+
+            # Changed pools get a new data version so their cached predictions are dropped
+            for pool_id in changed:
+                self.data_versions[pool_id] = self.data_versions.get(pool_id, 0) + 1
+            self.prediction_cache.invalidate(lambda key: key[0] in changed)
+
+        self._notify(changed)
+        return {"added": len(added), "updated": n_updated, "removed": len(removed)}
+
     def _estimate_price(self, token: str, tvl: float, volume: float) -> float:
         """Estimate token price based on TVL and volume"""
         # Rough estimation based on token type
@@ -140,13 +466,15 @@ class DeFiPredictor:
         else:
             return 1.0
 
-    def _generate_historical_data(self, days: int = 30) -> pd.DataFrame:
+    def _generate_historical_data(
+        self, days: int = 30, pools: Optional[List[Dict[str, Any]]] = None
+    ) -> pd.DataFrame:
         """Generate simulated historical price and metrics data"""
 
         data = []
         base_date = datetime.now() - timedelta(days=days)
 
-        for pool in self.pools:
+        for pool in (pools if pools is not None else self.pools):
             pool_id = pool['id']
             base_price = pool['current_price']
             base_tvl = pool['tvl']
@@ -205,72 +533,122 @@ class DeFiPredictor:
 
         return pd.DataFrame(data)
 
-    def _train_models(self):
-        """Train prediction models on historical data"""
-
-        df = self.historical_data.copy()
-
-        # Prepare features
-        feature_columns = ['price', 'tvl', 'volume_24h', 'apy', 'sma_7', 'momentum', 'volume_tvl_ratio', 'volatility']
+    def get_history(
+        self,
+        pool_id: Optional[str] = None,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        last_days: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Read historical rows, from the market store when one is attached
 
-        # Add lagged features (t-1)
-        for pool_id in df['pool_id'].unique():
-            pool_mask = df['pool_id'] == pool_id
-            pool_df = df[pool_mask].copy()
+        Args:
+            pool_id: Pool to read (None reads every pool)
+            start: Inclusive lower date bound
+            end: Inclusive upper date bound
+            last_days: Keep only the latest N rows per pool (applied after
+                the date bounds)
 
-            for col in ['price', 'volume_24h']:
-                df.loc[pool_mask, f'{col}_lag1'] = pool_df[col].shift(1)
+        Returns:
+            Historical rows ordered by pool and date
+        """
 
-        df = df.dropna()  # Remove rows with NaN
+        pool_ids = [pool_id] if pool_id is not None else [pool['id'] for pool in self.pools]
 
-        feature_columns.extend(['price_lag1', 'volume_24h_lag1'])
+        if self.market_store is not None:
+            frames = []
+            for pid in pool_ids:
+                if last_days is not None and start is None and end is None:
+                    frames.append(self.market_store.tail(pid, last_days))
+                else:
+                    frame = self.market_store.read_range(pid, start, end)
+                    frames.append(frame.tail(last_days) if last_days is not None else frame)
+            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+        df = self.historical_data[self.historical_data['pool_id'].isin(pool_ids)]
+        if start is not None:
+            df = df[df['date'] >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df['date'] <= pd.Timestamp(end)]
+        if last_days is not None:
+            df = df.groupby('pool_id', sort=False).tail(last_days)
+        return df
+
+    def append_history(self, rows: pd.DataFrame):
+        """Add new daily rows (ticks) to the history"""
+        updated = set(rows['pool_id'].astype(str))
+
+        # Under the state lock so snapshots and concurrent appends see either
+        # all of the new ticks or none of them
+        with self._state_lock:
+            if self.market_store is not None:
+                self.market_store.append(rows)
+            else:
+                self.historical_data = pd.concat([self.historical_data, rows], ignore_index=True)
+
+            # New ticks make cached predictions for these pools stale
+            for pool_id in updated:
+                self.data_versions[pool_id] = self.data_versions.get(pool_id, 0) + 1
+            self.prediction_cache.invalidate(lambda key: key[0] in updated)
+
+        self._notify(updated)
+
+    def _cache_key(self, pool_id: str, days_ahead: int) -> tuple:
+        return (
+            pool_id,
+            days_ahead,
+            FEATURE_VERSION,
+            self.model_version,
+            self.data_versions.get(pool_id, 0)
+        )
 
-        X = df[feature_columns].values
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Prediction cache hit ratio and latency savings"""
+        return {
+            **self.prediction_cache.stats(),
+            "feature_version": FEATURE_VERSION,
+            "model_version": self.model_version
+        }
 
-        # Target 1: Next day price (regression)
-        y_price = df.groupby('pool_id')['price'].shift(-1)
+    def _train_models(self):
+        """Train prediction models on historical data"""
 
-        # Target 2: Trend direction (classification: up/down/stable)
-        def classify_trend(row):
-            future_price = df[(df['pool_id'] == row['pool_id']) & (df['date'] > row['date'])].head(1)
-            if future_price.empty:
-                return 'stable'
-            future_val = future_price['price'].values[0]
-            change = (future_val - row['price']) / row['price']
-            if change > 0.02:
-                return 'up'
-            elif change < -0.02:
-                return 'down'
-            else:
-                return 'stable'
+        # One extra day per pool is consumed by the lagged features
+        window = self.training_window_days + 1 if self.training_window_days else None
+        df = prepare_training_frame(self.get_history(last_days=window))
 
-        y_trend = df.apply(classify_trend, axis=1)
+        # Only rows with a known next-day price can be used as targets
+        df = df.dropna(subset=['next_price'])
 
-        # Remove last row (no future data)
-        X = X[:-len(self.pools)]
-        y_price_clean = y_price.dropna().values
-        y_trend_clean = y_trend[:-len(self.pools)].values
+        X = df[FEATURE_COLUMNS].values
 
-        # Normalize features
-        X_scaled = self.scaler.fit_transform(X)
+        # Normalize features (a new scaler, so the serving one is never half-fitted)
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
 
-        # Train price prediction model (Random Forest Regressor)
-        self.price_model = RandomForestRegressor(
-            n_estimators=100,
-            max_depth=10,
-            random_state=42
+        # Train price (Random Forest) and trend (Gradient Boosting) models
+        price_model, trend_classifier, training_report = fit_models(
+            X_scaled,
+            df['next_price'].values,
+            df['trend'].values,
+            trend_backend=self.trend_backend,
+            n_jobs=self.n_jobs,
+            time_budget=self.training_time_budget
         )
-        self.price_model.fit(X_scaled, y_price_clean)
 
-        # Train trend classification model (Gradient Boosting)
-        self.trend_classifier = GradientBoostingClassifier(
-            n_estimators=100,
-            max_depth=5,
-            random_state=42
-        )
-        self.trend_classifier.fit(X_scaled, y_trend_clean)
+        with self._state_lock:
+            self.scaler = scaler
+            self.price_model = price_model
+            self.trend_classifier = trend_classifier
+            self.training_report = training_report
 
-        print(f"Models trained on {len(X)} samples")
+            # Predictions from the previous models must not be served any more
+            self.model_version += 1
+            self.prediction_cache.invalidate()
+        self._notify(None)
+
+        print(f"Models trained on {len(X)} samples in {self.training_report['total_seconds']:.2f}s")
 
     def predict_pool_trend(self, pool_id: str, days_ahead: int = 7) -> Dict[str, Any]:
         """
@@ -288,12 +666,36 @@ class DeFiPredictor:
         if not pool:
             return {"error": "Pool not found"}
 
-        # Get latest data for this pool
-        latest_data = self.historical_data[
-            self.historical_data['pool_id'] == pool_id
-        ].iloc[-1]
+        return self._predict_pools([pool], days_ahead)[0]
+
+    def _latest_data(self, pool_id: str) -> pd.Series:
+        """Most recent historical row for a pool"""
+        return self.get_history(pool_id, last_days=1).iloc[-1]
+
+    def _predict_pools(self, pools: List[Dict[str, Any]], days_ahead: int) -> List[Dict[str, Any]]:
+        """Serve cached predictions and compute the missing ones in one batch"""
+
+        keys = [self._cache_key(pool['id'], days_ahead) for pool in pools]
+        predictions = [self.prediction_cache.get(key) for key in keys]
+
+        missing = [i for i, prediction in enumerate(predictions) if prediction is None]
+        if missing:
+            start = time.perf_counter()
+            computed = self._compute_predictions([pools[i] for i in missing], days_ahead)
+            cost = (time.perf_counter() - start) / len(missing)
+
+            for i, prediction in zip(missing, computed):
+                self.prediction_cache.put(keys[i], prediction, cost)
+                predictions[i] = prediction
+
+        return predictions
+
+    def _compute_predictions(self, pools: List[Dict[str, Any]], days_ahead: int) -> List[Dict[str, Any]]:
+        """Run the models and the forecast engine for several pools in one pass"""
 
-        # Prepare features
+        latest_rows = [self._latest_data(pool['id']) for pool in pools]
+
+        # Prepare features (lag1 falls back to the latest values)
         features = np.array([[
             latest_data['price'],
             latest_data['tvl'],
@@ -305,75 +707,74 @@ class DeFiPredictor:
             latest_data['volatility'],
             latest_data['price'],  # lag1
             latest_data['volume_24h']  # lag1
-        ]])
+        ] for latest_data in latest_rows])
 
         features_scaled = self.scaler.transform(features)
 
-        # Predict price
-        predicted_price = self.price_model.predict(features_scaled)[0]
-        price_change_pct = ((predicted_price - latest_data['price']) / latest_data['price']) * 100
-
-        # Predict trend
-        trend_proba = self.trend_classifier.predict_proba(features_scaled)[0]
+        # Predict price and trend for every pool at once
+        predicted_prices = self.price_model.predict(features_scaled)
+        trend_probas = self.trend_classifier.predict_proba(features_scaled)
         trend_classes = self.trend_classifier.classes_
-        trend_prediction = trend_classes[np.argmax(trend_proba)]
-        trend_confidence = np.max(trend_proba)
-
-        # Generate multi-day forecast
-        forecast = self._generate_forecast(latest_data, days_ahead)
 
-        # Calculate risk metrics
-        risk_score = self._calculate_risk_score(latest_data, trend_prediction)
+        # Generate multi-day forecasts in a single simulation
+        forecasts = self._generate_forecasts(latest_rows, days_ahead)
 
-        # Generate trading signals
-        signals = self._generate_trading_signals(
-            latest_data, predicted_price, trend_prediction, risk_score
-        )
+        predictions = []
+        for pool, latest_data, predicted_price, trend_proba, forecast in zip(
+            pools, latest_rows, predicted_prices, trend_probas, forecasts
+        ):
+            price_change_pct = ((predicted_price - latest_data['price']) / latest_data['price']) * 100
+            trend_prediction = trend_classes[np.argmax(trend_proba)]
+            trend_confidence = np.max(trend_proba)
+
+            # Calculate risk metrics
+            risk_score = self._calculate_risk_score(latest_data, trend_prediction)
+
+            # Generate trading signals
+            signals = self._generate_trading_signals(
+                latest_data, predicted_price, trend_prediction, risk_score
+            )
+
+            predictions.append({
+                "pool_id": pool['id'],
+                "pool_name": pool['name'],
+                "current_price": float(latest_data['price']),
+                "predicted_price": float(predicted_price),
+                "price_change_pct": float(price_change_pct),
+                "trend": trend_prediction,
+                "trend_confidence": float(trend_confidence),
+                "trend_probabilities": {
+                    trend_classes[i]: float(trend_proba[i])
+                    for i in range(len(trend_classes))
+                },
+                "forecast": forecast,
+                "risk_score": risk_score,
+                "trading_signals": signals,
+                "timestamp": datetime.now().isoformat()
+            })
 
-        return {
-            "pool_id": pool_id,
-            "pool_name": pool['name'],
-            "current_price": float(latest_data['price']),
-            "predicted_price": float(predicted_price),
-            "price_change_pct": float(price_change_pct),
-            "trend": trend_prediction,
-            "trend_confidence": float(trend_confidence),
-            "trend_probabilities": {
-                trend_classes[i]: float(trend_proba[i])
-                for i in range(len(trend_classes))
-            },
-            "forecast": forecast,
-            "risk_score": risk_score,
-            "trading_signals": signals,
-            "timestamp": datetime.now().isoformat()
-        }
+        return predictions
 
-    def _generate_forecast(self, latest_data: pd.Series, days: int) -> List[Dict[str, float]]:
+    def _generate_forecast(self, latest_data: pd.Series, days: int) -> List[Dict[str, Any]]:
         """Generate multi-day price forecast"""
-
-        forecast = []
-        current_price = latest_data['price']
-
-        for day in range(1, days + 1):
-            # Simple forecast with decreasing confidence
-            confidence = max(0.5, 1.0 - (day * 0.1))
-
-            # Extrapolate based on momentum
-            momentum = latest_data['momentum']
-            predicted_change = momentum * day * 0.5  # Dampened momentum
-
-            # Add some noise
-            noise = np.random.normal(0, 0.01 * day)
-
-            predicted_price = current_price * (1 + predicted_change + noise)
-
-            forecast.append({
-                "day": day,
-                "predicted_price": float(predicted_price),
-                "confidence": float(confidence)
+        return self._generate_forecasts([latest_data], days)[0]
+
+    def _generate_forecasts(self, latest_rows: List[pd.Series], days: int) -> List[List[Dict[str, Any]]]:
+        """Generate Monte-Carlo forecast bands for several pools at once"""
+
+        specs = []
+        for latest_data in latest_rows:
+            history = self.get_history(
+                latest_data['pool_id'], last_days=self.forecaster.lookback_days + 1
+            )['price'].values
+            specs.append({
+                "key": latest_data['pool_id'],
+                "price": latest_data['price'],
+                "momentum": latest_data['momentum'],
+                "history": history
             })
 
-        return forecast
+        return self.forecaster.forecast_batch(specs, days)
 
     def _calculate_risk_score(self, data: pd.Series, trend: str) -> Dict[str, Any]:
         """Calculate risk metrics for the pool"""
@@ -465,36 +866,86 @@ class DeFiPredictor:
             "confidence": 0.5
         }]
 
-    def predict_all_pools(self) -> List[Dict[str, Any]]:
+    def predict_all_pools(self, days_ahead: int = 7) -> List[Dict[str, Any]]:
         """Get predictions for all pools"""
+        return self._predict_pools(self.pools, days_ahead)
 
-        predictions = []
-        for pool in self.pools:
-            pred = self.predict_pool_trend(pool['id'])
-            predictions.append(pred)
+    def predict_pools(self, pool_ids: Set[str], days_ahead: int = 7) -> Dict[str, Dict[str, Any]]:
+        """Predictions for the given pools, keyed by pool ID (unknown pools are left out)"""
+        pools = [pool for pool in self.pools if pool['id'] in pool_ids]
+        return {pool['id']: prediction for pool, prediction in zip(pools, self._predict_pools(pools, days_ahead))}
 
-        return predictions
+    def capture_artifact(self) -> Dict[str, Any]:
+        """
+        Consistent view of the model state, as ``write_artifact`` arguments
+
+        Nothing is copied: retraining and updates replace the estimators
+        and the history instead of modifying them.
+        """
+        with self._state_lock:
+            metadata = {'pools': list(self.pools)}
+            frames = {}
+
+            # History in a market store stays there; only its location is saved
+            if self.market_store is not None:
+                metadata['market_store'] = self.market_store.root
+            else:
+                frames['historical_data'] = self.historical_data
+
+            return {
+                'kind': "defi_predictor",
+                'metadata': metadata,
+                'frames': frames,
+                'objects': {
+                    'price_model': self.price_model,
+                    'trend_classifier': self.trend_classifier,
+                    'scaler': self.scaler
+                }
+            }
 
     def save_model(self, filepath: str):
-        """Save models to disk"""
-        model_data = {
-            'price_model': self.price_model,
-            'trend_classifier': self.trend_classifier,
-            'scaler': self.scaler,
-            'pools': self.pools,
-            'historical_data': self.historical_data
-        }
-        joblib.dump(model_data, filepath)
+        """
+        Save models to disk as an artifact directory
+
+        In-memory history is stored column by column; the estimators are
+        stored uncompressed so their arrays can be memory-mapped on load.
+        """
+        write_artifact(filepath, **self.capture_artifact())
         print(f"Models saved to {filepath}")
 
-    def load_model(self, filepath: str):
-        """Load models from disk"""
-        model_data = joblib.load(filepath)
-        self.price_model = model_data['price_model']
-        self.trend_classifier = model_data['trend_classifier']
-        self.scaler = model_data['scaler']
-        self.pools = model_data['pools']
-        self.historical_data = model_data['historical_data']
+    def load_model(self, filepath: str, verify: bool = False):
+        """
+        Load models from disk
+
+        Args:
+            filepath: Artifact directory (or legacy .pkl file)
+            verify: Check the SHA-256 of every file before loading
+        """
+        if is_artifact(filepath):
+            artifact = ModelArtifact(filepath, kind="defi_predictor", verify=verify)
+            model_data = {
+                **artifact.metadata,
+                **{name: artifact.object(name) for name in ('price_model', 'trend_classifier', 'scaler')}
+            }
+            if artifact.has('historical_data'):
+                model_data['historical_data'] = artifact.frame('historical_data')
+        else:
+            model_data = joblib.load(filepath)
+
+        with self._state_lock:
+            self.price_model = model_data['price_model']
+            self.trend_classifier = model_data['trend_classifier']
+            self.scaler = model_data['scaler']
+            self.pools = model_data['pools']
+            self.model_version += 1
+            self.prediction_cache.invalidate()
+            if 'market_store' in model_data:
+                self.market_store = MarketDataStore(model_data['market_store'])
+                self.historical_data = None
+            else:
+                self.market_store = None
+                self.historical_data = model_data['historical_data']
+        self._notify(None)
         print(f"Models loaded from {filepath}")
 
 
@@ -513,4 +964,4 @@ if __name__ == "__main__":
     print(f"  Signals: {len(result['trading_signals'])} signals generated")
 
     # Save model
-    predictor.save_model("models/defi_predictor.pkl")
+    predictor.save_model("models/defi_predictor")
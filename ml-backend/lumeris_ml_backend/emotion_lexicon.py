@@ -0,0 +1,96 @@
+"""
+Emotion Lexicon Matcher
+Finds every emotion keyword of a lexicon in one pass over a comment's
+tokens, so matching cost does not grow with the size of the lexicon
+"""
+
+import csv
+import json
+import os
+import re
+from typing import Dict, List, Tuple
+
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(__file__), "data", "emotion_lexicon.json")
+
+# Words, allowing inner hyphens and apostrophes ("non-existent", "don't")
+TOKEN_PATTERN = re.compile(r"\w+(?:[-']\w+)*")
+
+
+def _tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class EmotionLexicon:
+    """Token-boundary keyword matcher compiled from an emotion -> terms lexicon"""
+
+    def __init__(self, lexicon: Dict[str, List[str]]):
+        """
+        Args:
+            lexicon: Emotion name -> keywords. Keywords may span several
+                words ("rug pull"); matching is case-insensitive and only
+                on whole tokens, so "bad" does not fire on "badge".
+        """
+        self.emotions = list(lexicon.keys())
+
+        # Term (as a token tuple) -> emotions it signals
+        self._terms: Dict[Tuple[str, ...], List[str]] = {}
+        self._term_counts: Dict[str, int] = {}
+
+        for emotion, keywords in lexicon.items():
+            unique = {tuple(_tokenize(keyword)) for keyword in keywords}
+            unique.discard(())
+            self._term_counts[emotion] = len(unique)
+            for term in unique:
+                self._terms.setdefault(term, []).append(emotion)
+
+        self.max_term_length = max((len(term) for term in self._terms), default=1)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_LEXICON_PATH) -> "EmotionLexicon":
+        """
+        Load a lexicon from JSON (``{"emotion": ["term", ...]}``) or from
+        CSV/TSV rows of ``term,emotion``
+        """
+        if path.endswith(".json"):
+            with open(path) as f:
+                return cls(json.load(f))
+
+        delimiter = "\t" if path.endswith((".tsv", ".tab")) else ","
+        lexicon: Dict[str, List[str]] = {}
+        with open(path, newline="") as f:
+            for row in csv.reader(f, delimiter=delimiter):
+                if len(row) < 2 or row[0].startswith("#"):
+                    continue
+                lexicon.setdefault(row[1].strip(), []).append(row[0].strip())
+        return cls(lexicon)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def matches(self, text: str) -> Dict[str, List[str]]:
+        """Distinct keywords found in ``text``, grouped by emotion"""
+        tokens = _tokenize(text)
+        found: Dict[str, set] = {}
+
+        for start in range(len(tokens)):
+            for length in range(1, min(self.max_term_length, len(tokens) - start) + 1):
+                term = tuple(tokens[start:start + length])
+                for emotion in self._terms.get(term, ()):
+                    found.setdefault(emotion, set()).add(" ".join(term))
+
+        return {emotion: sorted(terms) for emotion, terms in found.items()}
+
+    def score(self, text: str) -> Dict[str, float]:
+        """Share of each emotion's keywords present in ``text`` (0-1, matched emotions only)"""
+        return {
+            emotion: min(len(terms) / self._term_counts[emotion], 1.0)
+            for emotion, terms in self._ordered(self.matches(text))
+        }
+
+    def score_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """``score`` for each text"""
+        return [self.score(text) for text in texts]
+
+    def _ordered(self, found: Dict[str, List[str]]):
+        # Report emotions in lexicon order, as the keyword scan did
+        return [(emotion, found[emotion]) for emotion in self.emotions if emotion in found]
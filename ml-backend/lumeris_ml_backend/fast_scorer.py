@@ -0,0 +1,204 @@
+"""
+Fast Sentiment Scorer
+Compiles a fitted TF-IDF (or hashing) + Multinomial Naive Bayes pipeline into
+plain NumPy arrays: token lookup, a sparse dot product with the class
+log-probabilities and a softmax, without sklearn's per-call validation
+"""
+
+import json
+import re
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.utils import murmurhash3_32
+
+ARTIFACT_VERSION = 1
+
+
+class FastSentimentScorer:
+    """Linear log-space scorer equivalent to a fitted vectorizer + MultinomialNB pipeline"""
+
+    def __init__(
+        self,
+        classes: List[str],
+        class_log_prior: np.ndarray,
+        feature_log_prob: np.ndarray,
+        analyzer: Dict[str, Any],
+        vocabulary: Optional[Dict[str, int]] = None,
+        idf: Optional[np.ndarray] = None,
+        n_features: Optional[int] = None,
+    ):
+        """
+        Args:
+            classes: Class labels in model order
+            class_log_prior: (n_classes,) log prior per class
+            feature_log_prob: (n_features, n_classes) log P(feature | class)
+            analyzer: Tokenizer settings (token_pattern, lowercase,
+                stop_words, ngram_range, norm)
+            vocabulary: Term -> column for TF-IDF models
+            idf: (n_features,) IDF weights for TF-IDF models
+            n_features: Hash space size for hashing models (no vocabulary)
+        """
+        self.classes_ = np.asarray(classes)
+        self.class_log_prior = np.ascontiguousarray(class_log_prior, dtype=np.float64)
+        self.feature_log_prob = np.ascontiguousarray(feature_log_prob, dtype=np.float64)
+        self.analyzer = analyzer
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.n_features = n_features
+
+        self._token_pattern = re.compile(analyzer['token_pattern'])
+        self._stop_words = frozenset(analyzer['stop_words'] or ())
+        self._ngram_range = tuple(analyzer['ngram_range'])
+
+    # ---- export ----------------------------------------------------------
+
+    @classmethod
+    def from_pipeline(cls, pipeline) -> "FastSentimentScorer":
+        """
+        Compile a fitted ``Pipeline([vectorizer, MultinomialNB])``
+
+        Raises:
+            ValueError: If the pipeline uses settings the scorer does not
+                reproduce exactly (custom analyzers, sublinear tf, ...)
+        """
+
+        if len(pipeline.steps) != 2:
+            raise ValueError("Expected a pipeline of a vectorizer and a classifier")
+        vectorizer, classifier = pipeline.steps[0][1], pipeline.steps[1][1]
+
+        if not isinstance(classifier, MultinomialNB):
+            raise ValueError(f"Unsupported classifier: {type(classifier).__name__}")
+        if not isinstance(vectorizer, (TfidfVectorizer, HashingVectorizer)):
+            raise ValueError(f"Unsupported vectorizer: {type(vectorizer).__name__}")
+        if (vectorizer.analyzer != 'word' or vectorizer.preprocessor or vectorizer.tokenizer
+                or vectorizer.strip_accents or vectorizer.binary or vectorizer.norm not in ('l2', None)):
+            raise ValueError("Vectorizer settings are not supported by the fast scorer")
+
+        stop_words = vectorizer.get_stop_words()
+        analyzer = {
+            "token_pattern": vectorizer.token_pattern,
+            "lowercase": vectorizer.lowercase,
+            "stop_words": sorted(stop_words) if stop_words else None,
+            "ngram_range": list(vectorizer.ngram_range),
+            "norm": vectorizer.norm,
+        }
+        common = {
+            "classes": list(classifier.classes_),
+            "class_log_prior": classifier.class_log_prior_,
+            "feature_log_prob": classifier.feature_log_prob_.T,
+            "analyzer": analyzer,
+        }
+
+        if isinstance(vectorizer, TfidfVectorizer):
+            if vectorizer.sublinear_tf or not vectorizer.use_idf:
+                raise ValueError("Vectorizer settings are not supported by the fast scorer")
+            vocabulary = {term: int(column) for term, column in vectorizer.vocabulary_.items()}
+            return cls(vocabulary=vocabulary, idf=vectorizer.idf_.copy(), **common)
+
+        if vectorizer.alternate_sign:
+            raise ValueError("Hashing with alternate_sign is not supported by the fast scorer")
+        return cls(n_features=vectorizer.n_features, **common)
+
+    # ---- scoring ---------------------------------------------------------
+
+    def _terms(self, text: str) -> List[str]:
+        """Same n-grams as the vectorizer's word analyzer"""
+        if self.analyzer['lowercase']:
+            text = text.lower()
+        tokens = [token for token in self._token_pattern.findall(text) if token not in self._stop_words]
+
+        min_n, max_n = self._ngram_range
+        terms = tokens if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            terms = terms + [" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+        return terms
+
+    def _features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Column indices and weights of one text's feature vector"""
+        counts: Dict[int, int] = {}
+        if self.vocabulary is not None:
+            vocabulary = self.vocabulary
+            for term in self._terms(text):
+                column = vocabulary.get(term)
+                if column is not None:
+                    counts[column] = counts.get(column, 0) + 1
+        else:
+            for term in self._terms(text):
+                column = abs(murmurhash3_32(term, seed=0)) % self.n_features
+                counts[column] = counts.get(column, 0) + 1
+
+        columns = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        if self.idf is not None:
+            weights *= self.idf[columns]
+        if self.analyzer['norm'] == 'l2' and len(weights):
+            weights /= np.sqrt(np.dot(weights, weights))
+        return columns, weights
+
+    def joint_log_likelihood(self, texts: List[str]) -> np.ndarray:
+        """Unnormalized class log-probabilities, shape (n_texts, n_classes)"""
+        jll = np.tile(self.class_log_prior, (len(texts), 1))
+        for row, text in enumerate(texts):
+            columns, weights = self._features(text)
+            if len(columns):
+                jll[row] += weights @ self.feature_log_prob[columns]
+        return jll
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Class probabilities, matching the pipeline's predict_proba"""
+        jll = self.joint_log_likelihood(texts)
+        jll -= jll.max(axis=1, keepdims=True)
+        probabilities = np.exp(jll)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities
+
+    def predict(self, texts: List[str]) -> np.ndarray:
+        """Class labels, matching the pipeline's predict"""
+        return self.classes_[np.argmax(self.joint_log_likelihood(texts), axis=1)]
+
+    # ---- persistence -----------------------------------------------------
+
+    def save(self, path: str):
+        """Write the scorer as a single .npz file (arrays plus JSON metadata)"""
+        meta = {
+            "version": ARTIFACT_VERSION,
+            "classes": self.classes_.tolist(),
+            "analyzer": self.analyzer,
+            "n_features": self.n_features,
+        }
+        arrays = {
+            "class_log_prior": self.class_log_prior,
+            "feature_log_prob": self.feature_log_prob,
+        }
+        if self.vocabulary is not None:
+            terms = sorted(self.vocabulary, key=self.vocabulary.get)
+            arrays["terms"] = np.array(terms, dtype=str)
+            arrays["idf"] = self.idf
+
+        with open(path, "wb") as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "FastSentimentScorer":
+        """Load a scorer written by ``save``"""
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != ARTIFACT_VERSION:
+                raise ValueError(f"Unsupported scorer version: {meta.get('version')}")
+
+            vocabulary = idf = None
+            if "terms" in data:
+                vocabulary = {str(term): column for column, term in enumerate(data["terms"])}
+                idf = data["idf"]
+
+            return cls(
+                classes=meta["classes"],
+                class_log_prior=data["class_log_prior"],
+                feature_log_prob=data["feature_log_prob"],
+                analyzer=meta["analyzer"],
+                vocabulary=vocabulary,
+                idf=idf,
+                n_features=meta["n_features"],
+            )
@@ -8,9 +8,11 @@ import pandas as pd
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import StandardScaler
 import joblib
-from typing import List, Dict, Any
+import threading
+from typing import List, Dict, Any, Optional
 import json
 from .data_fetcher import get_data_fetcher
+from .model_artifacts import ModelArtifact, is_artifact, write_artifact
 
 
 class GamingRecommender:
@@ -23,29 +25,24 @@ class GamingRecommender:
         self.user_profiles = {}
         self.game_metadata = {}
 
-    def initialize_with_mock_data(self):
-        """Initialize with gaming data from the backend API"""
+        # Held while state is replaced, so snapshots never see a half-updated model
+        self._state_lock = threading.RLock()
 
-        fetcher = get_data_fetcher()
+    def initialize_with_mock_data(self, backend_games: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize with gaming data from the backend API
+
+        Args:
+            backend_games: Games already fetched from the backend (fetched here if None)
+        """
 
         # Try to fetch real data from backend
-        backend_games = fetcher.get_games()
+        if backend_games is None:
+            backend_games = get_data_fetcher().get_games()
 
         if backend_games:
             # Transform backend data to match our model format
-            self.games = []
-            for game in backend_games:
-                # Map backend fields to our model
-                self.games.append({
-                    "id": game.get("id", ""),
-                    "name": game.get("title", ""),
-                    "category": game.get("genre", "").lower(),
-                    "difficulty": self._estimate_difficulty(game),
-                    "avg_playtime": self._estimate_playtime(game),
-                    "reward_rate": self._calculate_reward_rate(game),
-                    "player_count": game.get("players", 0),
-                    "rating": self._estimate_rating(game)
-                })
+            self.games = [self._game_from_backend(game) for game in backend_games]
             print(f"Loaded {len(self.games)} games from backend API")
         else:
             # Fallback to mock data if backend is unavailable
@@ -125,6 +122,19 @@ class GamingRecommender:
 
         print("Gaming Recommender initialized with data")
 
+    def _game_from_backend(self, game: Dict) -> Dict[str, Any]:
+        """Map backend game fields to our model"""
+        return {
+            "id": game.get("id", ""),
+            "name": game.get("title", ""),
+            "category": game.get("genre", "").lower(),
+            "difficulty": self._estimate_difficulty(game),
+            "avg_playtime": self._estimate_playtime(game),
+            "reward_rate": self._calculate_reward_rate(game),
+            "player_count": game.get("players", 0),
+            "rating": self._estimate_rating(game)
+        }
+
     def _estimate_difficulty(self, game: Dict) -> str:
         """Estimate difficulty based on game requirements"""
         requirements = game.get("requirements", {})
@@ -169,36 +179,42 @@ class GamingRecommender:
         popularity_bonus = (players / max_players) * 0.8
         return min(base + popularity_bonus, 5.0)
 
-    def _build_game_features(self):
-        """Build feature matrix for games"""
+    @staticmethod
+    def _game_feature_row(game: Dict[str, Any]) -> List[float]:
+        """Feature vector of one game"""
 
         # Category encoding
         categories = ['strategy', 'rpg', 'card', 'action']
         difficulties = ['easy', 'medium', 'hard']
 
-        features_list = []
+        features = []
 
-        for game in self.games:
-            features = []
+        # One-hot encode category
+        features.extend([1 if game['category'] == cat else 0 for cat in categories])
 
-            # One-hot encode category
-            features.extend([1 if game['category'] == cat else 0 for cat in categories])
+        # One-hot encode difficulty
+        features.extend([1 if game['difficulty'] == diff else 0 for diff in difficulties])
 
-            # One-hot encode difficulty
-            features.extend([1 if game['difficulty'] == diff else 0 for diff in difficulties])
+        # Numerical features (normalized)
+        features.extend([
+            game['avg_playtime'] / 100,  # Normalized
+            game['reward_rate'],
+            game['player_count'] / 30000,  # Normalized
+            game['rating'] / 5.0
+        ])
 
-            # Numerical features (normalized)
-            features.extend([
-                game['avg_playtime'] / 100,  # Normalized
-                game['reward_rate'],
-                game['player_count'] / 30000,  # Normalized
-                game['rating'] / 5.0
-            ])
+        return features
 
-            features_list.append(features)
+    def _build_game_features(self):
+        """Build feature matrix for games"""
+
+        features_list = []
+
+        for game in self.games:
+            features_list.append(self._game_feature_row(game))
             self.game_metadata[game['id']] = game
 
-        self.game_features = np.array(features_list)
+        self.game_features = np.array(features_list, dtype=float)
 
         # Calculate game similarity matrix
         self.game_similarity = cosine_similarity(self.game_features)
@@ -235,6 +251,90 @@ class GamingRecommender:
 
         self.user_game_matrix = matrix
 
+    def apply_game_changes(self, upserts: List[Dict[str, Any]], deleted_ids: List[str]) -> Dict[str, int]:
+        """
+        Apply created, updated and deleted backend games incrementally
+
+        Only the feature rows of changed games and their rows/columns of the
+        similarity matrix are recomputed, in place. Removed games are sliced
+        out of the feature, similarity and user-game matrices, which copies
+        them once.
+
+        Args:
+            upserts: Created or updated games in backend format
+            deleted_ids: IDs of deleted games
+
+        Returns:
+            Number of games added, updated and removed
+        """
+
+        with self._state_lock:
+            if self.game_features is None:
+                raise ValueError("Recommender is not initialized")
+
+            games = list(self.games)
+            features = self.game_features
+            similarity = self.game_similarity
+            user_game_matrix = self.user_game_matrix
+            index = {game['id']: i for i, game in enumerate(games)}
+
+            removed_ids = {game_id for game_id in deleted_ids if game_id in index}
+            if removed_ids:
+                keep = np.array([i for i, game in enumerate(games) if game['id'] not in removed_ids], dtype=int)
+                games = [games[i] for i in keep]
+                features = features[keep]
+                similarity = similarity[np.ix_(keep, keep)]
+                user_game_matrix = user_game_matrix[:, keep]
+                index = {game['id']: i for i, game in enumerate(games)}
+
+            changed = []
+            n_added = 0
+            for backend_game in upserts:
+                game = self._game_from_backend(backend_game)
+                if game['id'] in index:
+                    games[index[game['id']]] = game
+                else:
+                    index[game['id']] = len(games)
+                    games.append(game)
+                    n_added += 1
+                changed.append(index[game['id']])
+
+            if n_added:
+                features = np.vstack([features, np.zeros((n_added, features.shape[1]))])
+                similarity = np.pad(similarity, ((0, n_added), (0, n_added)))
+                user_game_matrix = np.pad(user_game_matrix, ((0, 0), (0, n_added)))
+
+            # Arrays held by a snapshot are read-only: copy them before writing
+            if changed and not features.flags.writeable:
+                features = features.copy()
+            if changed and not similarity.flags.writeable:
+                similarity = similarity.copy()
+
+            if changed:
+                features[changed] = [self._game_feature_row(games[i]) for i in changed]
+                changed_similarity = cosine_similarity(features[changed], features)
+                similarity[changed, :] = changed_similarity
+                similarity[:, changed] = changed_similarity.T
+
+            # Swap everything in at once so readers never see mismatched shapes
+            # (same-shape updates are written in place, row by row)
+            self.games = games
+            self.game_features = features
+            self.game_similarity = similarity
+            self.user_game_matrix = user_game_matrix
+            for game_id in removed_ids:
+                self.game_metadata.pop(game_id, None)
+            for i in changed:
+                self.game_metadata[games[i]['id']] = games[i]
+
+            if removed_ids or n_added:
+                for u_idx, user_id in enumerate(self.user_play_history):
+                    history = [play for play in self.user_play_history[user_id] if play['game_id'] not in removed_ids]
+                    self.user_play_history[user_id] = history
+                    self.user_profiles[user_id] = {'preferences': user_game_matrix[u_idx], 'history': history}
+
+            return {"added": n_added, "updated": len(changed) - n_added, "removed": len(removed_ids)}
+
     def recommend_for_user(self, user_id: str, n_recommendations: int = 3) -> List[Dict[str, Any]]:
         """
         Generate game recommendations for a user
@@ -246,68 +346,87 @@ class GamingRecommender:
         Returns:
             List of recommended games with scores
         """
+        return self.recommend_for_users([user_id], n_recommendations)[user_id]
 
-        # If new user, use popularity-based recommendations
-        if user_id not in self.user_profiles:
-            return self._popularity_based_recommendations(n_recommendations)
-
-        # Get user's play history
-        user_history = self.user_play_history[user_id]
-        played_game_ids = [play['game_id'] for play in user_history]
-
-        # Collaborative filtering: find similar users
-        user_idx = list(self.user_profiles.keys()).index(user_id)
-        user_vector = self.user_game_matrix[user_idx].reshape(1, -1)
-
-        # Calculate similarity with other users
-        user_similarities = cosine_similarity(user_vector, self.user_game_matrix)[0]
-
-        # Content-based filtering: based on played games
-        content_scores = np.zeros(len(self.games))
-
-        for play in user_history:
-            game_idx = [g['id'] for g in self.games].index(play['game_id'])
-
-            # Weight by user's engagement with this game
-            engagement_weight = play['playtime'] / 300
-
-            # Add similarity scores for similar games
-            content_scores += self.game_similarity[game_idx] * engagement_weight
+    def recommend_for_users(self, user_ids: List[str], n_recommendations: int = 3) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Generate game recommendations for many users in one scoring pass
 
-        # Collaborative scores
-        collab_scores = np.zeros(len(self.games))
-        for i, other_user_id in enumerate(self.user_profiles.keys()):
-            if other_user_id != user_id:
-                collab_scores += user_similarities[i] * self.user_game_matrix[i]
+        Content-based and collaborative scores of all known users are
+        computed with two matrix products instead of per-user loops.
 
-        # Hybrid: combine both approaches
-        hybrid_scores = 0.6 * content_scores + 0.4 * collab_scores
+        Args:
+            user_ids: User identifiers (duplicates are scored once)
+            n_recommendations: Number of recommendations per user
 
-        # Filter out already played games
-        game_ids = [g['id'] for g in self.games]
-        for played_id in played_game_ids:
-            idx = game_ids.index(played_id)
-            hybrid_scores[idx] = -1
+        Returns:
+            Recommendations keyed by user ID; unknown users get
+            popularity-based recommendations
+        """
 
-        # Get top N recommendations
-        top_indices = np.argsort(hybrid_scores)[::-1][:n_recommendations]
+        # Read a consistent set of arrays; updates swap them under the lock
+        with self._state_lock:
+            games = self.games
+            game_similarity = self.game_similarity
+            user_game_matrix = self.user_game_matrix
+            user_index = {uid: i for i, uid in enumerate(self.user_profiles)}
+            histories = {uid: self.user_play_history[uid] for uid in user_ids if uid in user_index}
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        known = list(dict.fromkeys(uid for uid in user_ids if uid in user_index))
+
+        if known:
+            game_index = {game['id']: i for i, game in enumerate(games)}
+            rows = np.array([user_index[uid] for uid in known])
+
+            # Engagement-weighted plays and a mask of played games, one row per user
+            engagement = np.zeros((len(known), len(games)))
+            played = np.zeros((len(known), len(games)), dtype=bool)
+            for b, uid in enumerate(known):
+                for play in histories[uid]:
+                    game_idx = game_index.get(play['game_id'])
+                    if game_idx is not None:
+                        engagement[b, game_idx] += play['playtime'] / 300
+                        played[b, game_idx] = True
+
+            # Content-based filtering: similarity to played games
+            content_scores = engagement @ game_similarity
+
+            # Collaborative filtering: similar users' engagement, excluding the user itself
+            user_similarities = cosine_similarity(user_game_matrix[rows], user_game_matrix)
+            user_similarities[np.arange(len(known)), rows] = 0
+            collab_scores = user_similarities @ user_game_matrix
+
+            # Hybrid: combine both approaches, never recommending played games
+            hybrid_scores = 0.6 * content_scores + 0.4 * collab_scores
+            hybrid_scores[played] = -1
+
+            top_indices = np.argsort(hybrid_scores, axis=1)[:, ::-1][:, :n_recommendations]
+
+            for b, uid in enumerate(known):
+                favorite = self._favorite_category(histories[uid])
+                results[uid] = [
+                    {
+                        "game_id": games[idx]['id'],
+                        "name": games[idx]['name'],
+                        "category": games[idx]['category'],
+                        "difficulty": games[idx]['difficulty'],
+                        "rating": games[idx]['rating'],
+                        "player_count": games[idx]['player_count'],
+                        "recommendation_score": float(hybrid_scores[b, idx]),
+                        "reason": self._generate_reason(favorite, games[idx])
+                    }
+                    for idx in top_indices[b] if hybrid_scores[b, idx] > 0
+                ]
 
-        recommendations = []
-        for idx in top_indices:
-            if hybrid_scores[idx] > 0:
-                game = self.games[idx]
-                recommendations.append({
-                    "game_id": game['id'],
-                    "name": game['name'],
-                    "category": game['category'],
-                    "difficulty": game['difficulty'],
-                    "rating": game['rating'],
-                    "player_count": game['player_count'],
-                    "recommendation_score": float(hybrid_scores[idx]),
-                    "reason": self._generate_reason(user_id, game, hybrid_scores[idx])
-                })
+        unknown = [uid for uid in user_ids if uid not in user_index]
+        if unknown:
+            # New users: popularity-based recommendations
+            popular = self._popularity_based_recommendations(n_recommendations)
+            for uid in unknown:
+                results[uid] = [dict(rec) for rec in popular]
 
-        return recommendations
+        return results
 
     def _popularity_based_recommendations(self, n: int) -> List[Dict[str, Any]]:
         """Recommendations for new users based on popularity"""
@@ -334,19 +453,18 @@ class GamingRecommender:
 
         return recommendations
 
-    def _generate_reason(self, user_id: str, game: Dict, score: float) -> str:
-        """Generate explanation for recommendation"""
-
-        history = self.user_play_history[user_id]
-
-        # Find most played category
+    def _favorite_category(self, history: List[Dict[str, Any]]) -> Optional[str]:
+        """Category a user has spent the most playtime in"""
         category_counts = {}
         for play in history:
-            game_data = next(g for g in self.games if g['id'] == play['game_id'])
-            cat = game_data['category']
-            category_counts[cat] = category_counts.get(cat, 0) + play['playtime']
+            game_data = self.game_metadata.get(play['game_id'])
+            if game_data is not None:
+                cat = game_data['category']
+                category_counts[cat] = category_counts.get(cat, 0) + play['playtime']
+        return max(category_counts, key=category_counts.get) if category_counts else None
 
-        fav_category = max(category_counts, key=category_counts.get)
+    def _generate_reason(self, fav_category: Optional[str], game: Dict) -> str:
+        """Generate explanation for recommendation"""
 
         if game['category'] == fav_category:
             return f"Based on your love for {fav_category} games"
@@ -359,55 +477,119 @@ class GamingRecommender:
 
     def get_similar_games(self, game_id: str, n: int = 3) -> List[Dict[str, Any]]:
         """Find similar games to a given game"""
+        return self.get_similar_games_batch([game_id], n)[game_id]
+
+    def get_similar_games_batch(self, game_ids: List[str], n: int = 3) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find similar games for many games at once
 
-        game_ids = [g['id'] for g in self.games]
+        Args:
+            game_ids: Game identifiers
+            n: Number of similar games per game
 
-        if game_id not in game_ids:
-            return []
+        Returns:
+            Similar games keyed by game ID (empty for unknown games)
+        """
 
-        game_idx = game_ids.index(game_id)
-        similarities = self.game_similarity[game_idx]
+        with self._state_lock:
+            games = self.games
+            game_similarity = self.game_similarity
 
-        # Get top similar games (excluding itself)
-        similarities[game_idx] = -1
-        top_indices = np.argsort(similarities)[::-1][:n]
+        game_index = {game['id']: i for i, game in enumerate(games)}
+        results: Dict[str, List[Dict[str, Any]]] = {game_id: [] for game_id in game_ids}
+        known = [game_id for game_id in results if game_id in game_index]
+        if not known:
+            return results
 
-        similar_games = []
-        for idx in top_indices:
-            game = self.games[idx]
-            similar_games.append({
-                "game_id": game['id'],
-                "name": game['name'],
-                "category": game['category'],
-                "similarity_score": float(similarities[idx])
-            })
+        # Fancy indexing copies the rows, so excluding each game from its own list is safe
+        rows = np.array([game_index[game_id] for game_id in known])
+        similarities = game_similarity[rows]
+        similarities[np.arange(len(known)), rows] = -1
+        top_indices = np.argsort(similarities, axis=1)[:, ::-1][:, :n]
+
+        for b, game_id in enumerate(known):
+            results[game_id] = [
+                {
+                    "game_id": games[idx]['id'],
+                    "name": games[idx]['name'],
+                    "category": games[idx]['category'],
+                    "similarity_score": float(similarities[b, idx])
+                }
+                for idx in top_indices[b]
+            ]
 
-        return similar_games
+        return results
+
+    def capture_artifact(self) -> Dict[str, Any]:
+        """
+        Consistent view of the model state, as ``write_artifact`` arguments
+
+        Nothing is copied: the arrays are marked read-only instead, so the
+        next in-place update copies them first (copy-on-write).
+        """
+        with self._state_lock:
+            if self.game_features is None:
+                raise ValueError("Recommender is not initialized")
+            arrays = {
+                'game_features': self.game_features,
+                'game_similarity': self.game_similarity,
+                'user_game_matrix': self.user_game_matrix
+            }
+            for values in arrays.values():
+                values.flags.writeable = False
+            return {
+                'kind': "gaming_recommender",
+                'metadata': {'games': list(self.games), 'user_play_history': dict(self.user_play_history)},
+                'arrays': arrays
+            }
 
     def save_model(self, filepath: str):
-        """Save model to disk"""
-        model_data = {
-            'games': self.games,
-            'user_play_history': self.user_play_history,
-            'game_features': self.game_features,
-            'game_similarity': self.game_similarity,
-            'user_game_matrix': self.user_game_matrix,
-            'user_profiles': self.user_profiles,
-            'game_metadata': self.game_metadata
-        }
-        joblib.dump(model_data, filepath)
+        """
+        Save model to disk as an artifact directory
+
+        The feature, similarity and user-game matrices are stored as .npy
+        files, the catalog and play history as JSON.
+        """
+        write_artifact(filepath, **self.capture_artifact())
         print(f"Model saved to {filepath}")
 
-    def load_model(self, filepath: str):
-        """Load model from disk"""
-        model_data = joblib.load(filepath)
-        self.games = model_data['games']
-        self.user_play_history = model_data['user_play_history']
-        self.game_features = model_data['game_features']
-        self.game_similarity = model_data['game_similarity']
-        self.user_game_matrix = model_data['user_game_matrix']
-        self.user_profiles = model_data['user_profiles']
-        self.game_metadata = model_data['game_metadata']
+    def load_model(self, filepath: str, verify: bool = False):
+        """
+        Load model from disk
+
+        Matrices are memory-mapped, so loading reads only the metadata;
+        pickles written by earlier versions are still accepted.
+
+        Args:
+            filepath: Artifact directory (or legacy .pkl file)
+            verify: Check the SHA-256 of every file before loading
+        """
+        if not is_artifact(filepath):
+            model_data = joblib.load(filepath)
+            self.games = model_data['games']
+            self.user_play_history = model_data['user_play_history']
+            self.game_features = model_data['game_features']
+            self.game_similarity = model_data['game_similarity']
+            self.user_game_matrix = model_data['user_game_matrix']
+            self.user_profiles = model_data['user_profiles']
+            self.game_metadata = model_data['game_metadata']
+            print(f"Model loaded from {filepath}")
+            return
+
+        with self._state_lock:
+            artifact = ModelArtifact(filepath, kind="gaming_recommender", verify=verify)
+            self.games = artifact.metadata['games']
+            self.user_play_history = artifact.metadata['user_play_history']
+            self.game_features = artifact.array('game_features')
+            self.game_similarity = artifact.array('game_similarity')
+            self.user_game_matrix = artifact.array('user_game_matrix')
+
+            # Both are derived: profiles are views of the user-game matrix rows
+            self.game_metadata = {game['id']: game for game in self.games}
+            self.user_profiles = {
+                user_id: {'preferences': self.user_game_matrix[u_idx], 'history': history}
+                for u_idx, (user_id, history) in enumerate(self.user_play_history.items())
+            }
         print(f"Model loaded from {filepath}")
 
 
@@ -424,4 +606,4 @@ if __name__ == "__main__":
         print(f"    Reason: {rec['reason']}")
 
     # Save model
-    recommender.save_model("models/gaming_recommender.pkl")
+    recommender.save_model("models/gaming_recommender")
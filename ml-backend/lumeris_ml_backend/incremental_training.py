@@ -0,0 +1,242 @@
+"""
+Incremental Sentiment Training
+Trains the sentiment classifier out of core: labeled comments are streamed
+from JSONL/CSV in chunks, hashed into a fixed feature space and folded into
+Naive Bayes with partial_fit, checkpointing after every chunk
+"""
+
+import os
+import time
+import uuid
+import joblib
+import pandas as pd
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.naive_bayes import MultinomialNB
+from sklearn.pipeline import Pipeline
+
+SENTIMENT_CLASSES = ['negative', 'neutral', 'positive']
+DEFAULT_N_FEATURES = 2 ** 18
+CHECKPOINT_VERSION = 1
+
+
+def build_incremental_pipeline(n_features: int = DEFAULT_N_FEATURES) -> Pipeline:
+    """
+    Hashing + Naive Bayes pipeline with the same analyzer settings as the
+    TF-IDF model, usable for prediction without a vectorizer fit
+    """
+    return Pipeline([
+        ('hashing', HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            stop_words='english',
+            alternate_sign=False,
+            norm='l2'
+        )),
+        ('classifier', MultinomialNB(alpha=0.1))
+    ])
+
+
+def iter_labeled_chunks(
+    source: str,
+    chunk_size: int = 10000,
+    text_field: str = 'text',
+    label_field: str = 'label',
+    skip_rows: int = 0,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream labeled comments from disk without loading the whole file
+
+    Args:
+        source: .jsonl/.ndjson file (one object per line) or .csv/.tsv file
+        chunk_size: Rows per yielded chunk
+        text_field: Column holding the comment text
+        label_field: Column holding the sentiment label
+        skip_rows: Leading data rows to skip (used when resuming)
+
+    Returns:
+        Iterator of DataFrames with ``text`` and ``label`` columns
+    """
+
+    extension = os.path.splitext(source)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        reader = pd.read_json(source, lines=True, chunksize=chunk_size, dtype=False)
+    elif extension in ('.csv', '.tsv'):
+        reader = pd.read_csv(
+            source,
+            sep='\t' if extension == '.tsv' else ',',
+            usecols=[text_field, label_field],
+            dtype=str,
+            chunksize=chunk_size
+        )
+    else:
+        raise ValueError(f"Unsupported training file type: {source}")
+
+    to_skip = skip_rows
+    with reader:
+        for chunk in reader:
+            if to_skip >= len(chunk):
+                to_skip -= len(chunk)
+                continue
+            if to_skip:
+                chunk = chunk.iloc[to_skip:]
+                to_skip = 0
+
+            yield pd.DataFrame({
+                'text': chunk[text_field],
+                'label': chunk[label_field]
+            })
+
+
+class IncrementalSentimentTrainer:
+    """Chunked partial_fit training with a resumable checkpoint"""
+
+    def __init__(
+        self,
+        checkpoint_path: str,
+        classes: Optional[List[str]] = None,
+        n_features: int = DEFAULT_N_FEATURES,
+        chunk_size: int = 10000,
+    ):
+        """
+        Args:
+            checkpoint_path: File rewritten (atomically) after every chunk
+            classes: Sentiment labels; rows with other labels are skipped
+            n_features: Size of the hashed feature space, which bounds
+                model memory independently of vocabulary size
+            chunk_size: Rows read and fitted per step
+        """
+        self.checkpoint_path = checkpoint_path
+        self.classes = list(classes or SENTIMENT_CLASSES)
+        self.n_features = n_features
+        self.chunk_size = chunk_size
+
+        self.model = build_incremental_pipeline(n_features)
+        self.state = self._empty_state()
+
+    def _empty_state(self) -> Dict[str, Any]:
+        return {
+            "source": None,
+            "rows_read": 0,
+            "rows_trained": 0,
+            "rows_skipped": 0,
+            "chunks": 0,
+            "class_counts": {label: 0 for label in self.classes},
+        }
+
+    def load_checkpoint(self) -> bool:
+        """Restore model and progress from the checkpoint (False if there is none)"""
+        if not os.path.exists(self.checkpoint_path):
+            return False
+
+        checkpoint = joblib.load(self.checkpoint_path)
+        if checkpoint.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version: {checkpoint.get('version')}")
+
+        self.model = checkpoint['model']
+        self.classes = checkpoint['classes']
+        self.state = checkpoint['state']
+        return True
+
+    def save_checkpoint(self):
+        """Write model and progress to a temp file, then swap it into place"""
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.checkpoint_path}.tmp-{uuid.uuid4().hex}"
+        joblib.dump({
+            'version': CHECKPOINT_VERSION,
+            'model': self.model,
+            'classes': self.classes,
+            'state': self.state,
+        }, tmp_path)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def partial_fit(self, texts: List[str], labels: List[str]) -> int:
+        """
+        Fold one chunk of labeled comments into the model
+
+        Returns:
+            Number of rows used (empty texts and unknown labels are dropped)
+        """
+        pairs = [
+            (text, label) for text, label in zip(texts, labels)
+            if isinstance(text, str) and text.strip() and label in self.classes
+        ]
+        if not pairs:
+            return 0
+
+        texts, labels = zip(*pairs)
+        features = self.model.named_steps['hashing'].transform(texts)
+        self.model.named_steps['classifier'].partial_fit(features, labels, classes=self.classes)
+
+        for label in labels:
+            self.state['class_counts'][label] += 1
+        return len(pairs)
+
+    def train(
+        self,
+        source: str,
+        resume: bool = True,
+        text_field: str = 'text',
+        label_field: str = 'label',
+        on_checkpoint: Optional[Callable[[Pipeline, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Train on a labeled file chunk by chunk
+
+        Args:
+            source: JSONL or CSV file of labeled comments
+            resume: Continue from the checkpoint if it was written for the
+                same source, skipping rows it already covers
+            text_field: Column holding the comment text
+            label_field: Column holding the sentiment label
+            on_checkpoint: Called after each checkpoint with the model and
+                the progress; the model keeps changing, so callers that
+                serve it should keep a copy
+
+        Returns:
+            Training progress and timing
+        """
+
+        source = os.path.abspath(source)
+        if not (resume and self.load_checkpoint() and self.state['source'] == source):
+            self.model = build_incremental_pipeline(self.n_features)
+            self.state = self._empty_state()
+            self.state['source'] = source
+
+        start = time.perf_counter()
+        resumed_from = self.state['rows_read']
+
+        chunks = iter_labeled_chunks(
+            source,
+            chunk_size=self.chunk_size,
+            text_field=text_field,
+            label_field=label_field,
+            skip_rows=resumed_from
+        )
+        for chunk in chunks:
+            used = self.partial_fit(chunk['text'].tolist(), chunk['label'].tolist())
+
+            self.state['rows_read'] += len(chunk)
+            self.state['rows_trained'] += used
+            self.state['rows_skipped'] += len(chunk) - used
+            self.state['chunks'] += 1
+            self.save_checkpoint()
+
+            if on_checkpoint is not None and self.state['rows_trained'] > 0:
+                on_checkpoint(self.model, dict(self.state))
+
+        elapsed = time.perf_counter() - start
+        new_rows = self.state['rows_read'] - resumed_from
+        print(f"Incremental training: {self.state['rows_trained']} rows in {self.state['chunks']} chunks "
+              f"({new_rows} new rows, {elapsed:.1f}s)")
+
+        return {
+            **self.state,
+            "resumed_from_row": resumed_from,
+            "new_rows": new_rows,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(new_rows / elapsed, 1) if elapsed > 0 else 0.0,
+        }
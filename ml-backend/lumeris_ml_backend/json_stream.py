@@ -0,0 +1,137 @@
+"""
+Incremental JSON Parsing
+Parses a backend response ({"success": ..., "data": [...], ...}) as its
+bytes arrive, handing out the rows of the data array one by one instead of
+decoding the whole body at once
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class StreamingArrayParser:
+    """
+    Streams the elements of one array field of a top-level JSON object
+
+    Feed it raw chunks; every call returns the elements completed so far.
+    The other top-level fields (success flag, pagination, ...) are decoded
+    normally and collected in ``meta``. Memory stays bounded by the largest
+    single element, not the document.
+    """
+
+    def __init__(self, field: str = "data"):
+        """
+        Args:
+            field: Name of the array whose elements are streamed
+        """
+        self.field = field
+        self.meta: Dict[str, Any] = {}
+        self._json = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add bytes; returns the array elements they completed"""
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Finish the document; raises ValueError if it is truncated or malformed"""
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != "done":
+            raise ValueError(f"Truncated JSON document (parser state '{self._state}')")
+        return items
+
+    def _next_char(self) -> str:
+        """Next non-whitespace character ('' if the buffer is exhausted)"""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._buffer[self._pos:self._pos + 1]
+
+    def _decode(self, final: bool):
+        """Decode one value at the cursor; (True, value) or (False, None) if more bytes are needed"""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise ValueError("Malformed or truncated JSON document")
+            return False, None
+
+        # A number at the very end of the buffer may continue in the next chunk
+        if end == len(self._buffer) and not final and not isinstance(value, (dict, list, str)):
+            return False, None
+
+        self._pos = end
+        return True, value
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        while True:
+            char = self._next_char()
+            if not char:
+                return items
+
+            if self._state == "start":
+                if char != "{":
+                    raise ValueError("Expected a JSON object")
+                self._pos += 1
+                self._state = "key"
+
+            elif self._state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "done"
+                elif char == ",":
+                    self._pos += 1
+                else:
+                    complete, key = self._decode(final)
+                    if not complete:
+                        return items
+                    self._key = key
+                    self._state = "colon"
+
+            elif self._state == "colon":
+                if char != ":":
+                    raise ValueError(f"Expected ':' after key '{self._key}'")
+                self._pos += 1
+                self._state = "value"
+
+            elif self._state == "value":
+                if self._key == self.field and char == "[":
+                    self._pos += 1
+                    self._state = "array"
+                    continue
+                complete, value = self._decode(final)
+                if not complete:
+                    return items
+                self.meta[self._key] = value
+                self._state = "key"
+
+            elif self._state == "array":
+                if char == ",":
+                    self._pos += 1
+                elif char == "]":
+                    self._pos += 1
+                    self._state = "key"
+                else:
+                    complete, value = self._decode(final)
+                    if not complete:
+                        return items
+                    items.append(value)
+
+            else:
+                # Trailing whitespace after the object is all that may follow
+                raise ValueError("Unexpected data after the JSON document")
@@ -0,0 +1,241 @@
+"""
+Columnar Market Data Store
+Keeps DeFi pool history on disk as one .npy file per column, partitioned by
+pool and month, and memory-maps partitions so reads only touch the windows
+a caller asks for
+"""
+
+import json
+import os
+import shutil
+import uuid
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Any, Optional
+from urllib.parse import quote
+
+# Numeric columns stored for every pool/day row
+MARKET_COLUMNS = [
+    'price', 'tvl', 'volume_24h', 'apy', 'sma_7',
+    'momentum', 'volume_tvl_ratio', 'volatility'
+]
+
+MANIFEST_FILE = "manifest.json"
+STORE_VERSION = 1
+
+
+class MarketDataStore:
+    """Append-only, memory-mapped columnar store of daily pool metrics"""
+
+    def __init__(self, root: str, columns: Optional[List[str]] = None):
+        """
+        Args:
+            root: Directory holding the store (created if missing)
+            columns: Numeric columns to store (defaults to ``MARKET_COLUMNS``)
+        """
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+        self.manifest = self._read_manifest()
+        if self.manifest is None:
+            self.manifest = {
+                "version": STORE_VERSION,
+                "columns": list(columns or MARKET_COLUMNS),
+                "pools": {}
+            }
+            self._write_manifest()
+
+        self.columns = self.manifest['columns']
+
+        # Open memory maps per partition, dropped whenever a partition is rewritten
+        self._mmaps: Dict[str, Dict[str, np.ndarray]] = {}
+
+    # ---- manifest -------------------------------------------------------
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        path = os.path.join(self.root, MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') != STORE_VERSION:
+            raise ValueError(f"Unsupported market store version: {manifest.get('version')}")
+        return manifest
+
+    def _write_manifest(self):
+        """Atomically replace the manifest"""
+        path = os.path.join(self.root, MANIFEST_FILE)
+        tmp_path = f"{path}.tmp-{uuid.uuid4().hex}"
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, path)
+
+    # ---- partitions -----------------------------------------------------
+
+    def _partition_dir(self, pool_id: str, partition: str) -> str:
+        return os.path.join(self.root, quote(pool_id, safe=''), partition)
+
+    def _load_partition(self, pool_id: str, partition: str) -> Dict[str, np.ndarray]:
+        """Memory-map every column of a partition"""
+        path = self._partition_dir(pool_id, partition)
+        if path not in self._mmaps:
+            self._mmaps[path] = {
+                column: np.load(os.path.join(path, f"{column}.npy"), mmap_mode='r')
+                for column in ['date'] + self.columns
+            }
+        return self._mmaps[path]
+
+    def _write_partition(self, pool_id: str, partition: str, arrays: Dict[str, np.ndarray]):
+        """Write a partition to a temp directory, then swap it into place"""
+        final_dir = self._partition_dir(pool_id, partition)
+        tmp_dir = f"{final_dir}.tmp-{uuid.uuid4().hex}"
+        os.makedirs(tmp_dir)
+        for column, values in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{column}.npy"), values)
+
+        self._mmaps.pop(final_dir, None)
+        if os.path.exists(final_dir):
+            old_dir = f"{final_dir}.old-{uuid.uuid4().hex}"
+            os.replace(final_dir, old_dir)
+            os.replace(tmp_dir, final_dir)
+            shutil.rmtree(old_dir, ignore_errors=True)
+        else:
+            os.replace(tmp_dir, final_dir)
+
+    # ---- public API -----------------------------------------------------
+
+    def pool_ids(self) -> List[str]:
+        """Pools with at least one stored row"""
+        return list(self.manifest['pools'].keys())
+
+    def row_count(self, pool_id: Optional[str] = None) -> int:
+        """Stored rows for one pool, or for the whole store"""
+        pools = [pool_id] if pool_id else self.pool_ids()
+        return sum(
+            meta['rows']
+            for pid in pools
+            for meta in self.manifest['pools'].get(pid, {}).values()
+        )
+
+    def append(self, rows: pd.DataFrame):
+        """
+        Add rows to the store
+
+        Only the month partitions touched by ``rows`` are rewritten. A row
+        with the same pool and date as a stored row replaces it.
+
+        Args:
+            rows: DataFrame with ``pool_id``, ``date`` and the store's columns
+        """
+
+        if rows.empty:
+            return
+
+        missing = {'pool_id', 'date', *self.columns} - set(rows.columns)
+        if missing:
+            raise ValueError(f"Rows are missing columns: {sorted(missing)}")
+
+        rows = rows.copy()
+        rows['date'] = pd.to_datetime(rows['date'])
+        rows['_partition'] = rows['date'].dt.strftime('%Y-%m')
+
+        for (pool_id, partition), part_rows in rows.groupby(['pool_id', '_partition'], sort=False):
+            pool_id = str(pool_id)
+            partitions = self.manifest['pools'].setdefault(pool_id, {})
+
+            new = pd.DataFrame({
+                'date': part_rows['date'].values.astype('datetime64[ns]').astype(np.int64),
+                **{column: part_rows[column].to_numpy(dtype=np.float64) for column in self.columns}
+            })
+            if partition in partitions:
+                stored = self._load_partition(pool_id, partition)
+                existing = pd.DataFrame({column: np.asarray(values) for column, values in stored.items()})
+                new = pd.concat([existing, new], ignore_index=True)
+
+            new = new.drop_duplicates(subset='date', keep='last').sort_values('date', kind='stable')
+            arrays = {column: new[column].to_numpy() for column in ['date'] + self.columns}
+            self._write_partition(pool_id, partition, arrays)
+
+            partitions[partition] = {
+                "rows": int(len(new)),
+                "start": int(arrays['date'][0]),
+                "end": int(arrays['date'][-1])
+            }
+            self.manifest['pools'][pool_id] = dict(sorted(partitions.items()))
+
+        self._write_manifest()
+
+    def read_range(
+        self,
+        pool_id: str,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read one pool's rows with ``start <= date <= end``
+
+        Partitions outside the range are never opened; inside a partition
+        only the matching slice is copied out of the memory map.
+
+        Args:
+            pool_id: Pool identifier
+            start: Inclusive lower date bound (None for the first row)
+            end: Inclusive upper date bound (None for the last row)
+            columns: Subset of columns to return (defaults to all)
+
+        Returns:
+            DataFrame with ``pool_id``, ``date`` and the requested columns
+        """
+
+        columns = columns or self.columns
+        start_ns = pd.Timestamp(start).value if start is not None else None
+        end_ns = pd.Timestamp(end).value if end is not None else None
+
+        chunks = []
+        for partition, meta in self.manifest['pools'].get(pool_id, {}).items():
+            if start_ns is not None and meta['end'] < start_ns:
+                continue
+            if end_ns is not None and meta['start'] > end_ns:
+                continue
+
+            arrays = self._load_partition(pool_id, partition)
+            dates = arrays['date']
+            lo = np.searchsorted(dates, start_ns, side='left') if start_ns is not None else 0
+            hi = np.searchsorted(dates, end_ns, side='right') if end_ns is not None else len(dates)
+            if hi > lo:
+                chunks.append({column: np.array(arrays[column][lo:hi]) for column in ['date'] + columns})
+
+        return self._to_frame(pool_id, chunks, columns)
+
+    def tail(self, pool_id: str, n: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the latest ``n`` rows of a pool, opening only the newest partitions"""
+
+        columns = columns or self.columns
+        chunks = []
+        remaining = n
+        for partition in reversed(list(self.manifest['pools'].get(pool_id, {}))):
+            if remaining <= 0:
+                break
+            arrays = self._load_partition(pool_id, partition)
+            take = min(remaining, len(arrays['date']))
+            chunks.insert(0, {
+                column: np.array(arrays[column][len(arrays['date']) - take:])
+                for column in ['date'] + columns
+            })
+            remaining -= take
+
+        return self._to_frame(pool_id, chunks, columns)
+
+    def _to_frame(self, pool_id: str, chunks: List[Dict[str, np.ndarray]], columns: List[str]) -> pd.DataFrame:
+        """Assemble column chunks into a DataFrame shaped like the in-memory history"""
+        if not chunks:
+            return pd.DataFrame(columns=['pool_id', 'date'] + columns)
+
+        data = {column: np.concatenate([chunk[column] for chunk in chunks]) for column in ['date'] + columns}
+        frame = pd.DataFrame({
+            'pool_id': pool_id,
+            'date': pd.to_datetime(data.pop('date')),
+            **data
+        })
+        return frame
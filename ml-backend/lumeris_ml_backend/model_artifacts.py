@@ -0,0 +1,228 @@
+"""
+Model Artifacts
+Array-native on-disk format for saved models: large arrays as uncompressed
+.npy files memory-mapped on load, DataFrames as one .npy per column, small
+state as JSON, and a manifest with a SHA-256 checksum per file
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+
+MANIFEST_FILE = "manifest.json"
+METADATA_FILE = "metadata.json"
+ARTIFACT_VERSION = 1
+
+# Read with copy-on-write maps: pages are loaded when touched, and in-place
+# updates stay private to the process instead of changing the files
+DEFAULT_MMAP_MODE = "c"
+
+
+def json_default(value: Any) -> Any:
+    """``json.dump(default=...)`` hook for numpy scalars and timestamps (model state, CLI results)"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_artifact(
+    path: str,
+    kind: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    arrays: Optional[Dict[str, np.ndarray]] = None,
+    frames: Optional[Dict[str, pd.DataFrame]] = None,
+    objects: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Write a model artifact directory, replacing any previous one atomically
+
+    Args:
+        path: Artifact directory
+        kind: Model type recorded in the manifest and checked on load
+        metadata: Small JSON-serializable state (catalogs, settings)
+        arrays: Arrays stored as individual .npy files
+        frames: DataFrames stored column by column; string columns are
+            dictionary-encoded (integer codes plus the distinct values)
+        objects: Estimators without an array form, stored as uncompressed
+            joblib files so their inner arrays can be memory-mapped too
+
+    Returns:
+        The manifest that was written
+    """
+
+    path = os.path.normpath(path)
+    tmp_dir = f"{path}.tmp-{uuid.uuid4().hex}"
+    os.makedirs(tmp_dir)
+
+    manifest: Dict[str, Any] = {
+        "version": ARTIFACT_VERSION,
+        "kind": kind,
+        "created_at": datetime.now().isoformat(),
+        "arrays": {},
+        "frames": {},
+        "objects": {},
+        "files": {}
+    }
+
+    def save_array(relpath: str, values: np.ndarray) -> Dict[str, Any]:
+        values = np.ascontiguousarray(values)
+        os.makedirs(os.path.dirname(os.path.join(tmp_dir, relpath)), exist_ok=True)
+        np.save(os.path.join(tmp_dir, relpath), values, allow_pickle=False)
+        return {"file": relpath, "dtype": values.dtype.str, "shape": list(values.shape)}
+
+    try:
+        with open(os.path.join(tmp_dir, METADATA_FILE), "w") as f:
+            json.dump(metadata or {}, f, default=json_default)
+
+        for name, values in (arrays or {}).items():
+            manifest["arrays"][name] = save_array(f"arrays/{name}.npy", values)
+
+        for name, frame in (frames or {}).items():
+            columns = {}
+            for i, column in enumerate(frame.columns):
+                series = frame[column]
+                relpath = f"frames/{name}/{i:03d}.npy"
+                if series.dtype.kind in "biufcmM":
+                    columns[column] = save_array(relpath, series.to_numpy())
+                else:
+                    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+                    columns[column] = {
+                        **save_array(relpath, codes.astype(np.int32)),
+                        "categories": list(uniques)
+                    }
+            manifest["frames"][name] = {"rows": len(frame), "columns": columns}
+
+        for name, obj in (objects or {}).items():
+            relpath = f"objects/{name}.joblib"
+            os.makedirs(os.path.join(tmp_dir, "objects"), exist_ok=True)
+            joblib.dump(obj, os.path.join(tmp_dir, relpath))
+            manifest["objects"][name] = {"file": relpath}
+
+        for root, _, files in os.walk(tmp_dir):
+            for filename in files:
+                full_path = os.path.join(root, filename)
+                relpath = os.path.relpath(full_path, tmp_dir).replace(os.sep, "/")
+                manifest["files"][relpath] = {
+                    "sha256": _sha256(full_path),
+                    "bytes": os.path.getsize(full_path)
+                }
+
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2, default=json_default)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    # Swap the new directory into place
+    if os.path.exists(path):
+        old_dir = f"{path}.old-{uuid.uuid4().hex}"
+        os.replace(path, old_dir)
+        os.replace(tmp_dir, path)
+        shutil.rmtree(old_dir, ignore_errors=True)
+    else:
+        os.replace(tmp_dir, path)
+
+    return manifest
+
+
+def is_artifact(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+
+class ModelArtifact:
+    """A saved model directory opened for reading; arrays are memory-mapped, not copied"""
+
+    def __init__(self, path: str, kind: Optional[str] = None, verify: bool = False,
+                 mmap_mode: Optional[str] = DEFAULT_MMAP_MODE):
+        """
+        Args:
+            path: Artifact directory written by ``write_artifact``
+            kind: Expected model type (None accepts any)
+            verify: Check every file's SHA-256 (reads all bytes); file sizes
+                are always checked
+            mmap_mode: numpy memory-map mode, or None to read arrays into memory
+        """
+        self.path = path
+        self.mmap_mode = mmap_mode
+
+        with open(os.path.join(path, MANIFEST_FILE)) as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("version") != ARTIFACT_VERSION:
+            raise ValueError(f"Unsupported model artifact version: {self.manifest.get('version')}")
+        if kind is not None and self.manifest["kind"] != kind:
+            raise ValueError(f"Artifact at {path} holds a '{self.manifest['kind']}', expected '{kind}'")
+
+        problems = self.verify(checksums=verify)
+        if problems:
+            raise ValueError(f"Corrupt model artifact at {path}: {'; '.join(problems)}")
+
+        with open(os.path.join(path, METADATA_FILE)) as f:
+            self.metadata: Dict[str, Any] = json.load(f)
+
+    @property
+    def kind(self) -> str:
+        return self.manifest["kind"]
+
+    def verify(self, checksums: bool = True) -> List[str]:
+        """
+        Compare the files with the manifest
+
+        Args:
+            checksums: Also hash the contents (otherwise only sizes are
+                compared, plus the metadata checksum)
+
+        Returns:
+            Problems found (empty if the artifact is intact)
+        """
+        problems = []
+        for relpath, expected in self.manifest["files"].items():
+            full_path = os.path.join(self.path, relpath)
+            if not os.path.isfile(full_path):
+                problems.append(f"{relpath} is missing")
+            elif os.path.getsize(full_path) != expected["bytes"]:
+                problems.append(f"{relpath} has {os.path.getsize(full_path)} bytes, expected {expected['bytes']}")
+            elif (checksums or relpath == METADATA_FILE) and _sha256(full_path) != expected["sha256"]:
+                problems.append(f"{relpath} checksum mismatch")
+        return problems
+
+    def _load(self, entry: Dict[str, Any]) -> np.ndarray:
+        return np.load(os.path.join(self.path, entry["file"]), mmap_mode=self.mmap_mode, allow_pickle=False)
+
+    def array(self, name: str) -> np.ndarray:
+        return self._load(self.manifest["arrays"][name])
+
+    def frame(self, name: str) -> pd.DataFrame:
+        """DataFrame whose numeric columns are backed by the memory-mapped files"""
+        entry = self.manifest["frames"][name]
+        columns = {}
+        for column, column_entry in entry["columns"].items():
+            values = self._load(column_entry)
+            if "categories" in column_entry:
+                categories = pd.Index(column_entry["categories"])
+                values = pd.Categorical.from_codes(values, categories).astype(categories.dtype)
+            columns[column] = values
+        return pd.DataFrame(columns, copy=False)
+
+    def object(self, name: str) -> Any:
+        return joblib.load(os.path.join(self.path, self.manifest["objects"][name]["file"]), mmap_mode=self.mmap_mode)
+
+    def has(self, name: str) -> bool:
+        return any(name in self.manifest[section] for section in ("arrays", "frames", "objects"))
@@ -0,0 +1,153 @@
+"""
+Background Model Snapshots
+Saves the models as artifact directories on a worker thread, so a save
+never blocks the API; jobs are tracked by id and can also run periodically
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .model_artifacts import write_artifact
+
+logger = logging.getLogger(__name__)
+
+
+class ModelSnapshotter:
+    """
+    Runs model snapshots as background jobs, one at a time
+
+    Each model is captured under its state lock (``capture_artifact``),
+    which only takes references, and is then written outside the lock to a
+    temp directory that is renamed into place. A save requested while
+    another is still queued joins the queued job instead of adding one.
+    """
+
+    def __init__(self, models: Dict[str, Any], directory: str = "models", max_jobs: int = 50):
+        """
+        Args:
+            models: Name -> model with ``capture_artifact()``; each is saved
+                to ``<directory>/<name>``
+            directory: Where artifacts are written
+            max_jobs: Finished jobs kept for status polling
+        """
+        self.models = models
+        self.directory = directory
+        self.max_jobs = max_jobs
+
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._futures: Dict[str, Future] = {}
+        self._queued_job: Optional[str] = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-snapshot")
+
+    @staticmethod
+    def _copy(job: Dict[str, Any]) -> Dict[str, Any]:
+        return {**job, "models": dict(job["models"])}
+
+    def submit(self, trigger: str = "manual") -> Dict[str, Any]:
+        """
+        Queue a snapshot of every model
+
+        Args:
+            trigger: Recorded in the job ("manual" or "periodic")
+
+        Returns:
+            The job (status "queued"), or the already queued one
+        """
+        with self._lock:
+            if self._queued_job is not None:
+                return self._copy(self.jobs[self._queued_job])
+
+            job_id = uuid.uuid4().hex[:12]
+            self.jobs[job_id] = {
+                "job_id": job_id,
+                "status": "queued",
+                "trigger": trigger,
+                "created_at": datetime.now().isoformat(),
+                "started_at": None,
+                "finished_at": None,
+                "models": {},
+                "error": None
+            }
+            self._queued_job = job_id
+            self._futures[job_id] = self._executor.submit(self._run, job_id)
+
+            # Forget the oldest finished jobs
+            while len(self.jobs) > self.max_jobs:
+                oldest = next(iter(self.jobs))
+                if self.jobs[oldest]["status"] in ("queued", "running"):
+                    break
+                del self.jobs[oldest]
+                self._futures.pop(oldest, None)
+
+            return self._copy(self.jobs[job_id])
+
+    def _run(self, job_id: str):
+        with self._lock:
+            self._queued_job = None
+            job = self.jobs[job_id]
+            job["status"] = "running"
+            job["started_at"] = datetime.now().isoformat()
+
+        start = time.perf_counter()
+        try:
+            for name, model in self.models.items():
+                model_start = time.perf_counter()
+                contents = model.capture_artifact()
+                capture_seconds = time.perf_counter() - model_start
+
+                path = os.path.join(self.directory, name)
+                manifest = write_artifact(path, **contents)
+                with self._lock:
+                    job["models"][name] = {
+                        "path": path,
+                        "bytes": sum(entry["bytes"] for entry in manifest["files"].values()),
+                        "capture_seconds": round(capture_seconds, 4),
+                        "seconds": round(time.perf_counter() - model_start, 3)
+                    }
+            status, error = "succeeded", None
+        except Exception as e:
+            logger.error(f"Model snapshot {job_id} failed: {e}")
+            status, error = "failed", str(e)
+
+        with self._lock:
+            job["status"] = status
+            job["error"] = error
+            job["seconds"] = round(time.perf_counter() - start, 3)
+            job["finished_at"] = datetime.now().isoformat()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current state of a job (None if unknown)"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            return self._copy(job) if job is not None else None
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._copy(next(reversed(self.jobs.values()))) if self.jobs else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Block until a job has finished; returns its final state"""
+        future = self._futures.get(job_id)
+        if future is not None:
+            future.result(timeout=timeout)
+        return self.get(job_id)
+
+    async def run_periodic(self, interval: float):
+        """Submit a snapshot every ``interval`` seconds until cancelled"""
+        while True:
+            await asyncio.sleep(interval)
+            job = self.submit(trigger="periodic")
+            print(f"Periodic model snapshot {job['job_id']} queued")
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker, letting a running snapshot finish; queued ones are dropped"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,226 @@
+"""
+DeFi Prediction Stream
+Recomputes pool predictions once whenever the data or the models change and
+pushes them to every subscriber as Server-Sent Events, so the cost follows
+the number of updates instead of clients times polls
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from .defi_predictor import DeFiPredictor
+
+
+class Subscription:
+    """
+    One client's pending update, filtered to the pools it asked for
+
+    Updates are deltas, so they are never dropped: one that arrives before
+    the client read the previous one is merged into it (latest prediction
+    per pool wins). A slow client skips intermediate versions but always
+    ends up with every pool's latest state, and memory stays bounded by
+    the number of pools.
+    """
+
+    def __init__(self, pool_ids: Optional[Set[str]]):
+        self.pool_ids = pool_ids
+        self.pending: Optional[Dict[str, Any]] = None
+        self.merged = 0
+        self._ready = asyncio.Event()
+
+    def wants(self, pool_id: str) -> bool:
+        return self.pool_ids is None or pool_id in self.pool_ids
+
+    def offer(self, message: Dict[str, Any]):
+        """Add an update, merging it into the pending one if the client has not read that yet"""
+        if self.pending is None:
+            self.pending = {**message, "predictions": dict(message["predictions"]), "removed": set(message["removed"])}
+        else:
+            self.merged += 1
+            pending = self.pending
+            for pool_id, prediction in message["predictions"].items():
+                pending["predictions"][pool_id] = prediction
+                pending["removed"].discard(pool_id)
+            for pool_id in message["removed"]:
+                pending["predictions"].pop(pool_id, None)
+                pending["removed"].add(pool_id)
+            for key in ("version", "days_ahead", "timestamp"):
+                pending[key] = message[key]
+        self._ready.set()
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Take the pending update, waiting up to ``timeout`` seconds (None if none arrived)"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._ready.clear()
+        message, self.pending = self.pending, None
+        message["removed"] = sorted(message["removed"])
+        return message
+
+
+class PredictionBroadcaster:
+    """Fans out DeFi predictions, computed once per change, to all subscribers"""
+
+    def __init__(self, predictor: DeFiPredictor, days_ahead: int = 7, heartbeat: float = 15.0):
+        """
+        Args:
+            predictor: Predictor whose change notifications trigger updates
+            days_ahead: Prediction horizon that is streamed
+            heartbeat: Seconds between keep-alive comments on idle streams
+        """
+        self.predictor = predictor
+        self.days_ahead = days_ahead
+        self.heartbeat = heartbeat
+
+        self.latest: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
+        self.subscribers: List[Subscription] = []
+
+        self._dirty: Set[str] = set()
+        self._all_dirty = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.counters = {"computations": 0, "pools_computed": 0, "messages_sent": 0}
+        self.last_compute_seconds = 0.0
+
+        predictor.add_listener(self._on_change)
+
+    # ---- change tracking -------------------------------------------------
+
+    def _on_change(self, pool_ids: Optional[Set[str]]):
+        """Predictor listener; may be called from worker threads"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._mark_dirty, pool_ids)
+
+    def _mark_dirty(self, pool_ids: Optional[Set[str]]):
+        if pool_ids is None:
+            self._all_dirty = True
+        else:
+            self._dirty |= pool_ids
+        self._wakeup.set()
+
+    def start(self):
+        """Start recomputing on changes (call from the running event loop)"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._mark_dirty(None)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            # Changes arriving while this batch is computed form the next one
+            all_dirty, dirty = self._all_dirty, self._dirty
+            self._all_dirty, self._dirty = False, set()
+            try:
+                await self._recompute(None if all_dirty else dirty)
+            except Exception as e:
+                print(f"Prediction stream update failed: {e}")
+
+    async def _recompute(self, pool_ids: Optional[Set[str]]):
+        """Predict the changed pools once and publish the result"""
+        current = {pool['id'] for pool in self.predictor.pools}
+        targets = current if pool_ids is None else pool_ids & current
+        removed = (set(self.latest) - current) if pool_ids is None else (pool_ids & set(self.latest)) - current
+
+        start = time.perf_counter()
+        predictions = await asyncio.to_thread(self.predictor.predict_pools, targets, self.days_ahead)
+        self.last_compute_seconds = time.perf_counter() - start
+        self.counters["computations"] += 1
+        self.counters["pools_computed"] += len(predictions)
+
+        self.latest.update(predictions)
+        for pool_id in removed:
+            self.latest.pop(pool_id, None)
+        self.version += 1
+
+        for subscription in self.subscribers:
+            message = self._message(subscription, predictions, removed)
+            if message is not None:
+                subscription.offer(message)
+
+    def _message(self, subscription: Subscription, predictions: Dict[str, Dict[str, Any]],
+                 removed: Set[str]) -> Optional[Dict[str, Any]]:
+        """The part of an update a subscriber asked for (None if nothing)"""
+        wanted = {pool_id: p for pool_id, p in predictions.items() if subscription.wants(pool_id)}
+        wanted_removed = sorted(pool_id for pool_id in removed if subscription.wants(pool_id))
+        if not wanted and not wanted_removed:
+            return None
+        return {
+            "version": self.version,
+            "days_ahead": self.days_ahead,
+            "predictions": wanted,
+            "removed": wanted_removed,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    # ---- subscribers -----------------------------------------------------
+
+    def subscribe(self, pool_ids: Optional[Set[str]] = None) -> Subscription:
+        """
+        Register a subscriber; it first receives the current predictions
+
+        Args:
+            pool_ids: Pools to receive updates for (None for all)
+        """
+        subscription = Subscription(pool_ids)
+        message = self._message(subscription, self.latest, set())
+        if message is not None:
+            subscription.offer(message)
+        self.subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        if subscription in self.subscribers:
+            self.subscribers.remove(subscription)
+
+    async def events(self, pool_ids: Optional[Set[str]] = None) -> AsyncIterator[str]:
+        """
+        Server-Sent Events stream of a new subscription, with keep-alive comments
+
+        The subscription exists while the stream is consumed, so a client
+        that disconnects is dropped when the stream is closed.
+
+        Args:
+            pool_ids: Pools to receive updates for (None for all)
+        """
+        subscription = self.subscribe(pool_ids)
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                message = await subscription.next(timeout=self.heartbeat)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                self.counters["messages_sent"] += 1
+                yield f"id: {message['version']}\nevent: predictions\ndata: {json.dumps(message, default=str)}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "version": self.version,
+            "subscribers": len(self.subscribers),
+            "merged_messages": sum(subscription.merged for subscription in self.subscribers),
+            "last_compute_seconds": round(self.last_compute_seconds, 4),
+            "pools": len(self.latest)
+        }
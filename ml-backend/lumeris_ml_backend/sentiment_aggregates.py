@@ -0,0 +1,287 @@
+"""
+Rolling Sentiment Aggregates
+Continuously updated per-category sentiment counts and polarity sums in
+fixed-size time-bucket arrays (1-minute and 1-hour rollups), so dashboard
+queries never re-analyze or rescan comments
+"""
+
+import threading
+import time
+import numpy as np
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+SENTIMENTS = ("positive", "negative", "neutral")
+
+# Where comments in unknown categories are counted
+FALLBACK_CATEGORY = "general"
+
+# Resolution name -> (bucket length in seconds, buckets kept)
+DEFAULT_RESOLUTIONS = {
+    "1m": (60, 24 * 60),
+    "1h": (3600, 30 * 24),
+}
+
+
+def summarize_sentiments(
+    counts: np.ndarray,
+    polarity_sums: np.ndarray,
+    categories: List[str]
+) -> Dict[str, Any]:
+    """
+    Aggregate statistics from per-category counters
+
+    Args:
+        counts: (n_categories, 3) comment counts per sentiment (SENTIMENTS order)
+        polarity_sums: (n_categories,) summed polarity per category
+        categories: Category names along the first axis
+
+    Returns:
+        Totals, sentiment distribution, average polarity and per-category breakdown
+    """
+
+    totals = counts.sum(axis=0)
+    total = int(totals.sum())
+    avg_polarity = float(polarity_sums.sum()) / total if total > 0 else 0
+    positive, negative, neutral = (int(n) for n in totals)
+
+    category_breakdown = {}
+    for category, category_counts in zip(categories, counts):
+        category_total = int(category_counts.sum())
+        if category_total:
+            category_breakdown[category] = {
+                "positive": int(category_counts[0]),
+                "negative": int(category_counts[1]),
+                "neutral": int(category_counts[2]),
+                "total": category_total
+            }
+
+    return {
+        "total_comments": total,
+        "sentiment_distribution": {
+            "positive": positive,
+            "negative": negative,
+            "neutral": neutral,
+            "positive_pct": round(positive / total * 100, 1) if total else 0.0,
+            "negative_pct": round(negative / total * 100, 1) if total else 0.0,
+            "neutral_pct": round(neutral / total * 100, 1) if total else 0.0
+        },
+        "average_polarity": round(avg_polarity, 3),
+        "overall_sentiment": "positive" if avg_polarity > 0.1 else "negative" if avg_polarity < -0.1 else "neutral",
+        "category_breakdown": category_breakdown,
+    }
+
+
+class _Rollup:
+    """Ring of time buckets holding (category x sentiment) counts and polarity sums"""
+
+    def __init__(self, bucket_seconds: int, n_buckets: int, n_categories: int):
+        self.bucket_seconds = bucket_seconds
+        self.n_buckets = n_buckets
+        self.bucket_ids = np.full(n_buckets, -1, dtype=np.int64)
+        self.counts = np.zeros((n_buckets, n_categories, len(SENTIMENTS)), dtype=np.int64)
+        self.polarity = np.zeros((n_buckets, n_categories), dtype=np.float64)
+
+    def add(self, epochs: np.ndarray, category_idx: np.ndarray, sentiment_idx: np.ndarray,
+            polarities: np.ndarray, now: float) -> np.ndarray:
+        """Count rows into their buckets; returns the mask of rows that were in range"""
+
+        current = int(now // self.bucket_seconds)
+        bucket_ids = np.minimum((epochs // self.bucket_seconds).astype(np.int64), current)
+        in_range = bucket_ids > current - self.n_buckets
+
+        # Claim slots for newer buckets, zeroing the expired data they held
+        for bucket_id in np.unique(bucket_ids[in_range]):
+            slot = bucket_id % self.n_buckets
+            if self.bucket_ids[slot] < bucket_id:
+                self.bucket_ids[slot] = bucket_id
+                self.counts[slot] = 0
+                self.polarity[slot] = 0.0
+
+        slots = bucket_ids % self.n_buckets
+        in_range &= self.bucket_ids[slots] == bucket_ids
+
+        np.add.at(self.counts, (slots[in_range], category_idx[in_range], sentiment_idx[in_range]), 1)
+        np.add.at(self.polarity, (slots[in_range], category_idx[in_range]), polarities[in_range])
+        return in_range
+
+    def live_slots(self, now: float, n_last: int) -> np.ndarray:
+        """Slots of the latest ``n_last`` buckets that hold data, oldest first"""
+        current = int(now // self.bucket_seconds)
+        live = (self.bucket_ids > current - n_last) & (self.bucket_ids <= current)
+        slots = np.flatnonzero(live)
+        return slots[np.argsort(self.bucket_ids[slots])]
+
+
+class SentimentAggregateStore:
+    """Streaming store of analyzed comments, queried per window and category"""
+
+    def __init__(
+        self,
+        resolutions: Optional[Dict[str, Tuple[int, int]]] = None,
+        categories: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            resolutions: Resolution name -> (bucket seconds, buckets kept)
+            categories: Categories counted separately; comments in any other
+                category are counted under FALLBACK_CATEGORY, so the arrays
+                never grow with client input
+        """
+        self.categories: List[str] = list(categories or ['gaming', 'defi', 'nft', 'governance', 'general'])
+        if FALLBACK_CATEGORY not in self.categories:
+            self.categories.append(FALLBACK_CATEGORY)
+        self._category_index = {category: i for i, category in enumerate(self.categories)}
+        self.rollups = {
+            name: _Rollup(bucket_seconds, n_buckets, len(self.categories))
+            for name, (bucket_seconds, n_buckets) in (resolutions or DEFAULT_RESOLUTIONS).items()
+        }
+
+        self.ingested = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _to_epochs(timestamps: List[Any], now: float) -> np.ndarray:
+        """Epoch seconds of ISO strings / datetimes / numbers (missing -> now)"""
+        parsed: Dict[Any, float] = {}
+        epochs = np.empty(len(timestamps), dtype=np.float64)
+        for i, timestamp in enumerate(timestamps):
+            if timestamp is None:
+                epochs[i] = now
+            elif isinstance(timestamp, (int, float)):
+                epochs[i] = timestamp
+            else:
+                # Results of one batch share a timestamp, so parse each once
+                if timestamp not in parsed:
+                    value = timestamp
+                    if isinstance(value, str):
+                        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                    parsed[timestamp] = value.timestamp()
+                epochs[i] = parsed[timestamp]
+        return epochs
+
+    def ingest(self, results: List[Dict[str, Any]]) -> int:
+        """
+        Add analyzed comments
+
+        Args:
+            results: Analyses as returned by SentimentAnalyzer (uses
+                'sentiment', 'polarity', 'category' and 'timestamp')
+
+        Returns:
+            Number of comments counted in at least one rollup
+        """
+
+        rows = [result for result in results if result.get('sentiment') in SENTIMENTS]
+        now = time.time()
+
+        fallback = self._category_index[FALLBACK_CATEGORY]
+
+        with self._lock:
+            epochs = self._to_epochs([result.get('timestamp') for result in rows], now)
+            category_idx = np.array(
+                [self._category_index.get(result.get('category'), fallback) for result in rows], dtype=np.int64
+            )
+            sentiment_idx = np.array([SENTIMENTS.index(result['sentiment']) for result in rows], dtype=np.int64)
+            polarities = np.array([result.get('polarity', 0.0) for result in rows], dtype=np.float64)
+
+            counted = np.zeros(len(rows), dtype=bool)
+            for rollup in self.rollups.values():
+                counted |= rollup.add(epochs, category_idx, sentiment_idx, polarities, now)
+
+            self.ingested += int(counted.sum())
+            self.dropped += len(results) - int(counted.sum())
+
+        return int(counted.sum())
+
+    def query(
+        self,
+        resolution: str = "1m",
+        buckets: int = 60,
+        category: Optional[str] = None,
+        include_series: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Aggregate the latest buckets of a rollup
+
+        Cost is O(buckets x categories), independent of how many comments
+        were ingested.
+
+        Args:
+            resolution: Rollup name ("1m" or "1h" by default)
+            buckets: How many of the latest buckets to cover
+            category: Restrict to one category (None for all)
+            include_series: Also return per-bucket counts and polarity
+
+        Returns:
+            Same aggregate fields as SentimentAnalyzer.analyze_batch, plus the
+            window covered and optionally the time series
+        """
+
+        if resolution not in self.rollups:
+            raise ValueError(f"Unknown resolution '{resolution}', expected one of {list(self.rollups)}")
+
+        now = time.time()
+        with self._lock:
+            rollup = self.rollups[resolution]
+            buckets = max(1, min(buckets, rollup.n_buckets))
+            slots = rollup.live_slots(now, buckets)
+
+            counts = rollup.counts[slots]
+            polarity = rollup.polarity[slots]
+            categories = list(self.categories)
+            if category is not None:
+                index = self._category_index.get(category)
+                if index is None:
+                    counts = counts[:, :0]
+                    polarity = polarity[:, :0]
+                    categories = []
+                else:
+                    counts = counts[:, index:index + 1]
+                    polarity = polarity[:, index:index + 1]
+                    categories = [category]
+
+            summary = summarize_sentiments(counts.sum(axis=0), polarity.sum(axis=0), categories)
+            summary["window"] = {
+                "resolution": resolution,
+                "bucket_seconds": rollup.bucket_seconds,
+                "buckets": buckets,
+                "seconds": buckets * rollup.bucket_seconds
+            }
+
+            if include_series:
+                per_bucket = counts.sum(axis=1)
+                totals = per_bucket.sum(axis=1)
+                polarity_sums = polarity.sum(axis=1)
+                summary["series"] = [
+                    {
+                        "bucket_start": datetime.fromtimestamp(int(bucket_id) * rollup.bucket_seconds).isoformat(),
+                        "positive": int(row[0]),
+                        "negative": int(row[1]),
+                        "neutral": int(row[2]),
+                        "average_polarity": round(float(polarity_sum) / int(total), 3) if total else 0.0
+                    }
+                    for bucket_id, row, total, polarity_sum in zip(
+                        rollup.bucket_ids[slots], per_bucket, totals, polarity_sums
+                    )
+                ]
+
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        """Ingestion counters and memory held by the rollup arrays"""
+        with self._lock:
+            return {
+                "ingested": self.ingested,
+                "dropped": self.dropped,
+                "categories": list(self.categories),
+                "resolutions": {
+                    name: {
+                        "bucket_seconds": rollup.bucket_seconds,
+                        "buckets": rollup.n_buckets,
+                        "bytes": int(rollup.counts.nbytes + rollup.polarity.nbytes + rollup.bucket_ids.nbytes)
+                    }
+                    for name, rollup in self.rollups.items()
+                }
+            }
@@ -1,25 +1,75 @@
 """
 Sentiment Analysis for User Comments
-Uses TextBlob and custom ML model for analyzing user sentiment
+Uses TextBlob (or a fast lexical backend) and custom ML model for analyzing user sentiment
 """
 
 import numpy as np
-from textblob import TextBlob
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.pipeline import Pipeline
 import joblib
-from typing import Dict, List, Any
+import copy
+import hashlib
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Any, Optional
 from datetime import datetime
+from .sentiment_parallel import SentimentWorkerPool
+from .cache import LRUCache
+from .emotion_lexicon import EmotionLexicon, DEFAULT_LEXICON_PATH
+from .fast_scorer import FastSentimentScorer
+from .model_artifacts import ModelArtifact, is_artifact, write_artifact
+from .sentiment_aggregates import SENTIMENTS, summarize_sentiments
+from .lexical_backends import LexicalBackend, get_lexical_backend
+from .incremental_training import IncrementalSentimentTrainer, DEFAULT_N_FEATURES
+
+
+def _text_hash(text: str) -> str:
+    """Hash of a comment with whitespace runs collapsed"""
+    normalized = " ".join(text.split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
 
 
 class SentimentAnalyzer:
     """Sentiment analysis for user comments with context awareness"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_size: int = 10000,
+        emotion_lexicon_path: str = DEFAULT_LEXICON_PATH,
+        lexical_backend: str = "textblob"
+    ):
+        """
+        Args:
+            cache_size: Analyses (and phrase lists) kept in the LRU result
+                caches; repeated comments are served from them (0 disables)
+            emotion_lexicon_path: JSON or CSV emotion lexicon (see EmotionLexicon)
+            lexical_backend: Polarity and noun-phrase backend, "textblob" or
+                the faster, approximate "fast" (see lexical_backends)
+        """
         self.model = None
         self.vectorizer = None
+        self.training_data = []
+
+        # NumPy compilation of self.model used for scoring (see _compile_scorer)
+        self.fast_scorer = None
         self.categories = ['gaming', 'defi', 'nft', 'governance', 'general']
+        self.emotion_lexicon = EmotionLexicon.from_file(emotion_lexicon_path)
+        self.lexical_backend: LexicalBackend = get_lexical_backend(lexical_backend)
+
+        # Results keyed on (text hash, category, model version); noun phrases
+        # do not depend on the model and are keyed on the text hash alone
+        self.model_version = 0
+        self.result_cache = LRUCache(cache_size)
+        self.phrase_cache = LRUCache(cache_size)
+
+        # Optional process pool for large batches (see enable_parallel)
+        self.worker_pool = None
+        self._parallel_config = None
+
+        # Held while state is replaced, so snapshots never see a half-updated model
+        self._state_lock = threading.RLock()
 
     def initialize_with_mock_data(self):
         """Initialize with mock comment data"""
@@ -76,7 +126,7 @@ class SentimentAnalyzer:
         labels = [item[1] for item in self.training_data]
 
         # Create pipeline: TF-IDF + Naive Bayes
-        self.model = Pipeline([
+        model = Pipeline([
             ('tfidf', TfidfVectorizer(
                 max_features=1000,
                 ngram_range=(1, 2),
@@ -85,11 +135,222 @@ class SentimentAnalyzer:
             ('classifier', MultinomialNB(alpha=0.1))
         ])
 
-        # Train model
-        self.model.fit(texts, labels)
+        # Train model, then swap it in so snapshots never see it half-fitted
+        model.fit(texts, labels)
+        with self._state_lock:
+            self.model = model
+            self._on_model_changed()
 
         print(f"Model trained on {len(texts)} samples")
 
+    def train_incremental(
+        self,
+        source: str,
+        checkpoint_path: str = "models/sentiment_incremental.ckpt",
+        chunk_size: int = 10000,
+        n_features: int = DEFAULT_N_FEATURES,
+        resume: bool = True,
+        publish_every: int = 1,
+        text_field: str = 'text',
+        label_field: str = 'label'
+    ) -> Dict[str, Any]:
+        """
+        Train on a labeled JSONL/CSV file too large for memory
+
+        Uses a hashing vectorizer and partial_fit over streamed chunks
+        instead of the in-memory TF-IDF fit. A checkpoint is written after
+        every chunk, so an interrupted run resumes where it stopped.
+
+        Args:
+            source: Labeled comments file (see iter_labeled_chunks)
+            checkpoint_path: Checkpoint file used for resuming
+            chunk_size: Rows per partial_fit step
+            n_features: Hashed feature space size
+            resume: Continue from an existing checkpoint of the same source
+            publish_every: Swap the serving model every N chunks (it is
+                always swapped once training finishes)
+            text_field: Column holding the comment text
+            label_field: Column holding the sentiment label
+
+        Returns:
+            Training progress and timing
+        """
+
+        trainer = IncrementalSentimentTrainer(
+            checkpoint_path,
+            n_features=n_features,
+            chunk_size=chunk_size
+        )
+
+        published = {"chunks": None}
+
+        def publish(model, state):
+            if state['chunks'] % publish_every == 0:
+                # Serve a frozen copy while training keeps updating the original
+                frozen = copy.deepcopy(model)
+                with self._state_lock:
+                    self.model = frozen
+                    self._on_model_changed()
+                published['chunks'] = state['chunks']
+
+        report = trainer.train(
+            source,
+            resume=resume,
+            text_field=text_field,
+            label_field=label_field,
+            on_checkpoint=publish
+        )
+
+        if report['rows_trained'] > 0 and published['chunks'] != report['chunks']:
+            with self._state_lock:
+                self.model = trainer.model
+                self._on_model_changed()
+
+        return report
+
+    def apply_comment_changes(self, upserts: List[Dict[str, Any]], deleted_ids: List[str]) -> Dict[str, int]:
+        """
+        Update the classifier with newly labeled comments via partial_fit
+
+        The vectorizer is kept as is (words it has not seen are ignored
+        until the next full retrain). Deleted comments cannot be unlearned
+        incrementally and are only counted.
+
+        Args:
+            upserts: Comments with 'text' and 'label' ('positive', 'negative' or 'neutral')
+            deleted_ids: IDs of deleted comments
+
+        Returns:
+            Number of comments learned, skipped and deleted
+        """
+
+        if self.model is None:
+            raise ValueError("Sentiment model is not initialized")
+
+        classifier = self.model[-1]
+        labeled = [
+            (comment['text'], comment['label']) for comment in upserts
+            if comment.get('text') and comment.get('label') in classifier.classes_
+        ]
+
+        if labeled:
+            # Update a copy so requests keep using a consistent model meanwhile
+            model = copy.deepcopy(self.model)
+            texts = [text for text, _ in labeled]
+            model[-1].partial_fit(model[:-1].transform(texts), [label for _, label in labeled])
+            with self._state_lock:
+                self.model = model
+                self.training_data.extend(labeled)
+                self._on_model_changed()
+
+        return {"learned": len(labeled), "skipped": len(upserts) - len(labeled), "deleted": len(deleted_ids)}
+
+    def _on_model_changed(self, fast_scorer: Optional[FastSentimentScorer] = None):
+        """Recompile the scorer for a new model, then drop stale results"""
+        self.fast_scorer = fast_scorer or self._compile_scorer(self.model)
+        self._invalidate_results()
+
+    def _invalidate_results(self):
+        """Drop results of the previous pipeline (model, lexicon or backend) and refresh the workers"""
+        self.model_version += 1
+        self.result_cache.invalidate()
+
+        # Workers hold a copy of the model, so they must be restarted
+        self._restart_parallel()
+
+    @staticmethod
+    def _compile_scorer(model) -> Optional[FastSentimentScorer]:
+        """Fast scorer for a pipeline, or None if it cannot be reproduced exactly"""
+        if model is None:
+            return None
+        try:
+            return FastSentimentScorer.from_pipeline(model)
+        except ValueError:
+            return None
+
+    def export_fast_scorer(self, filepath: str):
+        """Save the compiled scorer (vocabulary, IDF and class log-probabilities) as .npz"""
+        if self.fast_scorer is None:
+            raise ValueError("Current model cannot be compiled to a fast scorer")
+        self.fast_scorer.save(filepath)
+        print(f"Fast scorer saved to {filepath}")
+
+    def load_fast_scorer(self, filepath: str):
+        """Serve predictions from an exported scorer instead of a pickled pipeline"""
+        scorer = FastSentimentScorer.load(filepath)
+        with self._state_lock:
+            self.model = None
+            self._on_model_changed(scorer)
+        print(f"Fast scorer loaded from {filepath}")
+
+    def set_lexical_backend(self, name: str):
+        """Switch the polarity/noun-phrase backend ("textblob" or "fast")"""
+        self.lexical_backend = get_lexical_backend(name)
+
+        # Cached analyses and phrases came from the previous backend
+        self.phrase_cache.invalidate()
+        self._invalidate_results()
+
+    def load_emotion_lexicon(self, path: str):
+        """Swap in a different emotion lexicon"""
+        self.emotion_lexicon = EmotionLexicon.from_file(path)
+
+        # Cached results carry emotions from the old lexicon
+        self._invalidate_results()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit rates of the result and noun-phrase caches"""
+        return {
+            "results": self.result_cache.stats(),
+            "phrases": self.phrase_cache.stats(),
+            "model_version": self.model_version
+        }
+
+    def enable_parallel(self, workers: Optional[int] = None, chunk_size: int = 256, min_batch_size: int = 512):
+        """
+        Run large batches and trending-topic extraction in a process pool
+
+        Args:
+            workers: Worker processes (defaults to CPU count)
+            chunk_size: Comments sent to a worker per task
+            min_batch_size: Smaller batches stay in-process, where they are
+                faster than the round trip to the pool
+        """
+        self.disable_parallel()
+        self._parallel_config = {
+            "workers": workers,
+            "chunk_size": chunk_size,
+            "min_batch_size": min_batch_size
+        }
+        self._restart_parallel()
+
+    def disable_parallel(self):
+        """Shut the process pool down and go back to in-process analysis"""
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+        self.worker_pool = None
+        self._parallel_config = None
+
+    def _restart_parallel(self):
+        """(Re)start the worker pool with the current model"""
+        classifier = self.fast_scorer or self.model
+        if self._parallel_config is None or classifier is None:
+            return
+
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+        self.worker_pool = SentimentWorkerPool(
+            classifier,
+            self.categories,
+            self.emotion_lexicon,
+            self.lexical_backend.name,
+            workers=self._parallel_config['workers'],
+            chunk_size=self._parallel_config['chunk_size']
+        )
+
+    def _use_parallel(self, n_items: int) -> bool:
+        return self.worker_pool is not None and n_items >= self._parallel_config['min_batch_size']
+
     def analyze_comment(self, text: str, category: str = "general") -> Dict[str, Any]:
         """
         Analyze sentiment of a single comment
@@ -101,54 +362,142 @@ class SentimentAnalyzer:
         Returns:
             Dictionary with sentiment analysis results
         """
+        return self._analyze_cached([text], [category])[0]
 
-        # Get TextBlob sentiment (baseline)
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity  # -1 to 1
-        subjectivity = blob.sentiment.subjectivity  # 0 to 1
+    def analyze_comments(self, texts: List[str], categories: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze several comments without aggregating them
 
-        # Get ML model prediction
-        if self.model:
-            sentiment_pred = self.model.predict([text])[0]
-            confidence = np.max(self.model.predict_proba([text])[0])
-        else:
-            # Fallback if model not trained
-            if polarity > 0.1:
-                sentiment_pred = "positive"
-            elif polarity < -0.1:
-                sentiment_pred = "negative"
+        Args:
+            texts: Comment texts
+            categories: Category per text (default "general")
+
+        Returns:
+            One analysis per text, in order (same fields as analyze_comment)
+        """
+        if categories is None:
+            categories = ["general"] * len(texts)
+        return self._analyze_cached(texts, categories)
+
+    def _analyze_cached(self, texts: List[str], categories: List[str]) -> List[Dict[str, Any]]:
+        """Serve repeated comments from the result cache and analyze the rest once"""
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending: Dict[tuple, List[int]] = {}
+
+        for i, (text, category) in enumerate(zip(texts, categories)):
+            key = (_text_hash(text), category, self.model_version)
+            if key in pending:
+                # Duplicate within this batch: analyzed once below
+                pending[key].append(i)
+                continue
+
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[key] = [i]
+
+        if pending:
+            keys = list(pending)
+            miss_texts = [texts[pending[key][0]] for key in keys]
+            miss_categories = [categories[pending[key][0]] for key in keys]
+
+            start = time.perf_counter()
+            if self._use_parallel(len(miss_texts)):
+                analyses = self.worker_pool.analyze(miss_texts, miss_categories)
             else:
-                sentiment_pred = "neutral"
-            confidence = abs(polarity)
-
-        # Combine both approaches for final sentiment
-        if sentiment_pred == "positive" and polarity > 0:
-            final_sentiment = "positive"
-            final_confidence = (confidence + polarity) / 2
-        elif sentiment_pred == "negative" and polarity < 0:
-            final_sentiment = "negative"
-            final_confidence = (confidence + abs(polarity)) / 2
+                analyses = self._analyze_texts(miss_texts, miss_categories)
+            cost = (time.perf_counter() - start) / len(keys)
+
+            for key, analysis in zip(keys, analyses):
+                # Text and timestamp belong to each request, not to the cached result
+                cached = {k: v for k, v in analysis.items() if k not in ("text", "timestamp")}
+                self.result_cache.put(key, cached, cost)
+                for i in pending[key]:
+                    results[i] = cached
+
+        # Cached entries are shared by every request for the same comment, so
+        # each response gets its own nested containers to modify freely
+        timestamp = datetime.now().isoformat()
+        return [
+            {
+                "text": text,
+                **result,
+                "key_phrases": list(result["key_phrases"]),
+                "emotions": dict(result["emotions"]),
+                "timestamp": timestamp
+            }
+            for text, result in zip(texts, results)
+        ]
+
+    def _analyze_texts(self, texts: List[str], categories: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several comments with one pass through the ML pipeline
+
+        All texts are vectorized and classified together, and each text is
+        parsed by the lexical backend only once for polarity and noun phrases.
+        """
+
+        if not texts:
+            return []
+
+        # Get ML model predictions for every text at once
+        classifier = self.fast_scorer or self.model
+        if classifier:
+            probabilities = classifier.predict_proba(texts)
+            predictions = classifier.classes_[np.argmax(probabilities, axis=1)]
+            confidences = np.max(probabilities, axis=1)
         else:
-            final_sentiment = sentiment_pred
-            final_confidence = confidence * 0.7
+            predictions = [None] * len(texts)
+            confidences = [None] * len(texts)
 
-        # Extract key phrases
-        key_phrases = self._extract_key_phrases(text)
+        # Match emotion keywords for the whole batch
+        keyword_scores = self.emotion_lexicon.score_batch(texts)
 
-        # Emotion detection
-        emotions = self._detect_emotions(text, polarity, subjectivity)
+        timestamp = datetime.now().isoformat()
+        results = []
 
-        return {
-            "text": text,
-            "sentiment": final_sentiment,
-            "confidence": float(final_confidence),
-            "polarity": float(polarity),
-            "subjectivity": float(subjectivity),
-            "category": category,
-            "key_phrases": key_phrases,
-            "emotions": emotions,
-            "timestamp": datetime.now().isoformat()
-        }
+        for text, category, sentiment_pred, confidence, scores in zip(
+            texts, categories, predictions, confidences, keyword_scores
+        ):
+            # Get lexical sentiment (baseline) and phrases from a single parse
+            polarity, subjectivity, noun_phrases = self.lexical_backend.analyze(text)
+
+            if sentiment_pred is None:
+                # Fallback if model not trained
+                if polarity > 0.1:
+                    sentiment_pred = "positive"
+                elif polarity < -0.1:
+                    sentiment_pred = "negative"
+                else:
+                    sentiment_pred = "neutral"
+                confidence = abs(polarity)
+
+            # Combine both approaches for final sentiment
+            if sentiment_pred == "positive" and polarity > 0:
+                final_sentiment = "positive"
+                final_confidence = (confidence + polarity) / 2
+            elif sentiment_pred == "negative" and polarity < 0:
+                final_sentiment = "negative"
+                final_confidence = (confidence + abs(polarity)) / 2
+            else:
+                final_sentiment = str(sentiment_pred)
+                final_confidence = confidence * 0.7
+
+            results.append({
+                "text": text,
+                "sentiment": final_sentiment,
+                "confidence": float(final_confidence),
+                "polarity": float(polarity),
+                "subjectivity": float(subjectivity),
+                "category": category,
+                "key_phrases": self._extract_key_phrases(noun_phrases),
+                "emotions": self._detect_emotions(text, polarity, subjectivity, scores),
+                "timestamp": timestamp
+            })
+
+        return results
 
     def analyze_batch(self, comments: List[Dict[str, str]]) -> Dict[str, Any]:
         """
@@ -161,83 +510,47 @@ class SentimentAnalyzer:
             Aggregate sentiment analysis
         """
 
-        results = []
-        sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-        category_sentiments = {cat: [] for cat in self.categories}
-        total_polarity = 0
-
-        for comment in comments:
-            text = comment.get('text', '')
-            category = comment.get('category', 'general')
-
-            analysis = self.analyze_comment(text, category)
-            results.append(analysis)
-
-            sentiment_counts[analysis['sentiment']] += 1
-            category_sentiments[category].append(analysis['sentiment'])
-            total_polarity += analysis['polarity']
-
-        # Calculate aggregate metrics
-        total = len(comments)
-        avg_polarity = total_polarity / total if total > 0 else 0
-
-        # Category breakdown
-        category_breakdown = {}
-        for cat, sentiments in category_sentiments.items():
-            if sentiments:
-                category_breakdown[cat] = {
-                    "positive": sentiments.count("positive"),
-                    "negative": sentiments.count("negative"),
-                    "neutral": sentiments.count("neutral"),
-                    "total": len(sentiments)
-                }
+        texts = [comment.get('text', '') for comment in comments]
+        categories = [comment.get('category', 'general') for comment in comments]
+        results = self._analyze_cached(texts, categories)
+
+        # Count into a (category x sentiment) matrix in one pass
+        category_index = {cat: i for i, cat in enumerate(self.categories)}
+        for category in categories:
+            category_index.setdefault(category, len(category_index))
+        counts = np.zeros((len(category_index), len(SENTIMENTS)), dtype=np.int64)
+        polarity_sums = np.zeros(len(category_index), dtype=np.float64)
+
+        rows = np.array([category_index[analysis['category']] for analysis in results], dtype=np.int64)
+        columns = np.array([SENTIMENTS.index(analysis['sentiment']) for analysis in results], dtype=np.int64)
+        np.add.at(counts, (rows, columns), 1)
+        np.add.at(polarity_sums, rows, [analysis['polarity'] for analysis in results])
 
         return {
-            "total_comments": total,
-            "sentiment_distribution": {
-                "positive": sentiment_counts["positive"],
-                "negative": sentiment_counts["negative"],
-                "neutral": sentiment_counts["neutral"],
-                "positive_pct": round(sentiment_counts["positive"] / total * 100, 1),
-                "negative_pct": round(sentiment_counts["negative"] / total * 100, 1),
-                "neutral_pct": round(sentiment_counts["neutral"] / total * 100, 1)
-            },
-            "average_polarity": round(avg_polarity, 3),
-            "overall_sentiment": "positive" if avg_polarity > 0.1 else "negative" if avg_polarity < -0.1 else "neutral",
-            "category_breakdown": category_breakdown,
+            **summarize_sentiments(counts, polarity_sums, list(category_index)),
             "individual_results": results,
             "timestamp": datetime.now().isoformat()
         }
 
-    def _extract_key_phrases(self, text: str) -> List[str]:
-        """Extract important phrases from text"""
-
-        blob = TextBlob(text)
-        noun_phrases = list(blob.noun_phrases)
+    def _extract_key_phrases(self, noun_phrases: List[str]) -> List[str]:
+        """Extract important phrases from a parsed comment"""
 
         # Get top 3 noun phrases
         return noun_phrases[:3] if noun_phrases else []
 
-    def _detect_emotions(self, text: str, polarity: float, subjectivity: float) -> Dict[str, float]:
+    def _detect_emotions(
+        self,
+        text: str,
+        polarity: float,
+        subjectivity: float,
+        keyword_scores: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
         """Detect emotional tone from text"""
 
-        text_lower = text.lower()
-        emotions = {}
-
-        # Keyword-based emotion detection
-        emotion_keywords = {
-            'joy': ['amazing', 'love', 'awesome', 'great', 'excellent', 'best', 'wonderful', 'fantastic'],
-            'anger': ['terrible', 'worst', 'hate', 'awful', 'horrible', 'disgusting', 'angry'],
-            'sadness': ['disappointed', 'sad', 'unfortunate', 'poor', 'bad', 'lost'],
-            'fear': ['worried', 'concerned', 'afraid', 'risky', 'dangerous', 'unsafe'],
-            'surprise': ['wow', 'incredible', 'unbelievable', 'shocking', 'unexpected'],
-            'trust': ['reliable', 'trustworthy', 'transparent', 'fair', 'honest']
-        }
-
-        for emotion, keywords in emotion_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            if score > 0:
-                emotions[emotion] = min(score / len(keywords), 1.0)
+        # Keyword-based emotion detection (whole-token lexicon matches)
+        if keyword_scores is None:
+            keyword_scores = self.emotion_lexicon.score(text)
+        emotions = dict(keyword_scores)
 
         # Add intensity based on polarity and subjectivity
         if polarity > 0.5 and subjectivity > 0.5:
@@ -247,40 +560,94 @@ class SentimentAnalyzer:
 
         return emotions
 
+    def _noun_phrases(self, comments: List[str]) -> List[List[str]]:
+        """Noun phrases of each comment"""
+        return [self.lexical_backend.noun_phrases(comment) for comment in comments]
+
+    def extract_phrases(self, comments: List[str]) -> List[List[str]]:
+        """Noun phrases of each comment, parsing each distinct text once"""
+
+        hashes = [_text_hash(comment) for comment in comments]
+        phrases: Dict[str, List[str]] = {}
+        missing: Dict[str, str] = {}
+
+        for text_hash, comment in zip(hashes, comments):
+            if text_hash in phrases or text_hash in missing:
+                continue
+            cached = self.phrase_cache.get(text_hash)
+            if cached is not None:
+                phrases[text_hash] = cached
+            else:
+                missing[text_hash] = comment
+
+        if missing:
+            start = time.perf_counter()
+            if self._use_parallel(len(missing)):
+                extracted = self.worker_pool.extract_phrases(list(missing.values()))
+            else:
+                extracted = self._noun_phrases(list(missing.values()))
+            cost = (time.perf_counter() - start) / len(missing)
+
+            for text_hash, comment_phrases in zip(missing, extracted):
+                self.phrase_cache.put(text_hash, comment_phrases, cost)
+                phrases[text_hash] = comment_phrases
+
+        return [phrases[text_hash] for text_hash in hashes]
+
+    def _count_phrases(self, comments: List[str]) -> Counter:
+        """Count noun phrases across comments"""
+        phrase_counts = Counter()
+        for comment_phrases in self.extract_phrases(comments):
+            phrase_counts.update(comment_phrases)
+        return phrase_counts
+
     def get_trending_topics(self, comments: List[str]) -> List[Dict[str, Any]]:
         """Extract trending topics from comments"""
 
-        all_phrases = []
-        for comment in comments:
-            blob = TextBlob(comment)
-            all_phrases.extend(blob.noun_phrases)
-
-        # Count frequency
-        phrase_counts = {}
-        for phrase in all_phrases:
-            phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
+        phrase_counts = self._count_phrases(comments)
 
         # Sort by frequency
         trending = sorted(phrase_counts.items(), key=lambda x: x[1], reverse=True)[:10]
 
         return [{"topic": topic, "mentions": count} for topic, count in trending]
 
+    def capture_artifact(self) -> Dict[str, Any]:
+        """Consistent view of the model state, as ``write_artifact`` arguments (models are swapped, never modified)"""
+        with self._state_lock:
+            return {
+                'kind': "sentiment_analyzer",
+                'metadata': {'training_data': list(self.training_data), 'categories': list(self.categories)},
+                'objects': {'model': self.model}
+            }
+
     def save_model(self, filepath: str):
-        """Save model to disk"""
-        model_data = {
-            'model': self.model,
-            'training_data': self.training_data,
-            'categories': self.categories
-        }
-        joblib.dump(model_data, filepath)
+        """Save model to disk as an artifact directory"""
+        write_artifact(filepath, **self.capture_artifact())
         print(f"Model saved to {filepath}")
 
-    def load_model(self, filepath: str):
-        """Load model from disk"""
-        model_data = joblib.load(filepath)
-        self.model = model_data['model']
-        self.training_data = model_data['training_data']
-        self.categories = model_data['categories']
+    def load_model(self, filepath: str, verify: bool = False):
+        """
+        Load model from disk
+
+        Args:
+            filepath: Artifact directory (or legacy .pkl file)
+            verify: Check the SHA-256 of every file before loading
+        """
+        if is_artifact(filepath):
+            artifact = ModelArtifact(filepath, kind="sentiment_analyzer", verify=verify)
+            model_data = {
+                'model': artifact.object('model'),
+                'training_data': [tuple(item) for item in artifact.metadata['training_data']],
+                'categories': artifact.metadata['categories']
+            }
+        else:
+            model_data = joblib.load(filepath)
+
+        with self._state_lock:
+            self.model = model_data['model']
+            self.training_data = model_data['training_data']
+            self.categories = model_data['categories']
+            self._on_model_changed()
         print(f"Model loaded from {filepath}")
 
 
@@ -312,4 +679,4 @@ if __name__ == "__main__":
     print(f"  Distribution: {batch_result['sentiment_distribution']}")
 
     # Save model
-    analyzer.save_model("models/sentiment_analyzer.pkl")
+    analyzer.save_model("models/sentiment_analyzer")
@@ -0,0 +1,97 @@
+"""
+Parallel Sentiment Workers
+Warm process pool that shards comment analysis and noun-phrase extraction
+across cores, so GIL-bound TextBlob work scales with the machine
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+# Analyzer living inside each worker process, set up by _init_worker
+_worker_analyzer = None
+
+
+def _init_worker(model, categories: List[str], emotion_lexicon, lexical_backend: str):
+    """Load the fitted pipeline and lexicons once per worker process"""
+    global _worker_analyzer
+    from .sentiment_analyzer import SentimentAnalyzer
+
+    _worker_analyzer = SentimentAnalyzer(cache_size=0, lexical_backend=lexical_backend)
+    _worker_analyzer.model = model
+    _worker_analyzer.categories = categories
+    _worker_analyzer.emotion_lexicon = emotion_lexicon
+
+
+def _warm_up(_: int) -> int:
+    """Run one analysis so lazy TextBlob/NLTK state is loaded before real work"""
+    _worker_analyzer._analyze_texts(["warm up"], ["general"])
+    return os.getpid()
+
+
+def _analyze_chunk(chunk: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    return _worker_analyzer._analyze_texts(chunk['texts'], chunk['categories'])
+
+
+def _extract_phrases_chunk(texts: List[str]) -> List[List[str]]:
+    return _worker_analyzer._noun_phrases(texts)
+
+
+class SentimentWorkerPool:
+    """Process pool of preloaded sentiment analyzers"""
+
+    def __init__(
+        self,
+        model,
+        categories: List[str],
+        emotion_lexicon,
+        lexical_backend: str = "textblob",
+        workers: Optional[int] = None,
+        chunk_size: int = 256
+    ):
+        """
+        Args:
+            model: Fitted sentiment pipeline (or its FastSentimentScorer)
+                copied into every worker
+            categories: Comment categories known to the analyzer
+            emotion_lexicon: EmotionLexicon copied into every worker
+            lexical_backend: Name of the polarity/noun-phrase backend
+            workers: Worker processes (defaults to CPU count)
+            chunk_size: Comments sent to a worker per task
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(model, categories, emotion_lexicon, lexical_backend)
+        )
+
+        # Start every worker now instead of on the first request
+        list(self._executor.map(_warm_up, range(self.workers)))
+
+    def _chunks(self, items: List[Any]) -> List[List[Any]]:
+        return [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+
+    def analyze(self, texts: List[str], categories: List[str]) -> List[Dict[str, Any]]:
+        """Analyze comments across the pool, preserving input order"""
+        chunks = [
+            {"texts": texts[i:i + self.chunk_size], "categories": categories[i:i + self.chunk_size]}
+            for i in range(0, len(texts), self.chunk_size)
+        ]
+
+        results = []
+        for chunk_results in self._executor.map(_analyze_chunk, chunks):
+            results.extend(chunk_results)
+        return results
+
+    def extract_phrases(self, texts: List[str]) -> List[List[str]]:
+        """Noun phrases of each text, extracted across the pool in input order"""
+        phrases = []
+        for chunk_phrases in self._executor.map(_extract_phrases_chunk, self._chunks(texts)):
+            phrases.extend(chunk_phrases)
+        return phrases
+
+    def close(self):
+        """Shut the worker processes down"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
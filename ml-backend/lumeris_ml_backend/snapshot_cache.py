@@ -0,0 +1,128 @@
+"""
+Backend Snapshot Cache
+On-disk copies of backend API payloads with their validators (ETag /
+Last-Modified), so fetches can be skipped while fresh, revalidated with
+conditional requests once stale, and served as a last good copy when the
+backend is down
+"""
+
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class SnapshotCache:
+    """Per-endpoint snapshots kept in memory and mirrored to a directory"""
+
+    def __init__(self, directory: str, ttl: float = 300.0):
+        """
+        Args:
+            directory: Where snapshots are stored (created if missing)
+            ttl: Seconds a snapshot is used without asking the backend
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        self.counters = {
+            "fresh_hits": 0,       # served without a request
+            "revalidated": 0,      # 304 Not Modified
+            "refreshed": 0,        # 200 with a new payload
+            "stale_fallbacks": 0,  # backend failed, last good snapshot served
+        }
+
+    def _paths(self, endpoint: str):
+        key = re.sub(r"[^A-Za-z0-9]+", "_", endpoint).strip("_")
+        base = os.path.join(self.directory, key)
+        return base + ".pkl", base + ".json"
+
+    def get(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot of an endpoint, loaded from disk on first access
+
+        Returns:
+            Dict with 'data', 'etag', 'last_modified' and 'fetched_at', or None
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is not None:
+                return entry
+
+            data_path, meta_path = self._paths(endpoint)
+            try:
+                with open(meta_path) as f:
+                    meta = json.load(f)
+                with open(data_path, "rb") as f:
+                    data = pickle.load(f)
+            except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+                return None
+
+            entry = {**meta, "data": data}
+            self._entries[endpoint] = entry
+            return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    def put(self, endpoint: str, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store a new payload and its validators"""
+        entry = {
+            "endpoint": endpoint,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "data": data
+        }
+        with self._lock:
+            self._entries[endpoint] = entry
+            self._write(endpoint, entry, write_data=True)
+
+    def touch(self, endpoint: str):
+        """Mark a snapshot as just confirmed unchanged"""
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is not None:
+                entry["fetched_at"] = time.time()
+                self._write(endpoint, entry, write_data=False)
+
+    def record(self, event: str):
+        """Count a cache outcome (one of ``counters``)"""
+        with self._lock:
+            self.counters[event] += 1
+
+    def _write(self, endpoint: str, entry: Dict[str, Any], write_data: bool):
+        """Persist atomically (temp file + rename), data before metadata"""
+        os.makedirs(self.directory, exist_ok=True)
+        data_path, meta_path = self._paths(endpoint)
+
+        if write_data:
+            with open(data_path + ".tmp", "wb") as f:
+                pickle.dump(entry["data"], f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(data_path + ".tmp", data_path)
+
+        meta = {key: value for key, value in entry.items() if key != "data"}
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.time()
+            return {
+                **self.counters,
+                "ttl": self.ttl,
+                "directory": self.directory,
+                "snapshots": {
+                    endpoint: {
+                        "age_seconds": round(now - entry["fetched_at"], 1),
+                        "etag": entry["etag"],
+                        "last_modified": entry["last_modified"]
+                    }
+                    for endpoint, entry in self._entries.items()
+                }
+            }
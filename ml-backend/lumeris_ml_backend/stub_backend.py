@@ -0,0 +1,311 @@
+"""
+Stub Backend
+Minimal stand-in for the Lumeris backend API that serves canned games, pools
+and users over keep-alive HTTP, with ETag / Last-Modified validators like
+Express and a sequence-numbered change log, for exercising the data fetchers
+locally
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from typing import Any, Dict, List, Optional
+
+# Same shapes as backend/src/data/mockData.js
+DEFAULT_GAMES = [
+    {"id": f"game_{i:03d}", "title": f"Game {i}", "genre": genre, "status": "Live",
+     "players": 1000 * i, "maxPlayers": 10000, "rewards": {"daily": 40 * i, "weekly": 200 * i},
+     "requirements": {"minLevel": i, "minBalance": 100 * i}}
+    for i, genre in enumerate(["Strategy", "RPG", "Action", "Card", "Racing"], start=1)
+]
+
+DEFAULT_POOLS = [
+    {"id": f"pool_{i:03d}", "name": pair.replace("/", "-"), "pair": pair, "tvl": 1_000_000 * i,
+     "volume24h": 150_000 * i, "apy": 5.0 + i, "fees": 0.3, "status": "active"}
+    for i, pair in enumerate(["ETH/USDC", "BTC/ETH", "LUM/USDC", "SOL/USDC", "MATIC/USDC",
+                              "LINK/ETH", "UNI/USDC", "AAVE/ETH"], start=1)
+]
+
+DEFAULT_USERS = [
+    {"id": f"user_{i:03d}", "username": f"player{i}", "level": 10 * i}
+    for i in range(1, 6)
+]
+
+_TRANSACTION_TYPES = ["game_reward", "swap", "stake", "nft_purchase", "liquidity_add"]
+
+
+def generate_transactions(n: int, n_users: int = 5) -> List[Dict[str, Any]]:
+    """Deterministic transactions, newest first, shaped like the backend's"""
+    start = time.mktime((2024, 1, 1, 0, 0, 0, 0, 0, 0))
+    return [
+        {
+            "id": f"tx_{i:07d}",
+            "type": _TRANSACTION_TYPES[i % len(_TRANSACTION_TYPES)],
+            "userId": f"user_{i % n_users + 1:03d}",
+            "amount": round((i * 37) % 1000 + 0.5, 2),
+            "status": "completed",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(start + (n - i) * 60)),
+            "metadata": {"poolId": f"pool_{i % 8 + 1:03d}"} if i % 5 in (1, 4) else {}
+        }
+        for i in range(n)
+    ]
+
+
+class StubBackend:
+    """Threaded HTTP server answering the backend endpoints the ML service reads"""
+
+    def __init__(
+        self,
+        games: Optional[List[Dict[str, Any]]] = None,
+        pools: Optional[List[Dict[str, Any]]] = None,
+        users: Optional[List[Dict[str, Any]]] = None,
+        transactions: Optional[List[Dict[str, Any]]] = None,
+        comments: Optional[List[Dict[str, Any]]] = None,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Args:
+            games: Games served at /api/gaming/games
+            pools: Pools served at /api/defi/pools
+            users: Users served at /api/user/users and, paginated, /api/user
+            transactions: Transactions served paginated at /api/user/transactions
+                and /api/user/{id}/transactions
+            comments: Labeled comments (only reachable through the change log)
+            latency: Seconds each response is delayed, to make concurrency visible
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.games = list(DEFAULT_GAMES if games is None else games)
+        self.pools = list(DEFAULT_POOLS if pools is None else pools)
+        self.users = list(DEFAULT_USERS if users is None else users)
+        self.transactions = generate_transactions(50) if transactions is None else transactions
+        self.comments = list(comments or [])
+
+        # Change log served at /api/sync/changes: {seq, collection, op, id, record}
+        self.changes: List[Dict[str, Any]] = []
+        self.seq = 0
+        self.latency = latency
+
+        self.request_count = 0
+        self.connection_count = 0
+        self.not_modified_count = 0
+        self.bytes_sent = 0
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def _collection(self, name: str) -> List[Dict[str, Any]]:
+        collections = {"games": self.games, "pools": self.pools, "users": self.users, "comments": self.comments}
+        if name not in collections:
+            raise ValueError(f"Unknown collection '{name}'")
+        return collections[name]
+
+    def _log(self, collection: str, op: str, record_id: str, record: Optional[Dict[str, Any]]):
+        self.seq += 1
+        self.changes.append({"seq": self.seq, "collection": collection, "op": op, "id": record_id, "record": record})
+        self.last_modified = formatdate(time.time(), usegmt=True)
+
+    def upsert(self, collection: str, record: Dict[str, Any]):
+        """Create or replace a record (by 'id') and log the change"""
+        with self._lock:
+            rows = self._collection(collection)
+            index = next((i for i, row in enumerate(rows) if row["id"] == record["id"]), None)
+            if index is None:
+                rows.append(record)
+            else:
+                rows[index] = record
+            self._log(collection, "upsert", record["id"], record)
+
+    def delete(self, collection: str, record_id: str):
+        """Remove a record and log the change"""
+        with self._lock:
+            rows = self._collection(collection)
+            rows[:] = [row for row in rows if row["id"] != record_id]
+            self._log(collection, "delete", record_id, None)
+
+    def _change_feed(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Changes after the ``since`` sequence number, oldest first"""
+        since = int(query.get("since", ["0"])[0])
+        limit = int(query.get("limit", ["1000"])[0])
+        with self._lock:
+            newer = [change for change in self.changes if change["seq"] > since]
+            latest = self.seq
+        page = newer[:limit]
+        return {
+            "success": True,
+            "data": page,
+            "count": len(page),
+            "latestSeq": latest,
+            "pagination": {"limit": limit, "since": since, "hasMore": len(newer) > limit}
+        }
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def _paginate(rows: List[Dict[str, Any]], query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Page of rows with the backend's limit/offset pagination block"""
+        limit = int(query.get("limit", ["50"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        page = rows[offset:offset + limit]
+        return {
+            "success": True,
+            "data": page,
+            "count": len(page),
+            "total": len(rows),
+            "pagination": {"limit": limit, "offset": offset, "hasMore": offset + limit < len(rows)}
+        }
+
+    def _route(self, target: str) -> Optional[Dict[str, Any]]:
+        """Response body for a request target, None if unknown"""
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+        query = parse_qs(url.query)
+
+        if path == "/api/sync/changes":
+            return self._change_feed(query)
+        if path == "/api/user":
+            return self._paginate(self.users, query)
+        if path == "/api/user/transactions":
+            return self._paginate(self.transactions, query)
+        match = re.fullmatch(r"/api/user/([^/]+)/transactions", path)
+        if match:
+            return self._paginate([tx for tx in self.transactions if tx["userId"] == match.group(1)], query)
+
+        data = self._route_data(path)
+        if data is None:
+            return None
+        body = {"success": True, "data": data}
+        if isinstance(data, list):
+            body["count"] = len(data)
+        return body
+
+    def _route_data(self, path: str) -> Optional[Any]:
+        """Payload of an unpaginated path, None if unknown"""
+        if path == "/api/gaming/games":
+            return self.games
+        if path == "/api/defi/pools":
+            return self.pools
+        if path == "/api/user/users":
+            return self.users
+
+        match = re.fullmatch(r"/api/gaming/games/([^/]+)", path)
+        if match:
+            return next((game for game in self.games if game["id"] == match.group(1)), None)
+
+        match = re.fullmatch(r"/api/defi/pools/([^/]+)(/analytics)?", path)
+        if match:
+            pool = next((pool for pool in self.pools if pool["id"] == match.group(1)), None)
+            if pool is None or not match.group(2):
+                return pool
+            return {
+                "poolId": pool["id"],
+                "tvl": pool["tvl"],
+                "volume24h": pool["volume24h"],
+                "apy": pool["apy"],
+                "feesEarned24h": pool["volume24h"] * pool["fees"] / 100
+            }
+        return None
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connection_count += 1
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.request_count += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                if self.path == "/health":
+                    status, body = 200, {"status": "OK"}
+                else:
+                    body = stub._route(self.path)
+                    status = 200
+                    if body is None:
+                        status, body = 404, {"success": False, "error": "Not found"}
+
+                payload = json.dumps(body).encode()
+                etag = f'W/"{hashlib.sha1(payload).hexdigest()}"'
+                if status == 200 and self._not_modified(etag):
+                    with stub._lock:
+                        stub.not_modified_count += 1
+                    status, payload = 304, b""
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", stub.last_modified)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client went away (e.g. a cancelled prefetch)
+                    return
+                with stub._lock:
+                    stub.bytes_sent += len(payload)
+
+            def _not_modified(self, etag: str) -> bool:
+                # If-None-Match takes precedence over If-Modified-Since
+                if_none_match = self.headers.get("If-None-Match")
+                if if_none_match is not None:
+                    return etag in [tag.strip() for tag in if_none_match.split(",")]
+                return self.headers.get("If-Modified-Since") == stub.last_modified
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubBackend":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-backend", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubBackend":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+# Serve the stub backend until interrupted
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stub Lumeris backend")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with StubBackend(latency=args.latency, port=args.port) as stub:
+        print(f"Stub backend listening on {stub.url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,285 @@
+"""
+Streaming Trending Topics
+Ingests comments continuously and keeps approximate top-k phrase counts per
+sliding time window and category in bounded-memory Space-Saving sketches
+"""
+
+import heapq
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+# Window name -> (bucket length in seconds, number of buckets)
+DEFAULT_WINDOWS = {
+    "1h": (60, 60),
+    "24h": (3600, 24),
+}
+
+ALL_CATEGORIES = "all"
+
+# Comments in other categories are counted under FALLBACK_CATEGORY, so the
+# number of sketches does not depend on client input
+DEFAULT_CATEGORIES = ("gaming", "defi", "nft", "governance", "general")
+FALLBACK_CATEGORY = "general"
+
+# Largest top-k a query can ask for
+MAX_TOP_K = 100
+
+
+class SpaceSaving:
+    """Space-Saving heavy-hitter sketch holding at most ``capacity`` items"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+        # Min-heap of (count, item) with lazy deletion of outdated entries
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, item: str, count: int = 1):
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            # Replace the current minimum; its count becomes the new item's error bound
+            min_count, min_item = self._pop_min()
+            del self.counts[min_item]
+            del self.errors[min_item]
+            self.counts[item] = min_count + count
+            self.errors[item] = min_count
+
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i) for i, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[int, str]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+
+class _Window:
+    """Ring of time buckets, each holding one sketch per category"""
+
+    def __init__(self, bucket_seconds: int, n_buckets: int):
+        self.bucket_seconds = bucket_seconds
+        self.n_buckets = n_buckets
+        self.bucket_ids = [-1] * n_buckets
+        self.sketches: List[Dict[str, SpaceSaving]] = [{} for _ in range(n_buckets)]
+
+    def slot(self, timestamp: float, now: float) -> Optional[int]:
+        """Ring slot for a timestamp, recycling expired buckets (None if too old)"""
+        bucket_id = int(timestamp // self.bucket_seconds)
+        if bucket_id <= int(now // self.bucket_seconds) - self.n_buckets:
+            return None
+
+        slot = bucket_id % self.n_buckets
+        if self.bucket_ids[slot] == bucket_id:
+            return slot
+        if self.bucket_ids[slot] > bucket_id:
+            return None
+
+        self.bucket_ids[slot] = bucket_id
+        self.sketches[slot] = {}
+        return slot
+
+    def live_slots(self, now: float) -> List[int]:
+        current = int(now // self.bucket_seconds)
+        return [
+            slot for slot, bucket_id in enumerate(self.bucket_ids)
+            if current - self.n_buckets < bucket_id <= current
+        ]
+
+
+class TrendingTopicsEngine:
+    """Continuously updated trending phrases per time window and category"""
+
+    def __init__(
+        self,
+        phrase_extractor: Callable[[List[str]], List[List[str]]],
+        capacity: int = 200,
+        windows: Optional[Dict[str, Tuple[int, int]]] = None,
+        query_ttl: float = 1.0,
+        categories: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            phrase_extractor: Maps comments to their phrases
+                (e.g. ``SentimentAnalyzer.extract_phrases``)
+            capacity: Phrases tracked per bucket and category; memory is
+                bounded by capacity x buckets x categories
+            windows: Window name -> (bucket seconds, bucket count)
+            query_ttl: Seconds a computed top-k answer is reused for, so
+                answers may lag ingestion by up to this long
+            categories: Known comment categories; others are counted as
+                FALLBACK_CATEGORY
+        """
+        self.phrase_extractor = phrase_extractor
+        self.capacity = capacity
+        self.windows = {
+            name: _Window(bucket_seconds, n_buckets)
+            for name, (bucket_seconds, n_buckets) in (windows or DEFAULT_WINDOWS).items()
+        }
+        self.query_ttl = query_ttl
+        self.categories = set(categories or DEFAULT_CATEGORIES) | {FALLBACK_CATEGORY}
+
+        self.ingested = 0
+        self.dropped = 0
+        # (window, category) -> (computed at, top MAX_TOP_K phrases); bounded by windows x categories
+        self._query_cache: Dict[tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _to_epoch(timestamp: Union[None, float, int, str, datetime], now: float) -> float:
+        """Epoch seconds of a comment timestamp (missing -> now, naive -> UTC); ValueError if invalid"""
+        if timestamp is None:
+            return now
+        if isinstance(timestamp, (int, float)) and not isinstance(timestamp, bool):
+            if not math.isfinite(timestamp):
+                raise ValueError(f"timestamp {timestamp} is not finite")
+            return float(timestamp)
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        if not isinstance(timestamp, datetime):
+            raise ValueError(f"unsupported timestamp type {type(timestamp).__name__}")
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+
+    def ingest(self, comments: List[Dict[str, Any]]) -> int:
+        """
+        Add comments to the sketches
+
+        Args:
+            comments: Dicts with 'text' and optional 'category' and
+                'timestamp' (epoch seconds or ISO string, defaults to now;
+                naive values are UTC, future timestamps count as now)
+
+        Returns:
+            Number of comments counted (older ones fall outside every window)
+
+        Raises:
+            ValueError: If any timestamp is invalid; nothing is counted then,
+                so the batch can be corrected and resent as a whole
+        """
+
+        now = time.time()
+        epochs, invalid = [], []
+        for i, comment in enumerate(comments):
+            try:
+                epochs.append(self._to_epoch(comment.get('timestamp'), now))
+            except (TypeError, ValueError) as e:
+                invalid.append(f"comment {i}: {e}")
+        if invalid:
+            raise ValueError(f"Invalid timestamps, no comments ingested: {'; '.join(invalid[:5])}"
+                             + (f" (and {len(invalid) - 5} more)" if len(invalid) > 5 else ""))
+
+        texts = [comment.get('text', '') for comment in comments]
+        phrases = self.phrase_extractor(texts)
+
+        counted = 0
+        with self._lock:
+            for comment, epoch, comment_phrases in zip(comments, epochs, phrases):
+                # A future timestamp would claim ring slots that current comments need
+                timestamp = min(epoch, now)
+                category = comment.get('category')
+                if category not in self.categories:
+                    category = FALLBACK_CATEGORY
+                categories = (category, ALL_CATEGORIES)
+
+                in_window = False
+                for window in self.windows.values():
+                    slot = window.slot(timestamp, now)
+                    if slot is None:
+                        continue
+                    in_window = True
+                    for category in categories:
+                        sketch = window.sketches[slot].get(category)
+                        if sketch is None:
+                            sketch = window.sketches[slot][category] = SpaceSaving(self.capacity)
+                        for phrase in comment_phrases:
+                            sketch.add(phrase)
+
+                counted += int(in_window)
+
+            self.ingested += counted
+            self.dropped += len(comments) - counted
+
+        return counted
+
+    def top(self, window: str = "1h", category: str = ALL_CATEGORIES, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Trending phrases in a window
+
+        Merges at most buckets x capacity counters, independent of how many
+        comments were ingested, and reuses the answer for ``query_ttl`` seconds.
+
+        Args:
+            window: One of the configured window names
+            category: Known comment category, or "all"
+            k: Number of phrases to return (1 to MAX_TOP_K)
+
+        Returns:
+            Phrases with estimated mentions and the maximum overestimate
+        """
+
+        if window not in self.windows:
+            raise ValueError(f"Unknown window '{window}', expected one of {list(self.windows)}")
+        if category != ALL_CATEGORIES and category not in self.categories:
+            raise ValueError(f"Unknown category '{category}', expected 'all' or one of {sorted(self.categories)}")
+        if not 1 <= k <= MAX_TOP_K:
+            raise ValueError(f"k must be between 1 and {MAX_TOP_K}")
+
+        now = time.time()
+        key = (window, category)
+        cached = self._query_cache.get(key)
+        if cached is not None and now - cached[0] < self.query_ttl:
+            return cached[1][:k]
+
+        with self._lock:
+            ring = self.windows[window]
+            counts: Dict[str, int] = {}
+            errors: Dict[str, int] = {}
+            for slot in ring.live_slots(now):
+                sketch = ring.sketches[slot].get(category)
+                if sketch is None:
+                    continue
+                for phrase, count in sketch.counts.items():
+                    counts[phrase] = counts.get(phrase, 0) + count
+                    errors[phrase] = errors.get(phrase, 0) + sketch.errors[phrase]
+
+            trending = heapq.nlargest(MAX_TOP_K, counts.items(), key=lambda x: x[1])
+            result = [
+                {"topic": topic, "mentions": count, "max_error": errors[topic]}
+                for topic, count in trending
+            ]
+            self._query_cache[key] = (now, result)
+
+        return result[:k]
+
+    def stats(self) -> Dict[str, Any]:
+        """Ingestion counters and the number of tracked counters"""
+        with self._lock:
+            tracked = sum(
+                len(sketch.counts)
+                for ring in self.windows.values()
+                for bucket in ring.sketches
+                for sketch in bucket.values()
+            )
+            return {
+                "ingested": self.ingested,
+                "dropped": self.dropped,
+                "tracked_counters": tracked,
+                "capacity_per_bucket": self.capacity,
+                "windows": {
+                    name: {"bucket_seconds": ring.bucket_seconds, "buckets": ring.n_buckets}
+                    for name, ring in self.windows.items()
+                }
+            }
@@ -0,0 +1,272 @@
+import asyncio
+import gc
+import time
+import warnings
+
+import pytest
+
+from lumeris_ml_backend.bootstrap import bootstrap_models
+from lumeris_ml_backend.data_fetcher import AsyncBackendDataFetcher, BackendDataFetcher, CircuitBreaker
+from lumeris_ml_backend.json_stream import StreamingArrayParser
+from lumeris_ml_backend.stub_backend import DEFAULT_GAMES, DEFAULT_POOLS, StubBackend, generate_transactions
+
+LATENCY = 0.1
+
+
+@pytest.fixture
+def stub():
+    pools = [{**DEFAULT_POOLS[0], "id": f"pool_{i:03d}"} for i in range(8)]
+    with StubBackend(pools=pools, latency=LATENCY) as backend:
+        yield backend
+
+
+@pytest.fixture
+def down_url():
+    """URL of a backend that refuses connections"""
+    backend = StubBackend().start()
+    url = backend.url
+    backend.stop()
+    return url
+
+
+def _fast_retries(**options):
+    return {"retries": 2, "backoff_base": 0.01, "backoff_max": 0.02, "connect_timeout": 0.5, **options}
+
+
+# ---- concurrency and connection reuse (user-041) -----------------------------
+
+def test_pool_analytics_fan_out_runs_concurrently(stub):
+    async def scenario():
+        async with AsyncBackendDataFetcher(stub.url) as fetcher:
+            start = time.perf_counter()
+            analytics = await fetcher.get_pools_analytics([pool["id"] for pool in stub.pools])
+            return analytics, time.perf_counter() - start
+
+    analytics, elapsed = asyncio.run(scenario())
+
+    assert len(analytics) == 8 and all(value is not None for value in analytics.values())
+    assert elapsed < 8 * LATENCY / 2
+
+
+def test_startup_data_is_fetched_concurrently(stub):
+    fetcher = BackendDataFetcher(stub.url)
+    start = time.perf_counter()
+    data = fetcher.fetch_startup_data()
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+
+    assert len(data["games"]) == len(DEFAULT_GAMES)
+    assert len(data["pools"]) == 8
+    assert data["timed_out"] == []
+    assert elapsed < 2 * LATENCY
+
+
+def test_connections_are_reused(stub):
+    async def scenario():
+        async with AsyncBackendDataFetcher(stub.url) as fetcher:
+            for _ in range(5):
+                await fetcher.get_games()
+            sequential_connections = stub.connection_count
+
+            pool_ids = [pool["id"] for pool in stub.pools]
+            await fetcher.get_pools_analytics(pool_ids)
+            fan_out_connections = stub.connection_count
+            await fetcher.get_pools_analytics(pool_ids)
+            return sequential_connections, fan_out_connections
+
+    sequential_connections, fan_out_connections = asyncio.run(scenario())
+
+    assert sequential_connections == 1
+    assert fan_out_connections <= 8
+    # The second fan-out runs entirely on kept-alive connections
+    assert stub.connection_count == fan_out_connections
+    assert stub.request_count == 5 + 16
+
+
+def test_sync_fetcher_keeps_connections_between_calls(stub):
+    fetcher = BackendDataFetcher(stub.url)
+    for _ in range(3):
+        assert fetcher.get_defi_pool_by_id("pool_001")["id"] == "pool_001"
+    fetcher.close()
+
+    assert stub.connection_count == 1
+
+
+def test_each_event_loop_closes_its_own_client(stub):
+    fetcher = AsyncBackendDataFetcher(stub.url)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+        for _ in range(3):
+            asyncio.run(fetcher.get_games())
+        gc.collect()
+
+    assert stub.connection_count == 3
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+
+def test_aclose_closes_clients_on_other_loops(stub):
+    fetcher = BackendDataFetcher(stub.url)
+    fetcher.get_games()
+    # Closed from the caller's loop, not the background loop that owns the client
+    asyncio.run(fetcher.async_fetcher.aclose())
+    fetcher.get_games()
+    fetcher.close()
+
+    assert stub.connection_count == 2
+
+
+# ---- backend down, empty collections and fail-fast (user-041, user-042) -------
+
+def test_empty_collections_and_unknown_ids():
+    with StubBackend(games=[], pools=[]) as backend:
+        fetcher = BackendDataFetcher(backend.url)
+        assert fetcher.get_games() == []
+        assert fetcher.get_defi_pools() == []
+        assert fetcher.get_game_by_id("missing") is None
+        fetcher.close()
+
+
+def test_backend_down_returns_empty_lists(down_url):
+    fetcher = BackendDataFetcher(down_url, **_fast_retries())
+    assert fetcher.get_games() == []
+    assert fetcher.get_game_by_id("game-1") is None
+    assert fetcher.fetch_startup_data() == {"games": [], "pools": [], "timed_out": []}
+    fetcher.close()
+
+
+def test_circuit_opens_and_fails_fast(down_url):
+    async def scenario():
+        async with AsyncBackendDataFetcher(down_url, **_fast_retries()) as fetcher:
+            assert await fetcher.get_games() == []
+            assert fetcher.circuit_breaker.state == CircuitBreaker.OPEN
+
+            start = time.perf_counter()
+            assert await fetcher.get_defi_pools() == []
+            return time.perf_counter() - start, fetcher.circuit_breaker.stats()
+
+    elapsed, stats = asyncio.run(scenario())
+
+    assert elapsed < 0.01
+    assert stats["rejected"] >= 1
+
+
+def test_circuit_breaker_half_open_probe():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()          # the probe
+    assert not breaker.allow()      # only one probe at a time
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+
+class _FakeModel:
+    def __init__(self):
+        self.received = "not called"
+
+    def initialize_with_mock_data(self, backend_data=None):
+        self.received = backend_data
+
+
+def test_bootstrap_falls_back_within_the_deadline(down_url):
+    gaming, sentiment, defi = _FakeModel(), _FakeModel(), _FakeModel()
+
+    async def scenario():
+        async with AsyncBackendDataFetcher(down_url, **_fast_retries()) as fetcher:
+            return await bootstrap_models(fetcher, gaming, sentiment, defi, fetch_timeout=1.0)
+
+    report = asyncio.run(scenario())
+
+    assert report["backend_available"] is False
+    assert report["fetch_seconds"] < 1.0
+    assert report["circuit"]["state"] == CircuitBreaker.OPEN
+    # An empty list tells the models to use their mock data
+    assert gaming.received == [] and defi.received == []
+
+
+# ---- snapshots and conditional revalidation (user-043) -----------------------
+
+def test_snapshots_revalidate_with_304_and_survive_an_outage(tmp_path):
+    with StubBackend() as backend:
+        fetcher = BackendDataFetcher(backend.url, snapshot_dir=str(tmp_path), snapshot_ttl=0, **_fast_retries())
+        games = fetcher.get_games()
+        sent = backend.bytes_sent
+
+        assert fetcher.get_games() == games
+        assert backend.not_modified_count == 1
+        assert backend.bytes_sent == sent
+
+        backend.upsert("games", {**DEFAULT_GAMES[0], "name": "Renamed"})
+        assert fetcher.get_games()[0]["name"] == "Renamed"
+        fetcher.close()
+
+    # A new process with the backend down serves the last good snapshot from disk
+    fetcher = BackendDataFetcher(backend.url, snapshot_dir=str(tmp_path), snapshot_ttl=0, **_fast_retries())
+    assert fetcher.get_games()[0]["name"] == "Renamed"
+    stats = fetcher.async_fetcher.snapshots.stats()
+    fetcher.close()
+
+    assert stats["stale_fallbacks"] == 1
+
+
+def test_fresh_snapshots_skip_the_network(tmp_path):
+    with StubBackend() as backend:
+        fetcher = BackendDataFetcher(backend.url, snapshot_dir=str(tmp_path), snapshot_ttl=300)
+        fetcher.get_defi_pools()
+        fetcher.get_defi_pools()
+        fetcher.close()
+
+        assert backend.request_count == 1
+
+
+# ---- pagination and incremental parsing (user-044) ---------------------------
+
+def test_transactions_stream_page_by_page():
+    transactions = generate_transactions(95)
+    with StubBackend(transactions=transactions) as backend:
+        fetcher = BackendDataFetcher(backend.url)
+        streamed = list(fetcher.iter_transactions(page_size=20))
+        frames = list(fetcher.iter_transaction_frames(page_size=20, columns=["userId", "amount"]))
+        user_rows = list(fetcher.iter_transactions(user_id=transactions[0]["userId"], page_size=7))
+        fetcher.close()
+
+        assert streamed == transactions
+        assert backend.request_count == 5 + 5 + -(-len(user_rows) // 7)
+
+    assert [len(frame) for frame in frames] == [20, 20, 20, 20, 15]
+    assert list(frames[0].columns) == ["userId", "amount"]
+    assert user_rows == [tx for tx in transactions if tx["userId"] == transactions[0]["userId"]]
+
+
+def test_streaming_parser_handles_arbitrary_chunk_boundaries():
+    payload = b'{"success": true, "data": [{"a": "x,]}"}, {"b": [1, 2, {"c": null}]}, 3], "count": 3}'
+    for chunk_size in (1, 2, 7, len(payload)):
+        parser = StreamingArrayParser("data")
+        rows = []
+        for i in range(0, len(payload), chunk_size):
+            rows.extend(parser.feed(payload[i:i + chunk_size]))
+        rows.extend(parser.close())
+
+        assert rows == [{"a": "x,]}"}, {"b": [1, 2, {"c": None}]}, 3]
+        assert parser.meta == {"success": True, "count": 3}
+
+
+def test_change_log_pages():
+    with StubBackend() as backend:
+        for i in range(5):
+            backend.upsert("games", {**DEFAULT_GAMES[0], "id": f"new-{i}"})
+        backend.delete("games", "new-0")
+
+        fetcher = BackendDataFetcher(backend.url)
+        first = fetcher.fetch_changes(0, limit=4)
+        rest = fetcher.fetch_changes(first["changes"][-1]["seq"], limit=4)
+        fetcher.close()
+
+    assert [change["seq"] for change in first["changes"]] == [1, 2, 3, 4]
+    assert first["has_more"] and not rest["has_more"]
+    assert rest["changes"][-1]["op"] == "delete"
+    assert first["latest_seq"] == rest["latest_seq"] == 6
@@ -0,0 +1,23 @@
+from lumeris_ml_backend.forecast_engine import MonteCarloForecaster
+
+SPEC = {"key": "pool_001", "price": 100.0, "momentum": 0.01, "volatility": 0.03}
+
+
+def test_same_seed_gives_same_forecast_regardless_of_load():
+    warm = MonteCarloForecaster(n_paths=1000)
+    # A large batch first, as a busy server would have run
+    warm.forecast_batch([{**SPEC, "key": f"pool_{i}"} for i in range(50)], days=30)
+    warmed = warm.forecast_batch([SPEC], days=7)[0]
+
+    fresh = MonteCarloForecaster(n_paths=1000).forecast_batch([SPEC], days=7)[0]
+
+    assert warm.last_run["paths_per_pool"] == 1000
+    assert warmed == fresh
+
+
+def test_latency_budget_is_opt_in():
+    forecaster = MonteCarloForecaster(n_paths=5000, min_paths=100, latency_budget_ms=1e-6)
+    forecaster.forecast_batch([SPEC], days=7)
+    forecaster.forecast_batch([SPEC], days=7)
+
+    assert forecaster.last_run["paths_per_pool"] == 100
@@ -0,0 +1,36 @@
+import threading
+
+import pandas as pd
+
+from lumeris_ml_backend.defi_predictor import DeFiPredictor
+from lumeris_ml_backend.sentiment_analyzer import SentimentAnalyzer
+
+
+def _blocked_while_locked(model, mutate) -> bool:
+    """Whether ``mutate`` waits while another thread holds the model's state lock (as a snapshot capture does)"""
+    done = threading.Event()
+    with model._state_lock:
+        worker = threading.Thread(target=lambda: (mutate(), done.set()))
+        worker.start()
+        blocked = not done.wait(0.3)
+    worker.join(10)
+    return blocked and done.is_set()
+
+
+def test_append_history_waits_for_snapshot_capture():
+    predictor = DeFiPredictor(n_jobs=1)
+    predictor.initialize_with_mock_data()
+    latest = predictor.get_history(last_days=1)
+    ticks = latest.assign(date=latest['date'] + pd.Timedelta(days=1))
+
+    assert _blocked_while_locked(predictor, lambda: predictor.append_history(ticks))
+    assert set(predictor.data_versions) == set(ticks['pool_id'])
+
+
+def test_model_swaps_wait_for_snapshot_capture():
+    analyzer = SentimentAnalyzer(lexical_backend="fast")
+    analyzer.initialize_with_mock_data()
+    model = analyzer.model
+
+    assert _blocked_while_locked(analyzer, analyzer._train_model)
+    assert analyzer.model is not model and analyzer.fast_scorer is not None
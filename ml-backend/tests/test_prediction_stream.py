@@ -0,0 +1,70 @@
+import asyncio
+
+from lumeris_ml_backend.prediction_stream import PredictionBroadcaster
+
+
+class FakePredictor:
+    """Predictor stand-in whose predictions are the per-pool update count"""
+
+    def __init__(self, pool_ids):
+        self.pools = [{"id": pool_id} for pool_id in pool_ids]
+        self.updates = {pool_id: 0 for pool_id in pool_ids}
+        self.listeners = []
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def predict_pools(self, pool_ids, days_ahead=7):
+        return {pool_id: {"pool_id": pool_id, "update": self.updates[pool_id]} for pool_id in pool_ids}
+
+    def change(self, pool_ids):
+        for pool_id in pool_ids:
+            self.updates[pool_id] += 1
+        for callback in self.listeners:
+            callback(set(pool_ids))
+
+    def remove(self, pool_id):
+        self.pools = [pool for pool in self.pools if pool["id"] != pool_id]
+        for callback in self.listeners:
+            callback({pool_id})
+
+
+async def _settle(broadcaster, version):
+    for _ in range(200):
+        if broadcaster.version >= version:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("broadcaster did not publish")
+
+
+def test_slow_subscriber_gets_merged_updates_instead_of_losing_them():
+    async def scenario():
+        predictor = FakePredictor(["a", "b", "c"])
+        broadcaster = PredictionBroadcaster(predictor)
+        broadcaster.start()
+        await _settle(broadcaster, 1)
+
+        subscription = broadcaster.subscribe()
+        initial = await subscription.next(timeout=1)
+        assert set(initial["predictions"]) == {"a", "b", "c"}
+
+        # Many updates arrive while the client is not reading
+        predictor.change(["a"])
+        await _settle(broadcaster, 2)
+        for i in range(30):
+            predictor.change(["b"])
+            await _settle(broadcaster, 3 + i)
+        predictor.remove("c")
+        await _settle(broadcaster, 33)
+
+        message = await subscription.next(timeout=1)
+        await broadcaster.stop()
+        return message, subscription
+
+    message, subscription = asyncio.run(scenario())
+    assert message["predictions"]["a"]["update"] == 1
+    assert message["predictions"]["b"]["update"] == 30
+    assert message["removed"] == ["c"]
+    assert message["version"] == 33
+    assert subscription.merged == 31
+    assert subscription.pending is None
@@ -0,0 +1,26 @@
+from lumeris_ml_backend.sentiment_aggregates import SentimentAggregateStore
+
+
+def test_unknown_categories_do_not_grow_the_rollups():
+    store = SentimentAggregateStore(categories=["gaming", "defi", "general"])
+    shapes = {name: rollup.counts.shape for name, rollup in store.rollups.items()}
+
+    store.ingest([
+        {"sentiment": "positive", "polarity": 0.5, "category": f"free-form-{i}"}
+        for i in range(50)
+    ])
+    store.ingest([{"sentiment": "negative", "polarity": -0.5, "category": "defi"}])
+
+    assert {name: rollup.counts.shape for name, rollup in store.rollups.items()} == shapes
+    assert store.categories == ["gaming", "defi", "general"]
+
+    summary = store.query("1m", buckets=5)
+    assert summary["category_breakdown"]["general"]["positive"] == 50
+    assert summary["category_breakdown"]["defi"]["negative"] == 1
+    assert store.query("1m", category="free-form-1")["total_comments"] == 0
+
+
+def test_fallback_category_is_always_tracked():
+    store = SentimentAggregateStore(categories=["gaming"])
+    assert store.categories == ["gaming", "general"]
+    assert store.ingest([{"sentiment": "neutral", "polarity": 0.0, "category": "nft"}]) == 1
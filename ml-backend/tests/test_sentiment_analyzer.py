@@ -0,0 +1,60 @@
+from lumeris_ml_backend.emotion_lexicon import DEFAULT_LEXICON_PATH
+from lumeris_ml_backend.sentiment_analyzer import SentimentAnalyzer
+
+TEXTS = [
+    "Lost money in this pool, bad investment",
+    "Love the DeFi pools, great APY and easy to use",
+    "Platform is functional but could be better",
+]
+
+
+def _trained_analyzer():
+    analyzer = SentimentAnalyzer(lexical_backend="fast")
+    analyzer.initialize_with_mock_data()
+    return analyzer
+
+
+def test_loaded_fast_scorer_survives_lexicon_and_backend_changes(tmp_path):
+    trained = _trained_analyzer()
+    expected = [trained.analyze_comment(text, "defi")["sentiment"] for text in TEXTS]
+
+    path = str(tmp_path / "scorer.npz")
+    trained.export_fast_scorer(path)
+
+    analyzer = SentimentAnalyzer(lexical_backend="fast")
+    analyzer.load_fast_scorer(path)
+    analyzer.load_emotion_lexicon(DEFAULT_LEXICON_PATH)
+    analyzer.set_lexical_backend("fast")
+
+    assert analyzer.fast_scorer is not None
+    assert [analyzer.analyze_comment(text, "defi")["sentiment"] for text in TEXTS] == expected
+
+
+def test_lexicon_change_invalidates_cached_results():
+    analyzer = _trained_analyzer()
+    analyzer.analyze_comment(TEXTS[0], "defi")
+    version = analyzer.model_version
+
+    analyzer.load_emotion_lexicon(DEFAULT_LEXICON_PATH)
+
+    assert analyzer.model_version == version + 1
+    assert len(analyzer.result_cache) == 0
+
+
+def test_cached_results_are_not_shared_with_callers():
+    analyzer = _trained_analyzer()
+    text = "Love the DeFi pools, great APY and easy to use"
+    first = analyzer.analyze_comment(text, "defi")
+    expected = analyzer.analyze_comment(text, "defi")
+    expected_emotions, expected_phrases = dict(expected["emotions"]), list(expected["key_phrases"])
+
+    first["emotions"]["tampered"] = 1.0
+    first["key_phrases"].append("tampered")
+    batch = analyzer.analyze_comments([text, text], ["defi", "defi"])
+    batch[0]["emotions"]["tampered"] = 1.0
+
+    again = analyzer.analyze_comment(text, "defi")
+    assert again["emotions"] == expected_emotions
+    assert again["key_phrases"] == expected_phrases
+    assert batch[1]["emotions"] == expected_emotions
+    assert analyzer.get_cache_stats()["results"]["hits"] >= 3
@@ -0,0 +1,69 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from lumeris_ml_backend.trending import MAX_TOP_K, TrendingTopicsEngine
+
+
+def _engine():
+    return TrendingTopicsEngine(
+        phrase_extractor=lambda texts: [text.split() for text in texts],
+        query_ttl=0.0
+    )
+
+
+def test_future_timestamp_does_not_block_current_comments():
+    engine = _engine()
+    engine.ingest([{"text": "rugpull", "timestamp": time.time() + 100 * 3600}])
+    engine.ingest([{"text": "airdrop"}])
+
+    topics = [entry["topic"] for entry in engine.top("1h")]
+    assert "airdrop" in topics
+    assert "rugpull" in topics
+
+
+def test_unknown_categories_are_counted_as_general():
+    engine = _engine()
+    engine.ingest([{"text": "moon", "category": f"spam-{i}"} for i in range(100)])
+
+    assert engine.top("1h", category="general") == [{"topic": "moon", "mentions": 100, "max_error": 0}]
+    assert len(engine.windows["1h"].sketches[engine.windows["1h"].live_slots(time.time())[0]]) == 2
+
+
+def test_query_validation_and_bounded_cache():
+    engine = _engine()
+    engine.ingest([{"text": "a b c", "category": "defi"}])
+
+    with pytest.raises(ValueError):
+        engine.top("1h", category="not-a-category")
+    with pytest.raises(ValueError):
+        engine.top("1h", k=MAX_TOP_K + 1)
+    with pytest.raises(ValueError):
+        engine.top("1h", k=0)
+
+    for k in range(1, MAX_TOP_K + 1):
+        assert len(engine.top("1h", category="defi", k=k)) == min(k, 3)
+    assert len(engine._query_cache) == 1
+
+
+def test_invalid_timestamp_rejects_the_whole_batch():
+    engine = _engine()
+    with pytest.raises(ValueError, match="comment 1"):
+        engine.ingest([
+            {"text": "airdrop"},
+            {"text": "rugpull", "timestamp": "not-a-date"},
+            {"text": "bridge", "timestamp": float("nan")},
+        ])
+
+    assert engine.top("1h") == []
+    assert engine.ingested == 0
+
+
+def test_naive_timestamps_are_utc():
+    engine = _engine()
+    aware = datetime.now(timezone.utc) - timedelta(minutes=5)
+    naive = aware.replace(tzinfo=None)
+
+    assert engine._to_epoch(naive.isoformat(), 0.0) == engine._to_epoch(aware.isoformat(), 0.0)
+    assert engine._to_epoch(naive, 0.0) == aware.timestamp()